@@ -0,0 +1,128 @@
+"""Compare the bytes read from the database by a critiques query that
+doesn't select annotations, loading every field and only the selected
+fields
+
+Usage: make benchmark-critique-annotations
+"""
+import argparse
+from unittest import mock
+
+from utils import setup_django
+from utils import stopwatch
+
+
+QUERY = '{ critiques { id summary submitted resume { id name } } }'
+
+
+def _get_row_bytes(rows):
+    return sum(
+        len(str(value).encode())
+        for row in rows
+        for value in row
+        if value is not None
+    )
+
+
+def _create_critiques(n_critiques, annotations_kb):
+    from rezq.models import MatchedCritique
+    from rezq.models import Resume
+    from rezq.models import User
+
+    critiquer = User.objects.create_user(email='critiquer@rezq.io')
+    uploader = User.objects.create_user(email='uploader@rezq.io')
+    annotations = '[{"comment": "' + 'x' * (annotations_kb * 1024) + '"}]'
+
+    for i in range(n_critiques):
+        resume = Resume.objects.create(
+            uploader=uploader, name=f'resume{i}', industries='SOFT',
+        )
+        MatchedCritique.objects.create(
+            resume=resume,
+            critiquer=critiquer,
+            summary=f'critique{i}',
+            annotations=annotations,
+        )
+
+    return critiquer
+
+
+def _measure(user, repeats):
+    """
+    :return: ms per request, and bytes read per request
+    :rtype: tuple
+    """
+    from django.db.backends.utils import CursorWrapper
+    from django.test import RequestFactory
+    from rezq.api.v1.schema import private_schema
+
+    read = []
+
+    def fetchmany(self, *args):
+        rows = self.cursor.fetchmany(*args)
+        read.append(_get_row_bytes(rows))
+        return rows
+
+    def fetchone(self):
+        row = self.cursor.fetchone()
+        read.append(_get_row_bytes([row] if row else []))
+        return row
+
+    def fetchall(self):
+        rows = self.cursor.fetchall()
+        read.append(_get_row_bytes(rows))
+        return rows
+
+    with mock.patch.object(
+        CursorWrapper, 'fetchmany', fetchmany, create=True,
+    ), mock.patch.object(
+        CursorWrapper, 'fetchone', fetchone, create=True,
+    ), mock.patch.object(
+        CursorWrapper, 'fetchall', fetchall, create=True,
+    ), stopwatch() as elapsed:
+        for _ in range(repeats):
+            request = RequestFactory().post('/')
+            request.user = user
+            result = private_schema.execute(QUERY, context=request)
+            assert not result.errors, result.errors
+
+    return elapsed['seconds'] * 1000 / repeats, sum(read) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--critiques', type=int, default=50)
+    parser.add_argument('--annotations-kb', type=int, default=64)
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db import connection
+    from rezq.api.v1.schemas import critique
+
+    connection.creation.create_test_db(verbosity=0)
+    critiquer = _create_critiques(args.critiques, args.annotations_kb)
+
+    print(
+        f'{args.critiques} critiques with {args.annotations_kb} KB of '
+        'annotations each',
+    )
+    print(f'{"fields":>12} {"ms/request":>12} {"KB/request":>12}')
+
+    with mock.patch.object(
+        critique, 'optimize', lambda queryset, info, **kwargs: queryset,
+    ):
+        all_ms, all_bytes = _measure(critiquer, args.repeats)
+    print(f'{"all":>12} {all_ms:>12.2f} {all_bytes / 1024:>12.1f}')
+
+    selected_ms, selected_bytes = _measure(critiquer, args.repeats)
+    print(
+        f'{"selected":>12} {selected_ms:>12.2f} '
+        f'{selected_bytes / 1024:>12.1f}',
+    )
+
+    print(f'{all_bytes / selected_bytes:.0f}x fewer bytes')
+
+
+if __name__ == '__main__':
+    main()
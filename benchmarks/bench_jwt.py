@@ -0,0 +1,57 @@
+"""Compare JWT decode throughput with and without the decode cache
+
+Usage: make benchmark-jwt
+"""
+import argparse
+from datetime import timedelta
+from unittest import mock
+
+from utils import setup_django
+from utils import stopwatch
+
+
+def _decodes_per_second(decode, tokens, repeats):
+    with stopwatch() as elapsed:
+        for _ in range(repeats):
+            for token in tokens:
+                decode(token)
+
+    return repeats * len(tokens) / elapsed['seconds']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tokens', type=int, default=100)
+    parser.add_argument('--repeats', type=int, default=100)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.utils import timezone
+    from rezq.lib import jwt
+
+    tokens = [
+        jwt.encode({
+            'user': str(i),
+            'exp': timezone.now() + timedelta(minutes=60),
+        })
+        for i in range(args.tokens)
+    ]
+
+    print(f'{"decode":>10} {"per second":>12}')
+
+    # Nothing is ever cached when there's no room
+    with mock.patch.object(jwt, 'DECODE_CACHE_SIZE', 0):
+        jwt.clear_decode_cache()
+        uncached = _decodes_per_second(jwt.decode, tokens, args.repeats)
+    print(f'{"uncached":>10} {uncached:>12.0f}')
+
+    jwt.clear_decode_cache()
+    cached = _decodes_per_second(jwt.decode, tokens, args.repeats)
+    print(f'{"cached":>10} {cached:>12.0f}')
+
+    print(f'{cached / uncached:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
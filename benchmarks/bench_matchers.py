@@ -0,0 +1,87 @@
+"""Compare wall time and total fitness of the critique matchers
+
+Usage: make benchmark-matchers
+"""
+import argparse
+import random
+
+from utils import setup_django
+from utils import stopwatch
+
+
+SIZES = (10, 100, 1000, 5000)
+MAX_AGE_SECONDS = 14 * 24 * 60 * 60
+
+
+def _make_candidates(n, industries, now_ts):
+    from rezq.utils.match_candidates import MatchCandidate
+
+    waterloo_users = {i for i in range(n) if random.random() < 0.5}
+
+    def random_candidate(id, user_id):
+        return MatchCandidate(
+            id=id,
+            user_id=user_id,
+            industries=','.join(
+                random.sample(industries, random.randint(1, 3)),
+            ),
+            created_ts=now_ts - random.uniform(0, MAX_AGE_SECONDS),
+            is_waterloo=user_id in waterloo_users,
+        )
+
+    matched_critiques = [
+        random_candidate(i, random.randrange(n)) for i in range(n)
+    ]
+    critiquer_requests = [
+        random_candidate(i, user_id)
+        for i, user_id in enumerate(random.sample(range(n), n))
+    ]
+
+    return matched_critiques, critiquer_requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('sizes', nargs='*', type=int, default=SIZES)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.utils import timezone
+    from rezq.actions import MATCHERS
+    from rezq.lib.ga_matcher import get_fitness_matrix
+    from server.constants import INDUSTRIES
+
+    random.seed(args.seed)
+
+    print(f'{"n":>6} {"matcher":>8} {"seconds":>10} {"fitness":>16} '
+          f'{"matches":>8}')
+
+    for n in args.sizes:
+        matched_critiques, critiquer_requests = _make_candidates(
+            n, sorted(INDUSTRIES), timezone.now().timestamp(),
+        )
+
+        fitness_matrix = get_fitness_matrix(
+            matched_critiques, critiquer_requests,
+        )
+
+        for name, get_matchings in sorted(MATCHERS.items()):
+            with stopwatch() as elapsed:
+                matchings = get_matchings(
+                    matched_critiques, critiquer_requests,
+                )
+
+            total_fitness = sum(
+                fitness_matrix[mc.id, cr.id] for mc, cr in matchings
+            )
+
+            print(
+                f'{n:>6} {name:>8} {elapsed["seconds"]:>10.3f} '
+                f'{total_fitness:>16.1f} {len(matchings):>8}',
+            )
+
+
+if __name__ == '__main__':
+    main()
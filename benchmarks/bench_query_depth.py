@@ -0,0 +1,143 @@
+"""Compare the overhead of checking the query depth for every field
+resolved with checking it once per document
+
+Usage: make benchmark-query-depth
+"""
+import argparse
+
+from utils import setup_django
+from utils import stopwatch
+
+
+QUERY = '''
+{
+    pooledResumes {
+        resumes {
+            id
+            name
+            pooledcritiqueSet {
+                id
+                summary
+                pooledcritiquecommentSet { id comment }
+            }
+        }
+    }
+}
+'''
+
+MAX_QUERY_DEPTH = 6
+
+
+class _PerFieldQueryDepthMiddleware:
+    """The depth check as it was, walking the operation for each field
+    """
+
+    def check_query_depth(self, selection_set, query_depth=1):
+        if hasattr(selection_set, 'selections'):
+            for field in selection_set.selections:
+                if hasattr(field, 'selection_set'):
+                    if query_depth + 1 > MAX_QUERY_DEPTH:
+                        raise Exception('depth exceeded')
+
+                    self.check_query_depth(
+                        field.selection_set, query_depth=query_depth + 1,
+                    )
+
+    def resolve(self, next, root, info, **args):
+        self.check_query_depth(info.operation.selection_set)
+        return next(root, info, **args)
+
+
+def _create_pooled_resumes(n_resumes, n_critiques, n_comments):
+    from rezq.models import Pool
+    from rezq.models import PooledCritique
+    from rezq.models import PooledCritiqueComment
+    from rezq.models import Resume
+    from rezq.models import User
+    from server.constants import PUBLIC
+
+    Pool.objects.create(id=PUBLIC)
+    user = User.objects.create_user(email='user@rezq.io')
+
+    for i in range(n_resumes):
+        resume = Resume.objects.create(
+            uploader=user, name=f'resume{i}', industries='SOFT',
+            pool_id=PUBLIC,
+        )
+        for j in range(n_critiques):
+            critique = PooledCritique.objects.create(
+                resume=resume, critiquer=user, summary=f'critique{j}',
+            )
+            PooledCritiqueComment.objects.bulk_create([
+                PooledCritiqueComment(
+                    critique=critique, user=user, comment=f'comment{k}',
+                )
+                for k in range(n_comments)
+            ])
+
+
+def _count_fields(data):
+    if isinstance(data, dict):
+        return sum(1 + _count_fields(value) for value in data.values())
+    if isinstance(data, list):
+        return sum(_count_fields(value) for value in data)
+    return 0
+
+
+def _seconds_per_request(document, repeats, **kwargs):
+    from django.contrib.auth.models import AnonymousUser
+    from django.test import RequestFactory
+
+    with stopwatch() as elapsed:
+        for _ in range(repeats):
+            request = RequestFactory().post('/')
+            request.user = AnonymousUser()
+            result = document.execute(context=request, **kwargs)
+            assert not result.errors, result.errors
+
+    return elapsed['seconds'] / repeats, _count_fields(result.data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--resumes', type=int, default=10)
+    parser.add_argument('--critiques', type=int, default=5)
+    parser.add_argument('--comments', type=int, default=5)
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db import connection
+    from graphql import validate
+    from rezq.api.query_depth import QueryDepthRule
+    from rezq.api.v1.schema import public_schema
+    from rezq.api.views import document_backend
+
+    connection.creation.create_test_db(verbosity=0)
+    _create_pooled_resumes(args.resumes, args.critiques, args.comments)
+
+    # Parsing and validating, QueryDepthRule included, happens once here
+    document = document_backend.document_from_string(public_schema, QUERY)
+
+    per_document, fields = _seconds_per_request(document, args.repeats)
+    per_field, _ = _seconds_per_request(
+        document,
+        args.repeats,
+        middleware=[_PerFieldQueryDepthMiddleware()],
+    )
+
+    with stopwatch() as elapsed:
+        validate(public_schema, document.document_ast, [QueryDepthRule])
+    rule_ms = elapsed['seconds'] * 1000
+
+    print(f'{fields} fields resolved per request')
+    print(f'{"depth check":>12} {"ms/request":>12}')
+    print(f'{"per field":>12} {per_field * 1000:>12.2f}')
+    print(f'{"per document":>12} {per_document * 1000:>12.2f} '
+          f'(+{rule_ms:.2f} ms once per cached document)')
+    print(f'{(per_field - per_document) / fields * 1e6:.1f} us/field saved')
+
+
+if __name__ == '__main__':
+    main()
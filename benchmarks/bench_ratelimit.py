@@ -0,0 +1,82 @@
+"""Measure rate limiter overhead per request, syncing every request with
+the shared cache, and syncing in batches
+
+The shared cache is Redis when REDIS_URL is set, else in process.
+
+Usage: make benchmark-ratelimit
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from utils import setup_django
+from utils import stopwatch
+
+
+def _run(ratelimiter, clients, requests, threads):
+    """
+    :return: seconds, limited requests, syncs
+    :rtype: tuple
+    """
+    syncs = []
+    sync = ratelimiter._sync
+
+    def counted_sync(*args):
+        syncs.append(None)
+        return sync(*args)
+
+    def make_requests(thread):
+        limited = 0
+        for _ in range(requests):
+            for client in range(thread, clients, threads):
+                limited += ratelimiter.is_ratelimited('query', str(client))
+        return limited
+
+    with mock.patch.object(ratelimiter, '_sync', counted_sync):
+        with ThreadPoolExecutor(threads) as executor, stopwatch() as elapsed:
+            limited = sum(executor.map(make_requests, range(threads)))
+
+    return elapsed['seconds'], limited, len(syncs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--clients', type=int, default=100)
+    parser.add_argument('--requests', type=int, default=100, help='per client')
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--rate', default='60/m')
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.core.cache import caches
+    from rezq.mixins import ratelimit
+
+    total = args.clients * args.requests
+    print(f'{total} requests of {args.clients} clients limited to {args.rate}')
+    print(
+        f'{"sync":>10} {"us/request":>12} {"syncs/request":>14} '
+        f'{"limited":>8}',
+    )
+
+    for name, max_pending in (('always', 1), ('batched', None)):
+        caches['shared'].clear()
+        ratelimiter = ratelimit.Ratelimiter({'query': args.rate})
+
+        with mock.patch.object(
+            ratelimit,
+            'LOCAL_MAX_PENDING',
+            max_pending or ratelimit.LOCAL_MAX_PENDING,
+        ):
+            seconds, limited, syncs = _run(
+                ratelimiter, args.clients, args.requests, args.threads,
+            )
+
+        print(
+            f'{name:>10} {seconds / total * 1e6:>12.1f} '
+            f'{syncs / total:>14.2f} {limited:>8}',
+        )
+
+
+if __name__ == '__main__':
+    main()
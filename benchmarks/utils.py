@@ -0,0 +1,34 @@
+import os
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+
+
+REZQ_BACKEND_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'rezq_backend',
+)
+
+
+def setup_django():
+    """Configure the DEBUG settings so benchmarks can import rezq modules
+    """
+    if REZQ_BACKEND_DIR not in sys.path:
+        sys.path.insert(0, REZQ_BACKEND_DIR)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+
+    import django
+    django.setup()
+
+
+@contextmanager
+def stopwatch():
+    """Yields a dict whose 'seconds' is set when the block exits
+    """
+    elapsed = {}
+    start = perf_counter()
+    try:
+        yield elapsed
+    finally:
+        elapsed['seconds'] = perf_counter() - start
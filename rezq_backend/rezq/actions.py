@@ -1,18 +1,105 @@
 import logging
 
+from django.conf import settings
 from django.contrib import messages
 from django.db import transaction
-from rezq.lib.ga_matcher import get_matchings
+from django.db.models import Case
+from django.db.models import Value
+from django.db.models import When
+from django.utils import timezone
+from rezq.lib import ga_matcher
+from rezq.lib import lsa_matcher
 from rezq.models import CritiquerRequest
 from rezq.models import MatchedCritique
+from rezq.models import User
+from rezq.utils.auth import create_email_unsubscribe_token
+from rezq.utils.mailer import send_critiquer_matched_notif_mails
+from rezq.utils.match_candidates import load_match_candidates
 
 logger = logging.getLogger(__name__)
 
 
-def match(matched_critiques=None, critiquer_requests=None):
+GA = 'ga'
+LSA = 'lsa'
+
+# Each matcher takes lists of matched critique and critiquer request
+# MatchCandidate, and returns a list of pairs of them
+MATCHERS = {
+    # Permutation genetic algorithm; approximate
+    GA: ga_matcher.get_matchings,
+    # Linear assignment solver; optimal
+    LSA: lsa_matcher.get_matchings,
+}
+
+# 3 query parameters per row stays under SQLite's limit of 999
+BULK_UPDATE_BATCH_SIZE = 300
+
+
+def _bulk_assign_critiquers(critiquer_ids):
+    """Assign critiquers to MatchedCritiques with one UPDATE per batch
+
+    Does what MatchedCritique.save does for a newly assigned critiquer,
+    except for the notification email.
+
+    :param critiquer_ids: MatchedCritique id to critiquer User id
+    :type critiquer_ids: dict
+    """
+    now = timezone.now()
+    critiquer_field = MatchedCritique._meta.get_field('critiquer')
+    matched_critique_ids = list(critiquer_ids)
+
+    for i in range(0, len(matched_critique_ids), BULK_UPDATE_BATCH_SIZE):
+        batch = matched_critique_ids[i:i + BULK_UPDATE_BATCH_SIZE]
+
+        MatchedCritique.objects.filter(id__in=batch).update(
+            critiquer=Case(
+                *(
+                    When(id=id, then=Value(
+                        critiquer_ids[id],
+                        output_field=critiquer_field.target_field,
+                    ))
+                    for id in batch
+                ),
+                output_field=critiquer_field.target_field,
+            ),
+            matched_on=now,
+            updated_on=now,
+        )
+
+
+def _send_critiquer_matched_notif_mails(critiquer_ids):
+    """One email per matched critique, like MatchedCritique.save sends
+
+    :param critiquer_ids: critiquer User id of each matched critique
+    :type critiquer_ids: list
+    """
+    recipients_by_id = {}
+
+    for critiquer_id, email in User.objects.filter(
+        id__in=set(critiquer_ids),
+        email__isnull=False,
+        email_subscribed=True,
+    ).values_list('id', 'email'):
+        unsubscribe_token = create_email_unsubscribe_token(critiquer_id)
+        unsubscribe_link = (
+            f'{settings.FRONTEND_URL}/unsubscribe-email'
+            f'?token={unsubscribe_token}'
+        )
+        recipients_by_id[critiquer_id] = (email, unsubscribe_link)
+
+    send_critiquer_matched_notif_mails([
+        recipients_by_id[critiquer_id]
+        for critiquer_id in critiquer_ids
+        if critiquer_id in recipients_by_id
+    ])
+
+
+def match(matched_critiques=None, critiquer_requests=None, matcher=GA):
     """Match critiques!
     """
-    logger.info('Starting critique matching')
+    logger.info('Starting critique matching with %s matcher', matcher)
+
+    get_matchings = MATCHERS[matcher]
 
     if matched_critiques is None:
         matched_critiques = MatchedCritique.objects.filter(
@@ -21,32 +108,56 @@ def match(matched_critiques=None, critiquer_requests=None):
     if critiquer_requests is None:
         critiquer_requests = CritiquerRequest.objects.all()
 
-    matchings = get_matchings(matched_critiques, critiquer_requests)
+    matchings = get_matchings(
+        *load_match_candidates(matched_critiques, critiquer_requests)
+    )
 
     logger.info('Saving %d matches', len(matchings))
 
-    # Assign critiquer, and delete the critiquer request
+    critiquer_ids = {
+        matched_critique.id: critiquer_request.user_id
+        for matched_critique, critiquer_request in matchings
+    }
+    critiquer_request_ids = [
+        critiquer_request.id for _, critiquer_request in matchings
+    ]
+
+    # Assign critiquer, delete the critiquer request, and queue emails
     with transaction.atomic():
-        for matched_critique, critiquer_request in matchings:
-            matched_critique.critiquer = critiquer_request.critiquer
-            matched_critique.save()
-            critiquer_request.delete()
+        _bulk_assign_critiquers(critiquer_ids)
+
+        CritiquerRequest.objects.filter(id__in=critiquer_request_ids).delete()
+
+        _send_critiquer_matched_notif_mails(list(critiquer_ids.values()))
 
     logger.info('Matched %d critiques', len(matchings))
 
 
-def match_critiques(_modeladmin, request, matched_critiques):
-    """Match selected "MatchedCritique" objects in Django admin
-    """
+def _can_match_critiques(request, matched_critiques):
     for mc in matched_critiques:
         if mc.critiquer:
             messages.error(request, f'{mc.id} is already matched.')
-            return
+            return False
         if mc.submitted:
             messages.error(request, f'{mc.id} is already submitted.')
-            return
+            return False
 
-    match(matched_critiques, CritiquerRequest.objects.all())
+    return True
+
+
+def match_critiques(_modeladmin, request, matched_critiques):
+    """Match selected "MatchedCritique" objects in Django admin
+    """
+    if _can_match_critiques(request, matched_critiques):
+        match(matched_critiques, CritiquerRequest.objects.all())
+
+
+def match_critiques_optimally(_modeladmin, request, matched_critiques):
+    """Match selected "MatchedCritique" objects in Django admin,
+    using the linear assignment solver
+    """
+    if _can_match_critiques(request, matched_critiques):
+        match(matched_critiques, CritiquerRequest.objects.all(), matcher=LSA)
 
 
 def match_critiquers(_modeladmin, _request, critiquer_requests):
@@ -56,3 +167,14 @@ def match_critiquers(_modeladmin, _request, critiquer_requests):
         MatchedCritique.objects.filter(critiquer=None, submitted=False),
         critiquer_requests,
     )
+
+
+def match_critiquers_optimally(_modeladmin, _request, critiquer_requests):
+    """Match selected "CritiquerRequest" objects in Django admin,
+    using the linear assignment solver
+    """
+    match(
+        MatchedCritique.objects.filter(critiquer=None, submitted=False),
+        critiquer_requests,
+        matcher=LSA,
+    )
@@ -2,7 +2,9 @@ from django.conf import settings
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from rezq.actions import match_critiquers
+from rezq.actions import match_critiquers_optimally
 from rezq.actions import match_critiques
+from rezq.actions import match_critiques_optimally
 from rezq.forms import RezqUserChangeForm
 from rezq.forms import RezqUserCreationForm
 from rezq.models import CritiquerRequest
@@ -10,6 +12,7 @@ from rezq.models import LinkedCritique
 from rezq.models import LinkedCritiqueComment
 from rezq.models import MatchedCritique
 from rezq.models import MatchedCritiqueComment
+from rezq.models import OutboxEmail
 from rezq.models import PageReport
 from rezq.models import Pool
 from rezq.models import PooledCritique
@@ -85,7 +88,7 @@ class ResumeAdmin(RezqModelAdmin):
 @admin.register(CritiquerRequest)
 class CritiquerRequestAdmin(RezqModelAdmin):
 
-    actions = [match_critiquers]
+    actions = [match_critiquers, match_critiquers_optimally]
 
     list_display = ('critiquer', 'industries', 'created_on')
 
@@ -93,7 +96,7 @@ class CritiquerRequestAdmin(RezqModelAdmin):
 @admin.register(MatchedCritique)
 class MatchedCritiqueAdmin(RezqModelAdmin):
 
-    actions = [match_critiques]
+    actions = [match_critiques, match_critiques_optimally]
 
     list_display = ('critiquer', 'submitted', 'created_on')
 
@@ -155,6 +158,14 @@ class PageReportAdmin(RezqModelAdmin):
     list_display = ('reporter', 'pathname', 'stars', 'reply_to', 'created_on')
 
 
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(RezqModelAdmin):
+
+    list_display = (
+        'subject', 'to_address', 'attempts', 'send_after', 'created_on',
+    )
+
+
 @admin.register(Pool)
 class PoolAdmin(admin.ModelAdmin):
 
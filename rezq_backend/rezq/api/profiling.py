@@ -0,0 +1,263 @@
+"""GraphQL latency histograms and the slow operation log
+
+Operations are timed by the views, with the DB queries and S3 calls they
+make, and fields by ProfilingMiddleware. Both are kept in memory per
+process, and served to staff by MetricsView.
+"""
+import json
+import logging
+import math
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connection
+from promise import Promise
+from rezq.lib.s3 import S3
+from rezq.lib.tiered_cache import cache_stats
+from rezq.utils.query_counter import QueryCounter
+
+
+logger = logging.getLogger(__name__)
+
+# Operations slower than this are logged
+SLOW_OPERATION_MS = 1000
+
+# Clients name operations, so there may be any number of them
+MAX_OPERATIONS = 200
+OTHER_OPERATION = '<other>'
+ANONYMOUS_OPERATION = '<anonymous>'
+
+# Bucket upper bounds, in ms. Each is 2^(1/4) ~ 19% more than the last,
+# from 0.01 ms to a little over a minute.
+HISTOGRAM_BOUNDS = tuple(0.01 * 2 ** (i / 4) for i in range(92))
+
+PERCENTILES = (50, 95, 99)
+
+
+class Histogram:
+    """Counts values into exponential buckets.
+
+    Percentiles are the upper bound of the bucket they fall in, so are
+    at most ~19% too high.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        self.counts[bisect_left(HISTOGRAM_BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def get_percentile(self, percentile):
+        if not self.count:
+            return None
+
+        rank = math.ceil(self.count * percentile / 100)
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                break
+
+        if i == len(HISTOGRAM_BOUNDS):
+            return self.max
+        return min(HISTOGRAM_BOUNDS[i], self.max)
+
+    def to_dict(self):
+        return dict(
+            {
+                f'p{percentile}': self.get_percentile(percentile)
+                for percentile in PERCENTILES
+            },
+            count=self.count,
+            mean=self.total / self.count if self.count else None,
+            max=self.max,
+        )
+
+
+class _OperationStats:
+
+    def __init__(self):
+        self.ms = Histogram()
+        self.db_queries = 0
+        self.db_ms = 0.0
+        self.s3_calls = 0
+
+    def to_dict(self):
+        count = self.ms.count
+        return {
+            'ms': self.ms.to_dict(),
+            'mean_db_queries': self.db_queries / count,
+            'mean_db_ms': self.db_ms / count,
+            'mean_s3_calls': self.s3_calls / count,
+        }
+
+
+class Metrics:
+    """Latency of operations and fields, for one process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._operations = defaultdict(_OperationStats)
+            self._fields = defaultdict(Histogram)
+
+    def add_operation(self, name, profile):
+        with self._lock:
+            if (
+                name not in self._operations and
+                len(self._operations) >= MAX_OPERATIONS
+            ):
+                name = OTHER_OPERATION
+
+            stats = self._operations[name]
+            stats.ms.add(profile.ms)
+            stats.db_queries += profile.db_queries
+            stats.db_ms += profile.db_ms
+            stats.s3_calls += profile.s3_calls
+
+    def add_field(self, name, ms):
+        with self._lock:
+            self._fields[name].add(ms)
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                'operations': {
+                    name: stats.to_dict()
+                    for name, stats in self._operations.items()
+                },
+                'fields': {
+                    name: histogram.to_dict()
+                    for name, histogram in self._fields.items()
+                },
+                's3_cache': {
+                    'hits': S3.cache_hits,
+                    'misses': S3.cache_misses,
+                },
+                'cache': cache_stats.to_dict(),
+            }
+
+
+metrics = Metrics()
+
+
+class Profile:
+    """What one operation cost
+    """
+
+    def __init__(self, operation_name):
+        self.operation_name = operation_name
+        self.ms = 0.0
+        self.queries = QueryCounter()
+        self.s3_calls = 0
+
+    @property
+    def db_queries(self):
+        return self.queries.count
+
+    @property
+    def db_ms(self):
+        return self.queries.ms
+
+
+@contextmanager
+def profile_operation(request, operation_name, variables):
+    """Time the block, and count the DB queries and S3 calls it makes.
+
+    In DEBUG, N+1 queries are logged too.
+
+    :param operation_name: operation name of the request, if any. If
+        not, ProfilingMiddleware names it after the executed operation.
+    :type operation_name: str or None
+    :param variables: variable values of the request
+    :type variables: dict or None
+    """
+    profile = Profile(operation_name)
+    request.gql_profile = profile
+    s3_calls = S3.get_thread_call_count()
+    start = perf_counter()
+
+    try:
+        with connection.execute_wrapper(profile.queries):
+            yield profile
+    finally:
+        profile.ms = (perf_counter() - start) * 1000
+        profile.s3_calls = S3.get_thread_call_count() - s3_calls
+        name = profile.operation_name or ANONYMOUS_OPERATION
+        metrics.add_operation(name, profile)
+
+        if profile.ms > SLOW_OPERATION_MS:
+            logger.warning('Slow GraphQL operation: %s', json.dumps({
+                'operation': name,
+                'variables': get_shape(variables or {}),
+                'ms': round(profile.ms, 2),
+                'db_queries': profile.db_queries,
+                'db_ms': round(profile.db_ms, 2),
+                's3_calls': profile.s3_calls,
+            }, sort_keys=True))
+
+        if settings.DEBUG:
+            for shape, count in profile.queries.get_repeated_queries().items():
+                logger.warning(
+                    'N+1 queries in GraphQL operation %s: %d x %s',
+                    name, count, shape,
+                )
+
+
+def get_shape(value):
+    """The types of value, without the values, for logging variables.
+
+    e.g. {'first': 10, 'industries': ['SOFT']} is
+    {'first': 'int', 'industries': ['str']}
+    """
+    if isinstance(value, dict):
+        return {key: get_shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [get_shape(value[0])] if value else []
+    return type(value).__name__
+
+
+class ProfilingMiddleware:
+    """Times each field, until its value is resolved.
+
+    Fields are named by their parent type, e.g. PublicQuery.pooledResumes
+    """
+
+    def resolve(self, next, root, info, **args):
+        profile = getattr(info.context, 'gql_profile', None)
+        if (
+            len(info.path) == 1 and
+            profile is not None and
+            profile.operation_name is None and
+            info.operation.name is not None
+        ):
+            profile.operation_name = info.operation.name.value
+
+        name = f'{info.parent_type.name}.{info.field_name}'
+        start = perf_counter()
+        value = next(root, info, **args)
+
+        # e.g. waiting on a DataLoader batch
+        if isinstance(value, Promise) and value.is_pending:
+            def add_field(resolved_value):
+                metrics.add_field(name, (perf_counter() - start) * 1000)
+                return resolved_value
+
+            return value.then(add_field)
+
+        metrics.add_field(name, (perf_counter() - start) * 1000)
+        return value
@@ -0,0 +1,217 @@
+"""Static query cost analysis
+
+Every object field costs 1, and list fields multiply the cost of their
+selections by the number of items they may return: their `first`
+argument, the `first` argument of their parent (e.g.
+`pooledResumes(first: 10) { resumes { ... } }`), or
+UNPAGINATED_LIST_SIZE without one. A `first` argument is at most
+MAX_PAGE_SIZE. Scalar fields are free.
+"""
+from graphql.language import ast
+from graphql.type import GraphQLList
+from graphql.type import GraphQLNonNull
+from server.constants import MAX_PAGE_SIZE
+
+
+# Lists without a `first` argument, like the critiques of a resume, or
+# pooled resumes when it's left out, aren't bounded, so this is a
+# pessimistic guess
+UNPAGINATED_LIST_SIZE = 20
+MAX_QUERY_COST = 10000
+
+QUERY_COST_EXCEEDED = 'GraphQL query cost maximum exceeded.'
+
+
+def _unwrap(graphql_type):
+    """
+    :return: the named type, and whether it's a list
+    :rtype: tuple( graphql.type.GraphQLNamedType, bool )
+    """
+    is_list = False
+    while isinstance(graphql_type, (GraphQLNonNull, GraphQLList)):
+        if isinstance(graphql_type, GraphQLList):
+            is_list = True
+        graphql_type = graphql_type.of_type
+    return graphql_type, is_list
+
+
+def _iter_typed_fields(schema, parent_type, selection_set, fragments):
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            yield parent_type, selection
+            continue
+
+        if isinstance(selection, ast.FragmentSpread):
+            fragment = fragments.get(selection.name.value)
+            if fragment is None:
+                continue
+        else:
+            fragment = selection
+
+        fragment_type = parent_type
+        if fragment.type_condition is not None:
+            fragment_type = schema.get_type(
+                fragment.type_condition.name.value,
+            )
+
+        yield from _iter_typed_fields(
+            schema, fragment_type, fragment.selection_set, fragments,
+        )
+
+
+def get_page_size(first):
+    """
+    :param first: the `first` argument of a field, e.g. a variable value
+    :return: how many items the field returns at most, or None if it
+        isn't bounded
+    :rtype: int or None
+    """
+    if not isinstance(first, int):
+        return None
+    return min(max(first, 0), MAX_PAGE_SIZE)
+
+
+def _get_first(field_def, field_ast, variables):
+    """
+    :return: the page size of a field given a `first` argument, or None
+    """
+    if 'first' not in field_def.args:
+        return None
+
+    first = None
+    for argument in field_ast.arguments:
+        if argument.name.value != 'first':
+            continue
+
+        if isinstance(argument.value, ast.Variable):
+            first = variables.get(argument.value.name.value)
+        elif isinstance(argument.value, ast.IntValue):
+            first = int(argument.value.value)
+
+    return get_page_size(first)
+
+
+def _get_selection_set_cost(
+    schema, parent_type, selection_set, fragments, variables, parent_first,
+):
+    cost = 0
+
+    for field_parent_type, field_ast in _iter_typed_fields(
+        schema, parent_type, selection_set, fragments,
+    ):
+        if field_ast.selection_set is None:
+            continue
+
+        fields = getattr(field_parent_type, 'fields', {})
+        field_def = fields.get(field_ast.name.value)
+        if field_def is None:
+            # Introspection, or rejected by validation
+            continue
+
+        field_type, is_list = _unwrap(field_def.type)
+        first = _get_first(field_def, field_ast, variables)
+
+        if is_list:
+            multiplier = next(
+                size for size in (first, parent_first, UNPAGINATED_LIST_SIZE)
+                if size is not None
+            )
+            child_first = None
+        else:
+            multiplier = 1
+            child_first = first
+
+        cost += multiplier * (1 + _get_selection_set_cost(
+            schema,
+            field_type,
+            field_ast.selection_set,
+            fragments,
+            variables,
+            child_first,
+        ))
+
+    return cost
+
+
+def get_operation(document_ast, operation_name):
+    """
+    :return: the operation that will be executed, or None
+    :rtype: graphql.language.ast.OperationDefinition
+    """
+    operations = [
+        definition for definition in document_ast.definitions
+        if isinstance(definition, ast.OperationDefinition)
+    ]
+
+    if operation_name is None:
+        return operations[0] if len(operations) == 1 else None
+
+    return next((
+        operation for operation in operations
+        if operation.name and operation.name.value == operation_name
+    ), None)
+
+
+def get_cost_variable_names(document_ast):
+    """Variables that are `first` arguments, which the cost depends on.
+
+    :rtype: frozenset( str )
+    """
+    names = set()
+
+    def visit(selection_set):
+        if selection_set is None:
+            return
+        for selection in selection_set.selections:
+            for argument in getattr(selection, 'arguments', None) or []:
+                if (
+                    argument.name.value == 'first' and
+                    isinstance(argument.value, ast.Variable)
+                ):
+                    names.add(argument.value.name.value)
+            visit(selection.selection_set)
+
+    for definition in document_ast.definitions:
+        visit(getattr(definition, 'selection_set', None))
+
+    return frozenset(names)
+
+
+def get_query_cost(schema, document_ast, operation_name, variables):
+    """
+    :param schema: the schema to execute against
+    :type schema: graphql.type.GraphQLSchema
+    :param document_ast: a validated document
+    :type document_ast: graphql.language.ast.Document
+    :param operation_name: operation to execute, if there are many
+    :type operation_name: str or None
+    :param variables: variable values of the request
+    :type variables: dict or None
+
+    :return: the cost, or 0 if there is no such operation
+    :rtype: int
+    """
+    operation = get_operation(document_ast, operation_name)
+    if operation is None:
+        # Execution reports the error
+        return 0
+
+    if operation.operation == 'mutation':
+        root_type = schema.get_mutation_type()
+    else:
+        root_type = schema.get_query_type()
+
+    fragments = {
+        definition.name.value: definition
+        for definition in document_ast.definitions
+        if isinstance(definition, ast.FragmentDefinition)
+    }
+
+    return _get_selection_set_cost(
+        schema,
+        root_type,
+        operation.selection_set,
+        fragments,
+        variables or {},
+        None,
+    )
@@ -0,0 +1,62 @@
+"""Query depth validation
+
+The depth of a field is the number of fields it's nested in, plus one.
+Fragments don't add to the depth of their fields, but are followed.
+"""
+import logging
+
+from graphql import GraphQLError
+from graphql.language import ast
+from graphql.validation.rules.base import ValidationRule
+
+
+logger = logging.getLogger(__name__)
+
+MAX_QUERY_DEPTH = 6
+
+QUERY_DEPTH_EXCEEDED = 'GraphQL query depth maximum exceeded.'
+
+
+class QueryDepthRule(ValidationRule):
+    """Rejects operations with fields deeper than MAX_QUERY_DEPTH - 1.
+
+    Runs with the other validation rules, so once per cached document
+    rather than for every field resolved.
+    """
+
+    def _exceeds_max_depth(self, selection_set, depth, fragment_names):
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.FragmentSpread):
+                name = selection.name.value
+                fragment = self.context.get_fragment(name)
+                # Unknown fragments and cycles are reported by other rules
+                if fragment is None or name in fragment_names:
+                    continue
+                if self._exceeds_max_depth(
+                    fragment.selection_set, depth, fragment_names | {name},
+                ):
+                    return True
+
+            elif isinstance(selection, ast.InlineFragment):
+                if self._exceeds_max_depth(
+                    selection.selection_set, depth, fragment_names,
+                ):
+                    return True
+
+            else:
+                if depth + 1 > MAX_QUERY_DEPTH:
+                    return True
+                if selection.selection_set and self._exceeds_max_depth(
+                    selection.selection_set, depth + 1, fragment_names,
+                ):
+                    return True
+
+        return False
+
+    def enter_OperationDefinition(self, node, *args):
+        if self._exceeds_max_depth(node.selection_set, 1, frozenset()):
+            logger.info(node)
+            self.context.report_error(
+                GraphQLError(QUERY_DEPTH_EXCEEDED, [node]),
+            )
+        return False
@@ -1,7 +1,9 @@
 from django.conf.urls import include
 from django.urls import path
+from rezq.api.views import MetricsView
 
 
 urlpatterns = [
     path('v1/', include('rezq.api.v1.urls')),
+    path('metrics/', MetricsView.as_view()),
 ]
@@ -0,0 +1,194 @@
+from collections import defaultdict
+
+from promise import Promise
+from promise.dataloader import DataLoader
+from rezq.models import PooledCritiqueVote
+from rezq.models.pooled_critique import get_upvotes
+from rezq.utils.selections import get_unselected_fields
+
+
+class _ModelLoader(DataLoader):
+    """Loads model objects by primary key.
+    """
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def batch_load_fn(self, ids):
+        objects = self.model.objects.in_bulk(ids)
+        return Promise.resolve([objects.get(id) for id in ids])
+
+
+class _RelatedSetLoader(DataLoader):
+    """Loads lists of model objects by a foreign key, without the
+    deferred fields.
+    """
+
+    def __init__(self, model, field_name, deferred):
+        super().__init__()
+        self.model = model
+        self.field_name = field_name
+        self.deferred = deferred
+
+    def batch_load_fn(self, ids):
+        objects = defaultdict(list)
+        for obj in self.model.objects.filter(**{
+            f'{self.field_name}__in': ids,
+        }).defer(*self.deferred):
+            objects[getattr(obj, f'{self.field_name}_id')].append(obj)
+        return Promise.resolve([objects[id] for id in ids])
+
+
+class _UserVoteLoader(DataLoader):
+    """Loads whether a user upvoted (True), downvoted (False), or didn't
+    vote on (None) pooled critiques.
+    """
+
+    def __init__(self, voter):
+        super().__init__()
+        self.voter = voter
+
+    def batch_load_fn(self, critique_ids):
+        votes = dict(
+            PooledCritiqueVote.objects.filter(
+                voter=self.voter,
+                critique__in=critique_ids,
+            ).values_list('critique', 'is_upvote'),
+        )
+        return Promise.resolve([votes.get(id) for id in critique_ids])
+
+
+class _UpvotesLoader(DataLoader):
+    """Loads upvotes minus downvotes of pooled critiques.
+    """
+
+    def batch_load_fn(self, critique_ids):
+        votes = get_upvotes(critique_ids)
+        return Promise.resolve([votes.get(id, 0) for id in critique_ids])
+
+
+class Loaders:
+    """DataLoaders for one request.
+
+    Each loader collects the keys loaded while resolving one level of
+    the query, and fetches them in one query.
+    """
+
+    def __init__(self):
+        self._loaders = {}
+
+    def _get(self, key, loader_class, *args):
+        if key not in self._loaders:
+            self._loaders[key] = loader_class(*args)
+        return self._loaders[key]
+
+    def model(self, model):
+        return self._get(('model', model), _ModelLoader, model)
+
+    def related_set(self, model, field_name, deferred=()):
+        return self._get(
+            ('related_set', model, field_name, deferred),
+            _RelatedSetLoader,
+            model,
+            field_name,
+            deferred,
+        )
+
+    def upvotes(self):
+        return self._get(('upvotes',), _UpvotesLoader)
+
+    def user_votes(self, voter):
+        return self._get(('user_votes', voter.id), _UserVoteLoader, voter)
+
+
+def get_loaders(info):
+    """
+    :return: the loaders of the request being resolved
+    :rtype: Loaders
+    """
+    context = info.context
+    if not hasattr(context, 'loaders'):
+        context.loaders = Loaders()
+    return context.loaders
+
+
+def load_related(info, obj, field_name):
+    """Resolve a foreign key of obj.
+
+    :param obj: any Django model object
+    :type obj: django.db.models.Model
+    :param field_name: name of the foreign key field
+    :type field_name: str
+
+    :return: the related object, or None
+    :rtype: promise.Promise or django.db.models.Model
+    """
+    field = obj._meta.get_field(field_name)
+
+    # Already fetched, e.g. select_related
+    if field.is_cached(obj):
+        return field.get_cached_value(obj)
+
+    id = getattr(obj, field.attname)
+    if id is None:
+        return None
+
+    return get_loaders(info).model(field.related_model).load(id)
+
+
+def load_related_set(info, obj, accessor_name):
+    """Resolve a reverse foreign key of obj.
+
+    The DEFERRABLE_FIELDS of the related model, e.g. large text fields,
+    are only loaded if selected.
+
+    :param obj: any Django model object
+    :type obj: django.db.models.Model
+    :param accessor_name: e.g. 'pooledcritique_set'
+    :type accessor_name: str
+
+    :return: the related objects
+    :rtype: promise.Promise or list
+    """
+    rel = next(
+        rel for rel in obj._meta.related_objects
+        if rel.get_accessor_name() == accessor_name
+    )
+
+    # Already fetched, e.g. prefetch_related
+    prefetched = getattr(obj, '_prefetched_objects_cache', {})
+    if rel.get_cache_name() in prefetched:
+        return list(prefetched[rel.get_cache_name()])
+
+    deferred = get_unselected_fields(
+        info, getattr(rel.related_model, 'DEFERRABLE_FIELDS', ()),
+    )
+    return get_loaders(info).related_set(
+        rel.related_model, rel.field.name, deferred,
+    ).load(obj.pk)
+
+
+def load_user_upvoted(info, critique):
+    """Resolve whether the requesting user upvoted a pooled critique.
+
+    :return: True if upvoted, False if downvoted, None if neither
+    :rtype: promise.Promise or bool
+    """
+    # Already fetched, e.g. resolve_pooled_critique
+    if hasattr(critique, 'user_upvoted'):
+        return critique.user_upvoted
+
+    user = info.context.user
+    if not user.is_authenticated:
+        return None
+
+    return get_loaders(info).user_votes(user).load(critique.id)
+
+
+def load_upvotes(info, critique):
+    """Resolve the upvotes minus downvotes of a pooled critique.
+
+    :rtype: promise.Promise
+    """
+    return get_loaders(info).upvotes().load(critique.id)
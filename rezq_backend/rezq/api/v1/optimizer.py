@@ -0,0 +1,220 @@
+"""Querysets loading only what a GraphQL selection needs
+
+optimize() reads the fields selected under the resolving field, and
+- only() loads the model fields selected,
+- select_related() joins the foreign keys selected,
+- prefetch_related() loads the reverse foreign keys selected, with the
+  same treatment for what's selected under them.
+
+Prefetched and joined objects are then used by load_related and
+load_related_set instead of their DataLoaders.
+"""
+from collections import defaultdict
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from graphene.utils.str_converters import to_snake_case
+from rezq.models import LinkedCritique
+from rezq.models import PooledCritique
+from rezq.models import Resume
+from rezq.models import User
+from rezq.utils.selections import get_selected_field_asts
+from rezq.utils.selections import iter_fields
+
+
+# Model fields needed by GraphQL fields that aren't model fields, e.g.
+# properties, by model. Selecting any other such field loads every model
+# field.
+COMPUTED_FIELD_DEPENDENCIES = {
+    Resume: {
+        'token': ('link_enabled',),
+        'downloadUrl': (),
+        'thumbnailDownloadUrl': (),
+        'userIsPremium': (),
+        'pooledCritiquesUserUpvoted': (),
+    },
+    PooledCritique: {
+        'upvotes': (),
+        'userUpvoted': (),
+    },
+    LinkedCritique: {
+        'token': (),
+    },
+    User: {
+        'hasPassword': ('password',),
+        'avatarDownloadUrl': (),
+        'avatarUploadInfo': (),
+    },
+}
+
+
+class _Plan:
+    """What to load of a model
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.selected = set()
+        self.only = {model._meta.pk.name}
+        self.only.update(getattr(model, 'ALWAYS_LOADED_FIELDS', ()))
+        self.load_all = False
+        # Field or accessor name to _Plan
+        self.select_related = {}
+        self.prefetch_related = {}
+
+    def get_only(self):
+        if not self.load_all:
+            return self.only
+
+        # Unselected large fields are still not loaded
+        deferrable = set(getattr(self.model, 'DEFERRABLE_FIELDS', ()))
+        return {
+            field.name for field in self.model._meta.concrete_fields
+            if field.name not in deferrable or field.name in self.selected
+        }
+
+
+def _get_model_field(model, name):
+    """
+    :return: the field, the reverse relation of the accessor name, or
+        None
+    """
+    for rel in model._meta.related_objects:
+        if rel.get_accessor_name() == name:
+            return rel
+
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def _get_plan(model, field_asts, fragments):
+    plan = _Plan(model)
+
+    # Children of each field, which may be selected more than once
+    children = defaultdict(list)
+    for field_ast in field_asts:
+        graphql_name = field_ast.name.value
+        if graphql_name.startswith('__'):
+            continue
+
+        name = to_snake_case(graphql_name)
+        model_field = _get_model_field(model, name)
+        if model_field is None:
+            dependencies = COMPUTED_FIELD_DEPENDENCIES.get(model, {}).get(
+                graphql_name,
+            )
+            if dependencies is None:
+                plan.load_all = True
+            else:
+                plan.only.update(dependencies)
+            continue
+
+        plan.selected.add(name)
+        children[model_field].extend(
+            iter_fields(field_ast.selection_set, fragments),
+        )
+
+    for model_field, child_asts in children.items():
+        if model_field.concrete:
+            plan.only.add(model_field.name)
+            if model_field.many_to_one or model_field.one_to_one:
+                plan.select_related[model_field.name] = _get_plan(
+                    model_field.related_model, child_asts, fragments,
+                )
+        elif model_field.one_to_many:
+            child_plan = _get_plan(
+                model_field.related_model, child_asts, fragments,
+            )
+            # To match the related objects to this model's
+            child_plan.only.add(model_field.field.name)
+            plan.prefetch_related[model_field.get_accessor_name()] = (
+                child_plan
+            )
+
+    return plan
+
+
+def _require(plan, lookup):
+    """Load a model field, or one of a related model joined for it, e.g.
+    resume__uploader
+    """
+    name, _, rest = lookup.partition('__')
+    plan.only.add(name)
+    if not rest:
+        return
+
+    child_plan = plan.select_related.get(name)
+    if child_plan is None:
+        child_plan = _Plan(plan.model._meta.get_field(name).related_model)
+        plan.select_related[name] = child_plan
+    _require(child_plan, rest)
+
+
+def _get_lookups(plan, prefix=''):
+    """
+    :return: only, select_related and prefetch_related arguments
+    :rtype: tuple( list, list, list )
+    """
+    only = [prefix + name for name in plan.get_only()]
+    select_related = []
+    prefetch_related = []
+
+    for name, child_plan in plan.select_related.items():
+        select_related.append(prefix + name)
+        child_lookups = _get_lookups(child_plan, f'{prefix}{name}__')
+        only += child_lookups[0]
+        select_related += child_lookups[1]
+        prefetch_related += child_lookups[2]
+
+    for name, child_plan in plan.prefetch_related.items():
+        prefetch_related.append(Prefetch(
+            prefix + name,
+            queryset=_apply_plan(
+                child_plan.model._default_manager.all(), child_plan,
+            ),
+        ))
+
+    return only, select_related, prefetch_related
+
+
+def _apply_plan(queryset, plan):
+    only, select_related, prefetch_related = _get_lookups(plan)
+    queryset = queryset.only(*only)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+def optimize(queryset, info, *path, required=()):
+    """Load only the model fields, and related objects, selected under
+    the resolving field.
+
+    E.g. for `{ critiques { id resume { name } } }`,
+    `optimize(MatchedCritique.objects.all(), info)` is
+    `MatchedCritique.objects.only('id', 'critiquer', 'resume',
+    'resume__id', 'resume__name').select_related('resume')`.
+
+    :param queryset: of the objects the resolving field resolves to
+    :type queryset: django.db.models.QuerySet
+    :param path: names of nested fields to descend into, e.g. when the
+        objects are in a field of the resolved object
+    :type path: str
+    :param required: other model fields the resolver uses. Fields of
+        related models, e.g. resume__uploader, join them.
+    :type required: iterable( str )
+
+    :rtype: django.db.models.QuerySet
+    """
+    plan = _get_plan(
+        queryset.model,
+        get_selected_field_asts(info, *path),
+        info.fragments,
+    )
+    for lookup in required:
+        _require(plan, lookup)
+
+    return _apply_plan(queryset, plan)
@@ -3,6 +3,8 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.models import Q
 from graphene_django.types import DjangoObjectType
+from rezq.api.v1.loaders import load_related
+from rezq.api.v1.optimizer import optimize
 from rezq.models import CritiquerRequest
 from rezq.models import MatchedCritique
 from rezq.models import MatchedCritiqueComment
@@ -38,6 +40,9 @@ class CritiqueType(DjangoObjectType):
             'annotations', 'submitted', 'submitted_on',
         )
 
+    def resolve_resume(self, info):
+        return load_related(info, self, 'resume')
+
 
 class PublicCritiqueType(DjangoObjectType):
 
@@ -48,6 +53,9 @@ class PublicCritiqueType(DjangoObjectType):
             'annotations', 'submitted', 'submitted_on',
         )
 
+    def resolve_resume(self, info):
+        return load_related(info, self, 'resume')
+
 
 class CritiquerRequestType(DjangoObjectType):
 
@@ -71,6 +79,12 @@ class MatchedCritiqueCommentType(DjangoObjectType):
             'id', 'critique', 'user', 'comment',
         )
 
+    def resolve_critique(self, info):
+        return load_related(info, self, 'critique')
+
+    def resolve_user(self, info):
+        return load_related(info, self, 'user')
+
 
 class PublicMatchedCritiqueCommentType(DjangoObjectType):
 
@@ -80,6 +94,9 @@ class PublicMatchedCritiqueCommentType(DjangoObjectType):
             'id', 'critique',
         )
 
+    def resolve_critique(self, info):
+        return load_related(info, self, 'critique')
+
 
 class CritiqueQuery:
 
@@ -110,7 +127,7 @@ class CritiqueQuery:
 
     def resolve_critiques(self, info, **kwargs):
         if kwargs['is_critiquee'] == kwargs['is_critiquer']:
-            return MatchedCritique.objects.filter(
+            critiques = MatchedCritique.objects.filter(
                 Q(
                     critiquer=info.context.user,
                 ) | Q(
@@ -118,17 +135,25 @@ class CritiqueQuery:
                 ),
             )
         elif kwargs['is_critiquee']:
-            return MatchedCritique.objects.filter(
+            critiques = MatchedCritique.objects.filter(
                 resume__uploader=info.context.user,
             )
         else:
-            return MatchedCritique.objects.filter(
+            critiques = MatchedCritique.objects.filter(
                 critiquer=info.context.user,
             )
 
+        return optimize(critiques, info)
+
     def resolve_critique(self, info, **kwargs):
         try:
-            critique = MatchedCritique.objects.get(id=kwargs['id'])
+            critique = optimize(
+                MatchedCritique.objects.all(),
+                info,
+                required=(
+                    'submitted', 'critiquer__id', 'resume__uploader__id',
+                ),
+            ).get(id=kwargs['id'])
         except MatchedCritique.DoesNotExist:
             return None
 
@@ -1,6 +1,8 @@
 import graphene
 from django.core.exceptions import ValidationError
 from graphene_django.types import DjangoObjectType
+from rezq.api.v1.loaders import load_related
+from rezq.api.v1.optimizer import optimize
 from rezq.models import LinkedCritique
 from rezq.models import LinkedCritiqueComment
 from rezq.models import Resume
@@ -19,6 +21,12 @@ class LinkedCritiqueType(DjangoObjectType):
 
     token = graphene.String()
 
+    def resolve_resume(self, info):
+        return load_related(info, self, 'resume')
+
+    def resolve_critiquer(self, info):
+        return load_related(info, self, 'critiquer')
+
 
 class PublicLinkedCritiqueType(DjangoObjectType):
 
@@ -31,6 +39,12 @@ class PublicLinkedCritiqueType(DjangoObjectType):
 
     token = graphene.String()
 
+    def resolve_resume(self, info):
+        return load_related(info, self, 'resume')
+
+    def resolve_critiquer(self, info):
+        return load_related(info, self, 'critiquer')
+
 
 class LinkedCritiqueCommentType(DjangoObjectType):
 
@@ -40,6 +54,12 @@ class LinkedCritiqueCommentType(DjangoObjectType):
             'id', 'critique', 'user', 'comment',
         )
 
+    def resolve_critique(self, info):
+        return load_related(info, self, 'critique')
+
+    def resolve_user(self, info):
+        return load_related(info, self, 'user')
+
 
 class PublicLinkedCritiqueCommentType(DjangoObjectType):
 
@@ -49,6 +69,9 @@ class PublicLinkedCritiqueCommentType(DjangoObjectType):
             'id', 'critique',
         )
 
+    def resolve_critique(self, info):
+        return load_related(info, self, 'critique')
+
 
 class LinkedCritiqueQuery:
 
@@ -59,7 +82,9 @@ class LinkedCritiqueQuery:
 
     def resolve_linked_critique(self, info, **kwargs):
         try:
-            return LinkedCritique.objects.get_by_token(kwargs['token'])
+            return optimize(
+                LinkedCritique.objects.all(), info,
+            ).get_by_token(kwargs['token'])
         except LinkedCritique.DoesNotExist:
             return None
 
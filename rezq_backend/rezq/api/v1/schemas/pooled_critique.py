@@ -3,6 +3,11 @@ import logging
 import graphene
 from django.core.exceptions import ValidationError
 from graphene_django.types import DjangoObjectType
+from rezq.api.v1.loaders import load_related
+from rezq.api.v1.loaders import load_related_set
+from rezq.api.v1.loaders import load_upvotes
+from rezq.api.v1.loaders import load_user_upvoted
+from rezq.api.v1.optimizer import optimize
 from rezq.models import PooledCritique
 from rezq.models import PooledCritiqueComment
 from rezq.models import PooledCritiqueVote
@@ -29,6 +34,21 @@ class PooledCritiqueType(DjangoObjectType):
     upvotes = graphene.Int()
     user_upvoted = graphene.Boolean()
 
+    def resolve_resume(self, info):
+        return load_related(info, self, 'resume')
+
+    def resolve_critiquer(self, info):
+        return load_related(info, self, 'critiquer')
+
+    def resolve_pooledcritiquecomment_set(self, info):
+        return load_related_set(info, self, 'pooledcritiquecomment_set')
+
+    def resolve_upvotes(self, info):
+        return load_upvotes(info, self)
+
+    def resolve_user_upvoted(self, info):
+        return load_user_upvoted(info, self)
+
 
 class PublicPooledCritiqueType(DjangoObjectType):
 
@@ -43,6 +63,21 @@ class PublicPooledCritiqueType(DjangoObjectType):
     upvotes = graphene.Int()
     user_upvoted = graphene.Boolean()
 
+    def resolve_resume(self, info):
+        return load_related(info, self, 'resume')
+
+    def resolve_critiquer(self, info):
+        return load_related(info, self, 'critiquer')
+
+    def resolve_pooledcritiquecomment_set(self, info):
+        return load_related_set(info, self, 'pooledcritiquecomment_set')
+
+    def resolve_upvotes(self, info):
+        return load_upvotes(info, self)
+
+    def resolve_user_upvoted(self, info):
+        return load_user_upvoted(info, self)
+
 
 class PooledCritiqueCommentType(DjangoObjectType):
 
@@ -52,6 +87,12 @@ class PooledCritiqueCommentType(DjangoObjectType):
             'id', 'critique', 'user', 'comment', 'created_on',
         )
 
+    def resolve_critique(self, info):
+        return load_related(info, self, 'critique')
+
+    def resolve_user(self, info):
+        return load_related(info, self, 'user')
+
 
 class PublicPooledCritiqueCommentType(DjangoObjectType):
 
@@ -61,6 +102,12 @@ class PublicPooledCritiqueCommentType(DjangoObjectType):
             'id', 'critique', 'user', 'comment', 'created_on',
         )
 
+    def resolve_critique(self, info):
+        return load_related(info, self, 'critique')
+
+    def resolve_user(self, info):
+        return load_related(info, self, 'user')
+
 
 class PooledCritiqueQuery:
 
@@ -72,7 +119,14 @@ class PooledCritiqueQuery:
 
     def resolve_pooled_critique(self, info, **kwargs):
         try:
-            critique = PooledCritique.objects.get(id=kwargs['id'])
+            critique = optimize(
+                PooledCritique.objects.all(),
+                info,
+                required=(
+                    'critiquer__id', 'submitted', 'resume__pool__id',
+                    'resume__uploader__id',
+                ),
+            ).get(id=kwargs['id'])
         except PooledCritique.DoesNotExist:
             return None
 
@@ -7,6 +7,8 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.utils import IntegrityError
 from graphene_django.types import DjangoObjectType
+from rezq.api.v1.loaders import load_related_set
+from rezq.api.v1.optimizer import optimize
 from rezq.lib import cas
 from rezq.lib import facebook
 from rezq.lib import google
@@ -171,6 +173,15 @@ class ProfileType(DjangoObjectType):
     avatar_upload_info = graphene.types.json.JSONString()
     institutions = graphene.List(graphene.String)
 
+    def resolve_matchedcritique_set(self, info):
+        return load_related_set(info, self, 'matchedcritique_set')
+
+    def resolve_pooledcritique_set(self, info):
+        return load_related_set(info, self, 'pooledcritique_set')
+
+    def resolve_linkedcritique_set(self, info):
+        return load_related_set(info, self, 'linkedcritique_set')
+
 
 class PublicProfileType(DjangoObjectType):
 
@@ -184,6 +195,9 @@ class PublicProfileType(DjangoObjectType):
 
     avatar_download_url = graphene.String()
 
+    def resolve_pooledcritique_set(self, info):
+        return load_related_set(info, self, 'pooledcritique_set')
+
 
 class ProfileQuery:
 
@@ -202,7 +216,9 @@ class ProfileQueryPublic:
 
     def resolve_profile(self, info, **kwargs):
         try:
-            return User.objects.get(username=kwargs['username'].lower())
+            return optimize(User.objects.all(), info).get(
+                username=kwargs['username'].lower(),
+            )
         except User.DoesNotExist:
             return None
 
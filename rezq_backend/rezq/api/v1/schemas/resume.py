@@ -1,21 +1,35 @@
+import base64
+import binascii
+import hashlib
 import logging
-import operator
-from functools import reduce
+from uuid import UUID
 
 import graphene
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import connection
 from django.db import transaction
+from django.db.models import F
 from django.db.models import Q
+from django.utils.dateparse import parse_datetime
 from graphene_django.types import DjangoObjectType
+from rezq.api.query_cost import get_page_size
+from rezq.api.v1.loaders import load_related
+from rezq.api.v1.loaders import load_related_set
+from rezq.api.v1.optimizer import optimize
+from rezq.lib.s3 import S3
 from rezq.models import Pool
 from rezq.models import Resume
 from rezq.models import User
+from rezq.utils.industry import get_industries_bitmask
 from rezq.utils.patch_model import patch_model
 from rezq.utils.request import get_client_info_str
+from rezq.utils.selections import get_selected_fields
 from server.constants import DOMAIN_REGEX
+from server.constants import INDUSTRIES
 from server.constants import MAX_RESUMES
+from server.constants import POOLED_RESUMES_COUNT_CACHE_SECONDS
 from server.constants import PUBLIC
 
 
@@ -23,8 +37,6 @@ logger = logging.getLogger(__name__)
 
 
 if settings.DEBUG:
-    from uuid import UUID
-
     def _parse_pooled_critiques_user_upvoted_rows(rows):
         return {
             str(UUID(uuid)): user_upvoted
@@ -82,6 +94,31 @@ def _should_get_pooled_critiques_user_upvoted(info):
     return False
 
 
+def _prefetch_download_urls(info, resumes, *path):
+    """Get the selected download urls of a list of resumes in one batch,
+    so resolving each one is a cache hit.
+
+    :param path: field names from the resolving field to the resumes
+    :type path: str
+    """
+    fields = get_selected_fields(info, *path)
+    avatar_fields = get_selected_fields(info, *path, 'uploader')
+
+    bucket_keys = []
+    for resume in resumes:
+        if 'downloadUrl' in fields:
+            bucket_keys.append((settings.S3_RESUME_BUCKET, f'{resume.id}.pdf'))
+        if 'thumbnailDownloadUrl' in fields:
+            bucket_keys.append((settings.S3_RESUME_BUCKET, f'{resume.id}.jpg'))
+        if 'avatarDownloadUrl' in avatar_fields and resume.uploader_id:
+            bucket_keys.append(
+                (settings.S3_AVATAR_BUCKET, f'{resume.uploader_id}.png'),
+            )
+
+    if bucket_keys:
+        S3.get_download_urls(bucket_keys)
+
+
 class PoolType(DjangoObjectType):
 
     class Meta:
@@ -98,6 +135,9 @@ class ResumeType(DjangoObjectType):
             'notes_for_critiquer', 'link_enabled', 'pool',
             'created_on', 'matchedcritique_set',
             'linkedcritique_set', 'pooledcritique_set',
+            'matchedcritique_count', 'matchedcritique_submitted_count',
+            'linkedcritique_count', 'linkedcritique_submitted_count',
+            'pooledcritique_count', 'pooledcritique_submitted_count',
         )
 
     token = graphene.String()
@@ -106,6 +146,21 @@ class ResumeType(DjangoObjectType):
     user_is_premium = graphene.Boolean()
     pooled_critiques_user_upvoted = graphene.types.json.JSONString()
 
+    def resolve_uploader(self, info):
+        return load_related(info, self, 'uploader')
+
+    def resolve_pool(self, info):
+        return load_related(info, self, 'pool')
+
+    def resolve_matchedcritique_set(self, info):
+        return load_related_set(info, self, 'matchedcritique_set')
+
+    def resolve_linkedcritique_set(self, info):
+        return load_related_set(info, self, 'linkedcritique_set')
+
+    def resolve_pooledcritique_set(self, info):
+        return load_related_set(info, self, 'pooledcritique_set')
+
 
 class PublicResumeType(DjangoObjectType):
 
@@ -114,7 +169,8 @@ class PublicResumeType(DjangoObjectType):
         only_fields = (
             'id', 'uploader', 'name', 'description', 'industries',
             'notes_for_critiquer', 'pool', 'created_on',
-            'pooledcritique_set',
+            'pooledcritique_set', 'pooledcritique_count',
+            'pooledcritique_submitted_count',
         )
 
     token = graphene.String()
@@ -122,11 +178,99 @@ class PublicResumeType(DjangoObjectType):
     thumbnail_download_url = graphene.String()
     pooled_critiques_user_upvoted = graphene.types.json.JSONString()
 
+    def resolve_uploader(self, info):
+        return load_related(info, self, 'uploader')
+
+    def resolve_pool(self, info):
+        return load_related(info, self, 'pool')
+
+    def resolve_pooledcritique_set(self, info):
+        return load_related_set(info, self, 'pooledcritique_set')
+
 
 class PublicResumeTypeWithCount(graphene.ObjectType):
 
     resumes = graphene.List(PublicResumeType)
     total_count = graphene.Int()
+    end_cursor = graphene.String()
+    has_next_page = graphene.Boolean()
+
+    def resolve_total_count(self, info):
+        """Only counted when selected, and cached briefly since it
+        doesn't change between pages.
+        """
+        if self.filtered_resumes.query.is_empty():
+            return 0
+
+        cache_key = 'prc:' + hashlib.md5(
+            repr(self.count_filters).encode(),
+        ).hexdigest()
+        total_count = cache.get(cache_key)
+        if total_count is not None:
+            return total_count
+
+        total_count = self.filtered_resumes.count()
+
+        cache.set(cache_key, total_count, POOLED_RESUMES_COUNT_CACHE_SECONDS)
+
+        return total_count
+
+
+def _encode_resume_cursor(resume):
+    return base64.urlsafe_b64encode(
+        f'{resume.created_on.isoformat()}|{resume.id}'.encode(),
+    ).decode()
+
+
+def _decode_resume_cursor(cursor):
+    """
+    :raises ValueError: on invalid cursor
+    """
+    try:
+        created_on, id = base64.urlsafe_b64decode(
+            cursor.encode(),
+        ).decode().split('|')
+        created_on = parse_datetime(created_on)
+        id = UUID(id)
+    except (binascii.Error, UnicodeDecodeError, TypeError) as e:
+        raise ValueError(str(e))
+
+    if created_on is None:
+        raise ValueError(f'Invalid cursor: {cursor}')
+
+    return created_on, id
+
+
+def _empty_pooled_resumes_page():
+    return _pooled_resumes_page(Resume.objects.none(), Resume.objects.none())
+
+
+def _pooled_resumes_page(
+    filtered_resumes, resumes, first=None, count_filters=None,
+):
+    """Fetches one extra resume to know if there is a next page.
+
+    :param count_filters: the filters of filtered_resumes, normalized, to
+        cache its count by
+    :type count_filters: tuple
+    """
+    if first is None:
+        resumes = list(resumes)
+        has_next_page = False
+    else:
+        resumes = list(resumes[:first + 1])
+        has_next_page = len(resumes) > first
+        resumes = resumes[:first]
+
+    page = PublicResumeTypeWithCount(
+        resumes=resumes,
+        end_cursor=_encode_resume_cursor(resumes[-1]) if resumes else None,
+        has_next_page=has_next_page,
+    )
+    page.filtered_resumes = filtered_resumes
+    page.count_filters = count_filters
+
+    return page
 
 
 class ResumeQuery:
@@ -139,13 +283,23 @@ class ResumeQuery:
     )
 
     def resolve_resumes(self, info, **kwargs):
-        return Resume.objects.filter(
-            uploader=info.context.user,
-        ).order_by('-created_on')
+        resumes = list(optimize(
+            Resume.objects.filter(
+                uploader=info.context.user,
+            ).order_by('-created_on'),
+            info,
+            required=('uploader',),
+        ))
+
+        _prefetch_download_urls(info, resumes)
+
+        return resumes
 
     def resolve_resume(self, info, **kwargs):
         try:
-            resume = Resume.objects.get(id=kwargs['id'])
+            resume = optimize(
+                Resume.objects.all(), info, required=('uploader__id',),
+            ).get(id=kwargs['id'])
         except Resume.DoesNotExist:
             return None
 
@@ -186,6 +340,7 @@ class ResumeQueryPublic:
         industries=graphene.String(required=False),
         first=graphene.Int(required=False),
         offset=graphene.Int(required=False),
+        after=graphene.String(required=False),
         private_pool=graphene.String(required=False),
     )
 
@@ -197,7 +352,9 @@ class ResumeQueryPublic:
 
     def resolve_resume(self, info, **kwargs):
         try:
-            resume = Resume.objects.get_by_token(kwargs['token'])
+            resume = optimize(
+                Resume.objects.all(), info,
+            ).get_by_token(kwargs['token'])
         except Resume.DoesNotExist:
             return None
 
@@ -210,90 +367,108 @@ class ResumeQueryPublic:
     def resolve_pooled_resumes(self, info, **kwargs):
         """
         If a page size is n resumes, then the client would pass in
-        first = n and offset = pagenumber * n
+        first = n and after = the previous page's endCursor. Pages have
+        at most MAX_PAGE_SIZE resumes. Without first, every resume is
+        returned.
+
+        offset = pagenumber * n still works, but deep pages are slow.
         """
         # if user is logged in, else None
         user = info.context.user
         user = user if type(user) is User else None
 
-        querys = []
+        resumes = Resume.objects.all()
+        industries_bitmask = 0
 
         if kwargs.get('industries', '') != '':
-            industries = kwargs['industries'].split(',')
-
-            querys.append(
-                reduce(
-                    operator.and_, (
-                        Q(industries__contains=industry)
-                        for industry in industries
-                    ),
+            if set(kwargs['industries'].split(',')) - INDUSTRIES:
+                # No resume can have an unknown industry
+                return _empty_pooled_resumes_page()
+
+            # Resumes with all of the industries
+            industries_bitmask = get_industries_bitmask(kwargs['industries'])
+            resumes = resumes.annotate(
+                industries_match=F('industries_bitmask').bitand(
+                    industries_bitmask,
                 ),
-            )
+            ).filter(industries_match=industries_bitmask)
 
         if kwargs.get('private_pool'):
             if DOMAIN_REGEX.match(kwargs['private_pool']):
                 # This guy is trying to hack institution pools!
-                return []
+                return _empty_pooled_resumes_page()
 
-            resumes = Resume.objects.filter(
-                *querys,
-                pool=kwargs['private_pool'],
-            )
+            pools = {kwargs['private_pool']}
         elif user:
             pools = user.institutions
             pools.add(PUBLIC)
-            resumes = Resume.objects.filter(
-                *querys,
-                pool__in=pools,
-            )
         else:
-            resumes = Resume.objects.filter(
-                *querys,
-                pool=PUBLIC,
-            )
+            pools = {PUBLIC}
+        resumes = resumes.filter(pool__in=pools)
+
+        # Matches the (pool, -created_on, id) index
+        filtered_resumes = resumes
+        resumes = resumes.order_by('-created_on', 'id')
+
+        # Keyset pagination: resumes after the cursor's resume
+        if kwargs.get('after'):
+            try:
+                created_on, id = _decode_resume_cursor(kwargs['after'])
+            except ValueError:
+                return _empty_pooled_resumes_page()
 
-        resumes = resumes.order_by('-created_on')
+            resumes = resumes.filter(
+                Q(created_on__lt=created_on) |
+                Q(created_on=created_on, id__gt=id),
+            )
 
-        total_count = resumes.count()
+        resumes = optimize(
+            resumes, info, 'resumes', required=('created_on', 'uploader'),
+        )
 
         # Move cursor to the m'th resume. The offset occurs first.
         if 'offset' in kwargs:
             resumes = resumes[kwargs['offset']:]
 
         # Return the first n items after some offset. This is our batch size.
-        if 'first' in kwargs:
-            resumes = resumes[:kwargs['first']]
+        page = _pooled_resumes_page(
+            filtered_resumes,
+            resumes,
+            get_page_size(kwargs.get('first')),
+            count_filters=(industries_bitmask, tuple(sorted(pools))),
+        )
 
         logger.info(
             '%s accessed resumes: %s',
             get_client_info_str(info.context),
-            str([str(r.id) for r in resumes]),
+            str([str(r.id) for r in page.resumes]),
         )
 
-        return PublicResumeTypeWithCount(
-            resumes=resumes,
-            total_count=total_count,
-        )
+        _prefetch_download_urls(info, page.resumes, 'resumes')
+
+        return page
 
     def resolve_pooled_resume(self, info, **kwargs):
         # if user is logged in, else None
         user = info.context.user
         user = user if type(user) is User else None
 
+        resumes = optimize(Resume.objects.all(), info)
+
         try:
             if kwargs.get('private_pool'):
                 if DOMAIN_REGEX.match(kwargs['private_pool']):
                     # This guy is trying to hack institution pools!
                     return None
-                resume = Resume.objects.get(
+                resume = resumes.get(
                     id=kwargs['id'], pool=kwargs['private_pool'],
                 )
             elif user:
                 pools = user.institutions
                 pools.add(PUBLIC)
-                resume = Resume.objects.get(id=kwargs['id'], pool__in=pools)
+                resume = resumes.get(id=kwargs['id'], pool__in=pools)
             else:
-                resume = Resume.objects.get(id=kwargs['id'], pool=PUBLIC)
+                resume = resumes.get(id=kwargs['id'], pool=PUBLIC)
         except Resume.DoesNotExist:
             return None
 
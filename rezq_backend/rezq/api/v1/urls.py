@@ -1,8 +1,7 @@
 from django.conf import settings
 from django.urls import path
 from django.views.decorators.csrf import csrf_exempt
-from rezq.api.v1.middleware import QueryDepthMiddleware
-from rezq.api.v1.middleware import QueryTimeoutMiddleware
+from rezq.api.profiling import ProfilingMiddleware
 from rezq.api.v1.schema import private_schema
 from rezq.api.v1.schema import public_schema
 from rezq.api.views import PrivateGraphQLView
@@ -16,7 +15,7 @@ urlpatterns = [
             PublicGraphQLView.as_view(
                 graphiql=settings.DEBUG,
                 schema=public_schema,
-                middleware=[QueryTimeoutMiddleware, QueryDepthMiddleware],
+                middleware=[ProfilingMiddleware],
             ),
         ),
     ),
@@ -25,7 +24,7 @@ urlpatterns = [
         PrivateGraphQLView.as_view(
             graphiql=settings.DEBUG,
             schema=private_schema,
-            middleware=[QueryTimeoutMiddleware, QueryDepthMiddleware],
+            middleware=[ProfilingMiddleware],
         ),
     ),
 ]
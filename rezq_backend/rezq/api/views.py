@@ -1,11 +1,263 @@
+import threading
+from collections import OrderedDict
+from hashlib import sha1
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.http import HttpResponseBadRequest
+from django.http import HttpResponseForbidden
+from django.http import JsonResponse
+from django.views import View
 from graphene_django.views import GraphQLView
+from graphene_django.views import HttpError
+from graphql import GraphQLError
+from graphql import parse
+from graphql import validate
+from graphql.backend import GraphQLCoreBackend
+from graphql.backend import GraphQLDocument
+from graphql.execution import execute
+from graphql.execution import ExecutionResult
+from graphql.validation.rules import specified_rules
+from rezq.api.profiling import metrics
+from rezq.api.profiling import profile_operation
+from rezq.api.query_cost import get_cost_variable_names
+from rezq.api.query_cost import get_page_size
+from rezq.api.query_cost import get_query_cost
+from rezq.api.query_cost import MAX_QUERY_COST
+from rezq.api.query_cost import QUERY_COST_EXCEEDED
+from rezq.api.query_depth import QueryDepthRule
 from rezq.mixins import AuthMixin
 from rezq.mixins import PublicRatelimitMixin
+from rezq.utils.persisted_query import PersistedQueryNotFound
+from rezq.utils.persisted_query import resolve_persisted_query
+from rezq.utils.query_counter import QUERY_COUNT_HEADER
+from rezq.utils.query_counter import REPEATED_QUERIES_HEADER
+from rezq.utils.request import get_parsed_gql_request
+
+
+DOCUMENT_CACHE_SIZE = 256
+# Costs remembered per document
+COST_CACHE_SIZE = 16
+
+VALIDATION_RULES = specified_rules + [QueryDepthRule]
+
+
+class CachedDocument(GraphQLDocument):
+    """A parsed and validated document, that also remembers its costs.
+
+    The cost only depends on the operation and the page sizes of the
+    `first` variables, so it's worked out once for each of those, for the
+    last few used.
+    """
+
+    def __init__(self, schema, document_string, document_ast, **kwargs):
+        super().__init__(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=self._execute,
+        )
+        self.execute_params = kwargs
+        self.validation_errors = validate(
+            schema, document_ast, VALIDATION_RULES,
+        )
+        self.cost_variable_names = get_cost_variable_names(document_ast)
+        self._costs = OrderedDict()
+        self._costs_lock = threading.Lock()
+
+    def get_cost(self, operation_name=None, variables=None):
+        variables = variables or {}
+        key = (operation_name, tuple(
+            (name, get_page_size(variables.get(name)))
+            for name in sorted(self.cost_variable_names)
+        ))
+
+        with self._costs_lock:
+            cost = self._costs.get(key)
+            if cost is not None:
+                self._costs.move_to_end(key)
+                return cost
+
+        cost = get_query_cost(
+            self.schema, self.document_ast, operation_name, variables,
+        )
+
+        with self._costs_lock:
+            self._costs[key] = cost
+            if len(self._costs) > COST_CACHE_SIZE:
+                self._costs.popitem(last=False)
+
+        return cost
+
+    def _execute(self, *args, **kwargs):
+        if self.validation_errors:
+            return ExecutionResult(errors=self.validation_errors, invalid=True)
+
+        if self.get_cost(
+            kwargs.get('operation_name'), kwargs.get('variables'),
+        ) > MAX_QUERY_COST:
+            return ExecutionResult(
+                errors=[GraphQLError(QUERY_COST_EXCEEDED)], invalid=True,
+            )
+
+        kwargs.pop('validate', None)
+        return execute(
+            self.schema,
+            self.document_ast,
+            *args,
+            **dict(self.execute_params, **kwargs)
+        )
+
+
+class CachedDocumentBackend(GraphQLCoreBackend):
+    """Parses, validates and costs each distinct document once per schema.
+
+    Documents are kept in an LRU keyed by schema and document hash,
+    invalid ones included, since our clients only send a few dozen
+    distinct documents. Syntax errors aren't cached.
+    """
+
+    def __init__(self, max_size=DOCUMENT_CACHE_SIZE, executor=None):
+        super().__init__(executor=executor)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    def document_from_string(self, schema, document_string):
+        key = (schema, sha1(document_string.encode('utf-8')).hexdigest())
+
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                self.hits += 1
+                return document
+
+            self.misses += 1
+
+        document = CachedDocument(
+            schema,
+            document_string,
+            parse(document_string),
+            **self.execute_params
+        )
 
+        with self._lock:
+            self._documents[key] = document
+            if len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
 
-class PublicGraphQLView(PublicRatelimitMixin, GraphQLView):
+        return document
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+
+# Shared by both views; keyed by schema
+document_backend = CachedDocumentBackend()
+
+
+class CachedDocumentGraphQLView(GraphQLView):
+    """Also serves automatic persisted queries
+    """
+
+    def get_backend(self, request):
+        return document_backend
+
+    def dispatch(self, request, *args, **kwargs):
+        response = super().dispatch(request, *args, **kwargs)
+
+        # For query budgets in tests/system
+        profile = getattr(request, 'gql_profile', None)
+        if settings.DEBUG and profile is not None:
+            response[QUERY_COUNT_HEADER] = profile.db_queries
+            response[REPEATED_QUERIES_HEADER] = len(
+                profile.queries.get_repeated_queries(),
+            )
+
+        return response
+
+    def parse_body(self, request):
+        """Reuse the body the mixins already decoded
+        """
+        if (
+            not self.batch and
+            self.get_content_type(request) == 'application/json'
+        ):
+            data = get_parsed_gql_request(request).data
+            if data is not None:
+                return data
+
+        # Let graphene_django handle other content types, and errors
+        return super().parse_body(request)
+
+    def get_graphql_params(self, request, data):
+        query, variables, operation_name, id = super().get_graphql_params(
+            request, data,
+        )
+
+        try:
+            persisted_query = resolve_persisted_query(
+                request.GET.get('extensions') or data.get('extensions'),
+                query,
+            )
+        except PersistedQueryNotFound as e:
+            # Apollo clients expect a 200 to know to resend the query
+            raise HttpError(HttpResponse(), str(e))
+        except ValueError as e:
+            raise HttpError(HttpResponseBadRequest(str(e)))
+
+        if persisted_query is not None:
+            query = persisted_query.query
+
+        return query, variables, operation_name, id
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, *args,
+        **kwargs
+    ):
+        if not query:
+            return super().execute_graphql_request(
+                request, data, query, variables, operation_name, *args,
+                **kwargs
+            )
+
+        with profile_operation(request, operation_name, variables):
+            return super().execute_graphql_request(
+                request, data, query, variables, operation_name, *args,
+                **kwargs
+            )
+
+
+class PublicGraphQLView(PublicRatelimitMixin, CachedDocumentGraphQLView):
     pass
 
 
-class PrivateGraphQLView(AuthMixin, GraphQLView):
+class PrivateGraphQLView(AuthMixin, CachedDocumentGraphQLView):
     pass
+
+
+class MetricsView(View):
+    """GraphQL latency histograms and cache hit rates of this process,
+    for staff who logged in with two-factor auth
+    """
+
+    def get(self, request):
+        # What django_otp's user.is_verified() checks. User.is_verified is
+        # whether their email is verified, which OTPMiddleware shadows.
+        if (
+            not request.user.is_staff or
+            getattr(request.user, 'otp_device', None) is None
+        ):
+            return HttpResponseForbidden()
+
+        return JsonResponse(dict(
+            metrics.to_dict(),
+            document_cache={
+                'hits': document_backend.hits,
+                'misses': document_backend.misses,
+            },
+        ))
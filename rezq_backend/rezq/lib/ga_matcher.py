@@ -2,8 +2,8 @@ import logging
 import random
 from copy import deepcopy
 from difflib import SequenceMatcher
-from functools import lru_cache
 
+import numpy as np
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -134,6 +134,171 @@ def mut_shuffle_indexes(individual, indpb):
     return individual
 
 
+def _get_candidate_arrays(
+    candidates, now_ts, industries_codes, user_codes, no_user_code,
+):
+    """Columns of a list of MatchCandidate (or None padding) as arrays
+    """
+    present = np.array([c is not None for c in candidates], dtype=bool)
+
+    ages = np.array([
+        now_ts - c.created_ts if c is not None else 0.0
+        for c in candidates
+    ], dtype=float)
+
+    industries = np.array([
+        industries_codes.setdefault(
+            c.industries if c is not None else '', len(industries_codes),
+        )
+        for c in candidates
+    ], dtype=int)
+
+    users = np.array([
+        user_codes.setdefault(c.user_id, len(user_codes))
+        if c is not None and c.user_id is not None else no_user_code
+        for c in candidates
+    ], dtype=int)
+
+    waterloo = np.array([
+        c is not None and c.is_waterloo for c in candidates
+    ], dtype=bool)
+
+    return present, ages, industries, users, waterloo
+
+
+def get_fitness_matrix(matched_critiques_list, critiquer_requests_list):
+    """Precompute the fitness of every pair of matched_critique and
+    critiquer_request
+
+    Either list may be padded with None. Entry [i][j] is the fitness of
+    pairing matched_critiques_list[i] with critiquer_requests_list[j],
+    and is 0.0 if totally incompatibile => will not match no matter what.
+
+    :param matched_critiques_list: matched critique candidates
+    :type matched_critiques_list: list( MatchCandidate )
+    :param critiquer_requests_list: critiquer request candidates
+    :type critiquer_requests_list: list( MatchCandidate )
+
+    :return: m x n matrix of pair fitnesses
+    :rtype: numpy.ndarray
+    """
+    # The current time in seconds since epoch
+    now_ts = timezone.now().timestamp()
+
+    def similarity_ratio_of(industries1, industries2):
+        """How "similar" are comma delimited industries? Order matters.
+        """
+        return SequenceMatcher(
+            None, industries1.split(','), industries2.split(','),
+        ).ratio()
+
+    # Integer codes so that pairs can be compared with array operations
+    matched_critique_industries_codes = {}
+    critiquer_request_industries_codes = {}
+    user_codes = {}
+
+    (
+        matched_critique_present,
+        matched_critique_ages,
+        matched_critique_industries,
+        matched_critique_uploaders,
+        matched_critique_waterloo,
+    ) = _get_candidate_arrays(
+        matched_critiques_list,
+        now_ts,
+        matched_critique_industries_codes,
+        user_codes,
+        -1,
+    )
+
+    (
+        critiquer_request_present,
+        critiquer_request_ages,
+        critiquer_request_industries,
+        critiquer_request_critiquers,
+        critiquer_request_waterloo,
+    ) = _get_candidate_arrays(
+        critiquer_requests_list,
+        now_ts,
+        critiquer_request_industries_codes,
+        user_codes,
+        -2,
+    )
+
+    # How similar are the industries?
+    # Only computed once for each distinct pair of industries
+    matched_critique_industries_list = sorted(
+        matched_critique_industries_codes,
+        key=matched_critique_industries_codes.get,
+    )
+    critiquer_request_industries_list = sorted(
+        critiquer_request_industries_codes,
+        key=critiquer_request_industries_codes.get,
+    )
+    similarity_ratios = np.array([
+        [
+            similarity_ratio_of(i1, i2)
+            for i2 in critiquer_request_industries_list
+        ]
+        for i1 in matched_critique_industries_list
+    ]).reshape(
+        len(matched_critique_industries_list),
+        len(critiquer_request_industries_list),
+    )
+    fitness_matrix = similarity_ratios[np.ix_(
+        matched_critique_industries, critiquer_request_industries,
+    )]
+
+    # How old are these requests?
+    fitness_matrix *= np.add.outer(
+        matched_critique_ages, critiquer_request_ages,
+    )
+
+    # Waterloo multipliers
+
+    # If critiquee is a waterloo student
+    fitness_matrix *= np.where(matched_critique_waterloo, 1.2, 1.0)[:, None]
+
+    # If both people are waterloo students
+    fitness_matrix *= np.where(
+        np.logical_and.outer(
+            matched_critique_waterloo, critiquer_request_waterloo,
+        ),
+        1.2,
+        1.0,
+    )
+
+    # Don't critique your own resume
+    fitness_matrix[np.equal.outer(
+        matched_critique_uploaders, critiquer_request_critiquers,
+    )] = 0.0
+
+    # no-op's have no fitness
+    fitness_matrix[~matched_critique_present, :] = 0.0
+    fitness_matrix[:, ~critiquer_request_present] = 0.0
+
+    return fitness_matrix
+
+
+def get_population_fitness(fitness_matrix, population):
+    """Sums the fitness of each matching made by each individual solution
+
+    :param fitness_matrix: from get_fitness_matrix()
+    :type fitness_matrix: numpy.ndarray
+    :param population: individual encodings
+    :type population: list( tuple( int ) )
+
+    :return: fitness of each individual
+    :rtype: list( float )
+    """
+    encodings = np.array(population, dtype=int).reshape(
+        len(population), fitness_matrix.shape[0],
+    )
+    return fitness_matrix[
+        np.arange(fitness_matrix.shape[0]), encodings,
+    ].sum(axis=1).tolist()
+
+
 def get_matchings(matched_critiques, critiquer_requests):
     """Match critiques to critiquers using permutation genetic algorithm
 
@@ -150,6 +315,14 @@ def get_matchings(matched_critiques, critiquer_requests):
 
     Inspired by:
     http://www.iaeng.org/IJAM/issues_v36/issue_1/IJAM_36_1_7.pdf
+
+    :param matched_critiques: matched critique candidates
+    :type matched_critiques: list( MatchCandidate )
+    :param critiquer_requests: critiquer request candidates
+    :type critiquer_requests: list( MatchCandidate )
+
+    :return: pairs of matched critique and critiquer request candidates
+    :rtype: list( tuple( MatchCandidate, MatchCandidate ) )
     """
     matched_critiques_list = list(matched_critiques)
     critiquer_requests_list = list(critiquer_requests)
@@ -170,86 +343,14 @@ def get_matchings(matched_critiques, critiquer_requests):
             len(matched_critiques_list) - len(critiquer_requests_list)
         )
 
-    # The current time in seconds since epoch
-    now_ts = timezone.now().timestamp()
-
-    @lru_cache()
-    def similarity_ratio_of(l1, l2):
-        """How "similar" are sequences l1 and l2? Order matters.
-        """
-        return SequenceMatcher(None, l1, l2).ratio()
-
-    @lru_cache()
-    def industries_string_to_tuple(industries):
-        return tuple(industries.split(','))
-
-    @lru_cache()
-    def get_pair_fitness(matched_critique_idx, critiquer_request_idx):
-        """Get the fitness of a single pair of matched_critique and
-        critiquer_request
-
-        Returns 0.0 if totally incompatibile => will not match no matter what
-        """
-        matched_critique = matched_critiques_list[matched_critique_idx]
-        critiquer_request = critiquer_requests_list[critiquer_request_idx]
-
-        # no-op's have no fitness
-        if matched_critique is None or critiquer_request is None:
-            return 0.0
-
-        # Don't critique your own resume
-        if matched_critique.resume.uploader == critiquer_request.critiquer:
-            return 0.0
-
-        # How similar are the industries?
-        similarity_ratio = similarity_ratio_of(
-            industries_string_to_tuple(matched_critique.resume.industries),
-            industries_string_to_tuple(critiquer_request.industries),
-        )
-
-        # How old are these requests?
-        matched_critique_age = (
-            now_ts - matched_critique.created_on.timestamp()
-        )
-        critiquer_request_age = (
-            now_ts - critiquer_request.created_on.timestamp()
-        )
-
-        # Waterloo multipliers
-        waterloo_critiquee = 1.0
-        waterloo_both = 1.0
-
-        # If critiquee is a waterloo student
-        if matched_critique.resume.uploader.waterloo_id is not None:
-            waterloo_critiquee = 1.2
-
-            # If both people are waterloo students
-            if critiquer_request.critiquer.waterloo_id is not None:
-                waterloo_both = 1.2
-
-        return similarity_ratio * (
-            matched_critique_age + critiquer_request_age
-        ) * waterloo_critiquee * waterloo_both
-
-    @lru_cache()
-    def get_individual_fitness(individual):
-        """Sums the fitness of each matching made by this individual solution
-        """
-        fitness = 0.0
-        for matched_critique_idx in range(len(individual)):
-            critiquer_request_idx = individual[matched_critique_idx]
-            fitness += get_pair_fitness(
-                matched_critique_idx, critiquer_request_idx,
-            )
-
-        return fitness
+    fitness_matrix = get_fitness_matrix(
+        matched_critiques_list, critiquer_requests_list,
+    )
 
     if len(matched_critiques_list) == len(critiquer_requests_list) == 1:
         logger.info('Only matching 1 to 1. Not going to run GA.')
-        individual = (0,)
 
-        fitness = get_individual_fitness(individual)
-        if fitness != 0.0:
+        if fitness_matrix[0, 0] != 0.0:
             logger.info('Successful match when matching 1 to 1.')
             return [(matched_critiques_list[0], critiquer_requests_list[0])]
         else:
@@ -260,21 +361,21 @@ def get_matchings(matched_critiques, critiquer_requests):
     # List[ individual( encoding( int ), fitness ) ]
     population = []
 
-    # Best solution so far
-    #      tuple(    tuple( int ), float   )
-    # individual( encoding( int ), fitness )
-    best_so_far = None
-
     # Initial population
     for i in range(POPULATION_SIZE):
         # Randomly shuffles indices
         individual = list(range(len(matched_critiques_list)))
         random.shuffle(individual)
-        individual = tuple(individual)
-        population.append((individual, get_individual_fitness(individual)))
+        population.append(tuple(individual))
 
-        if best_so_far is None or population[i][1] > best_so_far[1]:
-            best_so_far = population[i]
+    population = list(zip(
+        population, get_population_fitness(fitness_matrix, population),
+    ))
+
+    # Best solution so far
+    #      tuple(    tuple( int ), float   )
+    # individual( encoding( int ), fitness )
+    best_so_far = max(population, key=lambda x: x[1])
 
     for gen_num in range(MAX_GENERATIONS):
         logger.info(
@@ -283,14 +384,13 @@ def get_matchings(matched_critiques, critiquer_requests):
 
         random.shuffle(population)
 
-        # Elitist
-        children = [deepcopy(best_so_far)]
-
         # Baker's stochastic universal sampling
         parents = sel_stochastic_universal_sampling(
             population, POPULATION_SIZE,
         )
 
+        offspring = []
+
         for i in range(POPULATION_SIZE - 1):
             p1 = parents[i][0]
             p2 = parents[i + 1][0]
@@ -301,17 +401,23 @@ def get_matchings(matched_critiques, critiquer_requests):
             )
 
             # Shuffle mutation
-            c1 = tuple(mut_shuffle_indexes(c1, MUTATION_PROBABILITY))
-            c2 = tuple(mut_shuffle_indexes(c2, MUTATION_PROBABILITY))
+            offspring.append(
+                tuple(mut_shuffle_indexes(c1, MUTATION_PROBABILITY)),
+            )
+            offspring.append(
+                tuple(mut_shuffle_indexes(c2, MUTATION_PROBABILITY)),
+            )
 
-            children.append((c1, get_individual_fitness(c1)))
-            children.append((c2, get_individual_fitness(c2)))
+        # Elitist
+        children = [deepcopy(best_so_far)] + list(zip(
+            offspring, get_population_fitness(fitness_matrix, offspring),
+        ))
 
         # Sort children by descending fitness
         children.sort(key=lambda x: x[1], reverse=True)
 
-        if children[i][1] > best_so_far[1]:
-            best_so_far = children[i]
+        if children[0][1] > best_so_far[1]:
+            best_so_far = children[0]
 
         # Remove the last child, since there is always exactly
         # 1 more child than POPULATION_SIZE
@@ -330,9 +436,9 @@ def get_matchings(matched_critiques, critiquer_requests):
         critiquer_request_idx = best_so_far[0][matched_critique_idx]
 
         # Skip if completely incompatibile
-        if get_pair_fitness(
+        if fitness_matrix[
             matched_critique_idx, critiquer_request_idx,
-        ) == 0.0:
+        ] == 0.0:
             continue
 
         matched_critique = matched_critiques_list[matched_critique_idx]
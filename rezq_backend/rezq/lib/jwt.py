@@ -1,3 +1,8 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
 import jwt
 from django.conf import settings
 from jwt import exceptions
@@ -6,6 +11,12 @@ from jwt import ExpiredSignatureError
 
 HS256 = 'HS256'
 
+# Verified payloads of recently decoded tokens
+DECODE_CACHE_SIZE = 1024
+
+_decode_cache = OrderedDict()
+_decode_cache_lock = threading.Lock()
+
 
 def encode(payload):
     return jwt.encode(
@@ -13,15 +24,70 @@ def encode(payload):
     ).decode('ascii')
 
 
+def _get_decode_cache_key(encoded):
+    # Tokens signed with an old SECRET_KEY must not hit
+    return hashlib.sha256(
+        f'{settings.SECRET_KEY}\0{encoded}'.encode(),
+    ).digest()
+
+
+def _get_cached_payload(cache_key):
+    with _decode_cache_lock:
+        payload = _decode_cache.get(cache_key)
+        if payload is None:
+            return None
+
+        if 'exp' in payload and payload['exp'] <= time.time():
+            # Let jwt.decode raise ExpiredSignatureError
+            del _decode_cache[cache_key]
+            return None
+
+        _decode_cache.move_to_end(cache_key)
+        return dict(payload)
+
+
+def _cache_payload(cache_key, payload):
+    with _decode_cache_lock:
+        _decode_cache[cache_key] = dict(payload)
+        _decode_cache.move_to_end(cache_key)
+        if len(_decode_cache) > DECODE_CACHE_SIZE:
+            _decode_cache.popitem(last=False)
+
+
+def clear_decode_cache():
+    with _decode_cache_lock:
+        _decode_cache.clear()
+
+
 def decode(encoded, verify=True):
-    return jwt.decode(
-        encoded, key=settings.SECRET_KEY, verify=verify, algorithms=[HS256],
+    """Verified payloads are cached, so decoding the same token again
+    skips verification until it expires. Failures are never cached.
+    """
+    if not verify:
+        return jwt.decode(
+            encoded, key=settings.SECRET_KEY, verify=False,
+            algorithms=[HS256],
+        )
+
+    cache_key = _get_decode_cache_key(encoded)
+
+    payload = _get_cached_payload(cache_key)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(
+        encoded, key=settings.SECRET_KEY, verify=True, algorithms=[HS256],
     )
 
+    _cache_payload(cache_key, payload)
+
+    return payload
+
 
 __all__ = [
     encode,
     decode,
+    clear_decode_cache,
     ExpiredSignatureError,
     exceptions,
 ]
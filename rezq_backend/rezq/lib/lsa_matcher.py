@@ -0,0 +1,72 @@
+import logging
+
+from rezq.lib.ga_matcher import get_fitness_matrix
+from scipy.optimize import linear_sum_assignment
+
+logger = logging.getLogger(__name__)
+
+
+def get_matchings(matched_critiques, critiquer_requests):
+    """Match critiques to critiquers by solving the linear assignment problem
+
+    Uses the same pair fitness as the genetic algorithm, but the assignment
+    is optimal: no other set of matchings has a greater total fitness.
+
+    The solver assigns min(m, n) pairs no matter what, so pairs with a
+    fitness of 0.0 (totally incompatibile) are dropped afterwards.
+    Every fitness is non-negative, so dropping them keeps it optimal.
+
+    :param matched_critiques: matched critique candidates
+    :type matched_critiques: list( MatchCandidate )
+    :param critiquer_requests: critiquer request candidates
+    :type critiquer_requests: list( MatchCandidate )
+
+    :return: pairs of matched critique and critiquer request candidates
+    :rtype: list( tuple( MatchCandidate, MatchCandidate ) )
+    """
+    matched_critiques_list = list(matched_critiques)
+    critiquer_requests_list = list(critiquer_requests)
+
+    logger.info(
+        'Running LSA matching on %d resumes and %d critiquers',
+        len(matched_critiques_list),
+        len(critiquer_requests_list),
+    )
+
+    fitness_matrix = get_fitness_matrix(
+        matched_critiques_list, critiquer_requests_list,
+    )
+
+    matched_critique_idxs, critiquer_request_idxs = linear_sum_assignment(
+        fitness_matrix, maximize=True,
+    )
+
+    matchings = []
+    total_fitness = 0.0
+
+    for matched_critique_idx, critiquer_request_idx in zip(
+        matched_critique_idxs, critiquer_request_idxs,
+    ):
+        fitness = fitness_matrix[matched_critique_idx, critiquer_request_idx]
+
+        # Skip if completely incompatibile
+        if fitness == 0.0:
+            continue
+
+        total_fitness += fitness
+
+        matchings.append((
+            matched_critiques_list[matched_critique_idx],
+            critiquer_requests_list[critiquer_request_idx],
+        ))
+
+    logger.info(
+        'LSA finished with %d matches from %d resumes and %d critiquers,' +
+        ' with total fitness of %f',
+        len(matchings),
+        len(matched_critiques_list),
+        len(critiquer_requests_list),
+        total_fitness,
+    )
+
+    return matchings
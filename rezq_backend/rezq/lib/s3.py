@@ -1,9 +1,12 @@
 import abc
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 from botocore.exceptions import ClientError
 from django.conf import settings
+from django.core.cache import cache
 
 
 logger = logging.getLogger(__name__)
@@ -12,37 +15,142 @@ EXPIRES_IN = 300  # seconds
 MIN_PDF_SIZE = 50  # bytes
 MAX_PDF_SIZE = 5242880  # bytes (5MB)
 
+# Cached urls must still be valid when they're handed out
+DOWNLOAD_URL_CACHE_SECONDS = EXPIRES_IN - 60
+
+# Concurrent requests when getting many download urls
+MAX_WORKERS = 10
+
+
+def _get_download_url_cache_key(bucket, key):
+    return f's3url:{bucket}:{key}'
+
 
 class _AbstractS3(metaclass=abc.ABCMeta):
     """S3 module
 
     Sourced from:
     https://github.com/gymapplife/backend/blob/master/backend/lib/s3.py
+
+    Download urls are cached for a little while, so resolving a page of
+    resumes doesn't HEAD every object every time. Missing objects aren't,
+    since a missing resume is deleted, and it may be uploading straight
+    to S3.
     """
 
-    @abc.abstractmethod
+    def __init__(self):
+        self._cache_stats_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._thread_calls = threading.local()
+
     def get_upload_dict(self, bucket, key):
         """POST to a presigned url
 
         Javascript usage example:
         https://github.com/gymapplife/frontend/blob/master/src/components/Photos.js#L40
         """
-        pass
+        # The object is about to change, and may not exist yet
+        self.invalidate_download_url(bucket, key)
+        self._count_calls(1)
+        return self._get_upload_dict(bucket, key)
 
-    @abc.abstractmethod
     def get_download_url(self, bucket, key):
         """GET from a presigned url
+
+        :return: presigned url, or None if the object doesn't exist
+        :rtype: str
+        """
+        return self.get_download_urls([(bucket, key)])[(bucket, key)]
+
+    def get_download_urls(self, bucket_keys):
+        """get_download_url for many objects at once
+
+        :param bucket_keys: objects to get urls for
+        :type bucket_keys: iterable( tuple( str, str ) )
+
+        :return: (bucket, key) to presigned url, or None if it doesn't exist
+        :rtype: dict
+        """
+        cache_keys = {
+            bucket_key: _get_download_url_cache_key(*bucket_key)
+            for bucket_key in bucket_keys
+        }
+        cached_urls = cache.get_many(cache_keys.values())
+
+        urls = {}
+        uncached_bucket_keys = []
+        for bucket_key, cache_key in cache_keys.items():
+            if cache_key in cached_urls:
+                urls[bucket_key] = cached_urls[cache_key]
+            else:
+                uncached_bucket_keys.append(bucket_key)
+
+        self._count_cache(
+            hits=len(urls), misses=len(uncached_bucket_keys),
+        )
+
+        if not uncached_bucket_keys:
+            return urls
+
+        self._count_calls(len(uncached_bucket_keys))
+        fetched_urls = self._get_download_urls(uncached_bucket_keys)
+
+        cache.set_many({
+            cache_keys[bucket_key]: url
+            for bucket_key, url in fetched_urls.items()
+            if url is not None
+        }, DOWNLOAD_URL_CACHE_SECONDS)
+
+        urls.update(fetched_urls)
+
+        return urls
+
+    def delete(self, bucket, key):
+        self._count_calls(1)
+        self._delete(bucket, key)
+        self.invalidate_download_url(bucket, key)
+
+    def invalidate_download_url(self, bucket, key):
+        cache.delete(_get_download_url_cache_key(bucket, key))
+
+    def get_thread_call_count(self):
+        """
+        :return: calls made to S3 by the current thread, so far
+        :rtype: int
         """
+        return getattr(self._thread_calls, 'count', 0)
+
+    def _count_calls(self, count):
+        self._thread_calls.count = self.get_thread_call_count() + count
+
+    def _count_cache(self, hits, misses):
+        with self._cache_stats_lock:
+            self.cache_hits += hits
+            self.cache_misses += misses
+
+    def _get_download_urls(self, bucket_keys):
+        return {
+            bucket_key: self._get_download_url(*bucket_key)
+            for bucket_key in bucket_keys
+        }
+
+    @abc.abstractmethod
+    def _get_upload_dict(self, bucket, key):
         pass
 
     @abc.abstractmethod
-    def delete(self, bucket, key):
+    def _get_download_url(self, bucket, key):
+        pass
+
+    @abc.abstractmethod
+    def _delete(self, bucket, key):
         pass
 
 
 class _MockS3(_AbstractS3):
 
-    def get_upload_dict(self, bucket, key):
+    def _get_upload_dict(self, bucket, key):
         return {
             'url': f'{settings.BASE_URL}/mock-s3/',
             'fields': {
@@ -53,22 +161,35 @@ class _MockS3(_AbstractS3):
             },
         }
 
-    def get_download_url(self, bucket, key):
+    def _get_download_url(self, bucket, key):
+        return self._get_download_urls([(bucket, key)])[(bucket, key)]
+
+    def _get_download_urls(self, bucket_keys):
         from django.core.files.storage import default_storage
         from rezq.models.dev import MockS3File
 
+        # Mock S3 keys are unique across buckets, so get them in one query
         try:
-            f = MockS3File.objects.get(id=key)
-            if not default_storage.exists(f.file):
-                logger.info(f'{f.file} not found on filesystem.')
-                return None
+            files = MockS3File.objects.in_bulk([key for _, key in bucket_keys])
         except Exception as e:
             logger.info(f'{type(e)}: {str(e)}')
-            return None
+            files = {}
 
-        return f'{settings.BASE_URL}/mock-s3/?key={key}'
+        urls = {}
+        for bucket, key in bucket_keys:
+            f = files.get(key)
+            if f is None:
+                logger.info(f'MockS3File {key} does not exist.')
+                urls[bucket, key] = None
+            elif not default_storage.exists(f.file):
+                logger.info(f'{f.file} not found on filesystem.')
+                urls[bucket, key] = None
+            else:
+                urls[bucket, key] = f'{settings.BASE_URL}/mock-s3/?key={key}'
 
-    def delete(self, bucket, key):
+        return urls
+
+    def _delete(self, bucket, key):
         pass
 
 
@@ -77,9 +198,14 @@ class _S3(_AbstractS3):
     """
 
     def __init__(self):
+        super().__init__()
+        # boto3 clients are thread safe, so the pool shares this one
         self.client = boto3.client('s3')
+        self.executor = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix='s3',
+        )
 
-    def get_upload_dict(self, bucket, key):
+    def _get_upload_dict(self, bucket, key):
         conditions = [
             ['content-length-range', MIN_PDF_SIZE, MAX_PDF_SIZE],
         ]
@@ -91,7 +217,7 @@ class _S3(_AbstractS3):
             ExpiresIn=EXPIRES_IN,
         )
 
-    def get_download_url(self, bucket, key):
+    def _get_download_url(self, bucket, key):
         try:
             self.client.head_object(Bucket=bucket, Key=key)
         except ClientError as e:
@@ -109,7 +235,21 @@ class _S3(_AbstractS3):
             ExpiresIn=EXPIRES_IN,
         )
 
-    def delete(self, bucket, key):
+    def _get_download_urls(self, bucket_keys):
+        """HEAD the objects in parallel
+        """
+        if len(bucket_keys) == 1:
+            return super()._get_download_urls(bucket_keys)
+
+        return dict(zip(
+            bucket_keys,
+            self.executor.map(
+                lambda bucket_key: self._get_download_url(*bucket_key),
+                bucket_keys,
+            ),
+        ))
+
+    def _delete(self, bucket, key):
         self.client.delete_object(
             Bucket=bucket,
             Key=key,
@@ -0,0 +1,247 @@
+"""A cache backend keeping short lived local copies of a shared cache
+
+Reads go to the local cache (L1) of the process first, then to the shared
+cache (L2), which is Redis in production. Writes go to both. Other
+processes may still read their local copy for up to the local timeout of
+its namespace after a write, so only namespaces that can be that stale
+get one. A local copy never outlives the shared one, when the shared
+cache can tell how long that has left, as Redis can. The namespace of a
+key is what comes before its first colon, e.g. pcv for pcv:<critique id>.
+
+    CACHES = {
+        'default': {
+            'BACKEND': 'rezq.lib.tiered_cache.TieredCache',
+            'OPTIONS': {
+                'LOCAL_CACHE': 'local',
+                'SHARED_CACHE': 'shared',
+                'LOCAL_TIMEOUTS': {'user': 5},
+            },
+        },
+        'local': {...},
+        'shared': {...},
+    }
+"""
+import threading
+from collections import Counter
+from collections import defaultdict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+
+LOCAL_HIT = 'local_hits'
+SHARED_HIT = 'shared_hits'
+MISS = 'misses'
+
+_MISSING = object()
+
+
+def get_namespace(key):
+    namespace, colon, _ = key.partition(':')
+    return namespace if colon else ''
+
+
+class CacheStats:
+    """Hits and misses of tiered caches by namespace, for one process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._counts = defaultdict(Counter)
+
+    def add(self, counts):
+        """
+        :param counts: count of each (namespace, LOCAL_HIT / SHARED_HIT /
+            MISS)
+        :type counts: collections.Counter
+        """
+        with self._lock:
+            for (namespace, outcome), count in counts.items():
+                self._counts[namespace][outcome] += count
+
+    def to_dict(self):
+        with self._lock:
+            stats = {}
+            for namespace, counts in self._counts.items():
+                hits = counts[LOCAL_HIT] + counts[SHARED_HIT]
+                stats[namespace] = {
+                    LOCAL_HIT: counts[LOCAL_HIT],
+                    SHARED_HIT: counts[SHARED_HIT],
+                    MISS: counts[MISS],
+                    'hit_rate': hits / (hits + counts[MISS]),
+                }
+            return stats
+
+
+cache_stats = CacheStats()
+
+
+class TieredCache(BaseCache):
+    """A local cache in front of a shared one. Both are other configured
+    caches, so keys are made by them, not by this one.
+
+    OPTIONS:
+        LOCAL_CACHE: alias of the local cache
+        SHARED_CACHE: alias of the shared cache
+        LOCAL_TIMEOUTS: seconds to keep local copies for, by namespace.
+            Keys of other namespaces are only in the shared cache.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._local_alias = options.get('LOCAL_CACHE', 'local')
+        self._shared_alias = options.get('SHARED_CACHE', 'shared')
+        self._local_timeouts = options.get('LOCAL_TIMEOUTS', {})
+
+    @property
+    def local(self):
+        return caches[self._local_alias]
+
+    @property
+    def shared(self):
+        return caches[self._shared_alias]
+
+    def _get_local_timeout(self, key, timeout=DEFAULT_TIMEOUT):
+        """Seconds to keep a local copy of key for, never longer than the
+        shared one. None when its namespace has no local copies.
+        """
+        local_timeout = self._local_timeouts.get(get_namespace(key))
+        if local_timeout is None:
+            return None
+
+        if timeout is DEFAULT_TIMEOUT or timeout is None:
+            return local_timeout
+
+        return max(min(local_timeout, timeout), 0)
+
+    def _get_shared_ttls(self, keys, version=None):
+        """Seconds until each of keys with local copies expires in the
+        shared cache, None if never. Only Redis (django-redis) can tell,
+        other shared caches give {}.
+        """
+        keys = [
+            key for key in keys
+            if self._get_local_timeout(key) is not None
+        ]
+        client = getattr(self.shared, 'client', None)
+        if not keys or not hasattr(client, 'get_client'):
+            return {}
+
+        # One round trip for all of them
+        pipeline = client.get_client(write=False).pipeline(transaction=False)
+        for key in keys:
+            pipeline.pttl(client.make_key(key, version=version))
+
+        ttls = {}
+        for key, pttl in zip(keys, pipeline.execute()):
+            # -1 if the key never expires, -2 if it's already gone
+            ttls[key] = None if pttl == -1 else max(pttl, 0) / 1000
+        return ttls
+
+    def _set_local_many(
+        self, data, timeout=DEFAULT_TIMEOUT, version=None, timeouts=None,
+    ):
+        """
+        :param timeouts: timeouts of some keys, instead of timeout
+        :type timeouts: dict
+        """
+        timeouts = timeouts or {}
+        by_timeout = defaultdict(dict)
+        expired = []
+        for key, value in data.items():
+            local_timeout = self._get_local_timeout(
+                key, timeouts.get(key, timeout),
+            )
+            if local_timeout:
+                by_timeout[local_timeout][key] = value
+            elif local_timeout is not None:
+                expired.append(key)
+
+        for local_timeout, local_data in by_timeout.items():
+            self.local.set_many(local_data, local_timeout, version)
+
+        if expired:
+            self.local.delete_many(expired, version)
+
+    def _delete_local_many(self, keys, version=None):
+        local_keys = [
+            key for key in keys
+            if self._get_local_timeout(key) is not None
+        ]
+        if local_keys:
+            self.local.delete_many(local_keys, version)
+
+    def get(self, key, default=None, version=None):
+        value = self.get_many([key], version).get(key, _MISSING)
+        return default if value is _MISSING else value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        counts = Counter()
+
+        local_keys = [
+            key for key in keys
+            if self._get_local_timeout(key) is not None
+        ]
+        values = self.local.get_many(local_keys, version) if local_keys else {}
+        for key in values:
+            counts[get_namespace(key), LOCAL_HIT] += 1
+
+        shared_keys = [key for key in keys if key not in values]
+        if shared_keys:
+            shared_values = self.shared.get_many(shared_keys, version)
+            for key in shared_keys:
+                outcome = SHARED_HIT if key in shared_values else MISS
+                counts[get_namespace(key), outcome] += 1
+
+            self._set_local_many(
+                shared_values,
+                version=version,
+                timeouts=self._get_shared_ttls(shared_values, version),
+            )
+            values.update(shared_values)
+
+        cache_stats.add(counts)
+        return values
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout, version)
+        self._set_local_many({key: value}, timeout, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed_keys = self.shared.set_many(data, timeout, version)
+        self._set_local_many(data, timeout, version)
+        return failed_keys
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout, version)
+        if added:
+            self._set_local_many({key: value}, timeout, version)
+        return added
+
+    def incr(self, key, delta=1, version=None):
+        value = self.shared.incr(key, delta, version)
+        self._delete_local_many([key], version)
+        return value
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout, version)
+
+    def delete(self, key, version=None):
+        self.shared.delete(key, version)
+        self._delete_local_many([key], version)
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        self.shared.delete_many(keys, version)
+        self._delete_local_many(keys, version)
+
+    def clear(self):
+        self.shared.clear()
+        self.local.clear()
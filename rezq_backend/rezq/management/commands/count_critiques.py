@@ -0,0 +1,14 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from rezq.utils.critique_counts import count_critiques
+
+
+class Command(BaseCommand):
+
+    help = (
+        'Recount the critiques of every resume, e.g. after loading '
+        'fixtures, which bypasses Critique.save.'
+    )
+
+    def handle(self, *args, **options):
+        count_critiques(apps)
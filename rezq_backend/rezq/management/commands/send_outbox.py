@@ -0,0 +1,44 @@
+import logging
+import time
+
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+from rezq.utils.mailer import OUTBOX_BATCH_SIZE
+from rezq.utils.mailer import send_outbox
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+
+    help = (
+        'Send the queued emails over one connection. Run it on a schedule, '
+        'or keep it running with --poll.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=OUTBOX_BATCH_SIZE,
+            help='Emails sent per transaction',
+        )
+        parser.add_argument(
+            '--poll',
+            type=float,
+            metavar='SECONDS',
+            help='Keep sending, checking for emails every SECONDS',
+        )
+
+    def handle(self, *args, **options):
+        with get_connection() as connection:
+            while True:
+                count = send_outbox(connection, options['batch_size'])
+                if count:
+                    logger.info('Sent or retried %d emails', count)
+
+                if options['poll'] is None:
+                    return
+
+                time.sleep(options['poll'])
@@ -0,0 +1,14 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from rezq.utils.industry import set_industries_bitmasks
+
+
+class Command(BaseCommand):
+
+    help = (
+        'Recompute the industries bitmasks, e.g. after loading fixtures, '
+        'which bypasses save.'
+    )
+
+    def handle(self, *args, **options):
+        set_industries_bitmasks(apps)
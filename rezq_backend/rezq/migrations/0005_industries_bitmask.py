@@ -0,0 +1,61 @@
+# Generated by Django 2.1.7 on 2026-10-18 10:25
+
+from django.db import migrations, models
+
+
+# server.constants.INDUSTRY_BITS as of this migration, so later changes
+# don't change what it did
+INDUSTRY_BITS = (
+    'ACC', 'ADM', 'ANA', 'ARCH', 'BANK', 'BIO', 'BUS', 'CHEM', 'COMM',
+    'CONS', 'DATA', 'DES', 'ENG', 'ENV', 'FIN', 'FINT', 'GEOL', 'GEOM',
+    'HARD', 'HEAL', 'LAW', 'MATH', 'MECH', 'MED', 'MUSI', 'PHYS', 'PROJ',
+    'RES', 'RET', 'ROBO', 'SERV', 'SOFT', 'TEAC', 'TECH', 'WRIT',
+)
+
+
+def get_industries_bitmask(industries):
+    bitmask = 0
+    for industry in industries.split(','):
+        if industry in INDUSTRY_BITS:
+            bitmask |= 1 << INDUSTRY_BITS.index(industry)
+    return bitmask
+
+
+def backfill_industries_bitmask(apps, schema_editor):
+    for model_name in ('CritiquerRequest', 'Resume', 'User'):
+        model = apps.get_model('rezq', model_name)
+        # One update per distinct industries string, not per row
+        for industries in model.objects.values_list(
+            'industries', flat=True,
+        ).distinct():
+            model.objects.filter(industries=industries).update(
+                industries_bitmask=get_industries_bitmask(industries),
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rezq', '0004_auto_20190327_2056'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='critiquerrequest',
+            name='industries_bitmask',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='industries_bitmask',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='industries_bitmask',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            backfill_industries_bitmask, migrations.RunPython.noop,
+        ),
+    ]
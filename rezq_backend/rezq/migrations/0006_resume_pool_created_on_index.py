@@ -0,0 +1,17 @@
+# Generated by Django 2.1.7 on 2026-10-18 10:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rezq', '0005_industries_bitmask'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['pool', '-created_on', 'id'], name='rezq_resume_pool_id_700be4_idx'),
+        ),
+    ]
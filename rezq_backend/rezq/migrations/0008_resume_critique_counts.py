@@ -0,0 +1,75 @@
+# Generated by Django 2.1.7 on 2026-10-18 10:56
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_subquery(critique_model, **filters):
+    return Coalesce(Subquery(
+        critique_model.objects.filter(
+            resume=OuterRef('pk'), **filters,
+        ).values('resume').annotate(count=Count('id')).values('count'),
+    ), 0)
+
+
+def backfill_critique_counts(apps, schema_editor):
+    """rezq.utils.critique_counts.count_critiques as of this migration,
+    so later changes don't change what it did
+    """
+    resume_model = apps.get_model('rezq', 'Resume')
+    for model_name, name in (
+        ('MatchedCritique', 'matchedcritique'),
+        ('LinkedCritique', 'linkedcritique'),
+        ('PooledCritique', 'pooledcritique'),
+    ):
+        critique_model = apps.get_model('rezq', model_name)
+        resume_model.objects.update(**{
+            f'{name}_count': count_subquery(critique_model),
+            f'{name}_submitted_count': count_subquery(
+                critique_model, submitted=True,
+            ),
+        })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rezq', '0007_outbox_email'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='linkedcritique_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='linkedcritique_submitted_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='matchedcritique_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='matchedcritique_submitted_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='pooledcritique_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='pooledcritique_submitted_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            backfill_critique_counts, migrations.RunPython.noop,
+        ),
+    ]
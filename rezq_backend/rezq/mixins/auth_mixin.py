@@ -3,8 +3,8 @@ import logging
 from django.core.exceptions import ValidationError
 from django.http import HttpResponseBadRequest
 from django.http import HttpResponseForbidden
-from ratelimit.utils import is_ratelimited
 from rezq.lib import jwt
+from rezq.mixins.ratelimit import is_ratelimited
 from rezq.models import User
 from rezq.utils.request import get_client_ip
 from rezq.utils.response import HttpResponseTooManyRequests
@@ -31,39 +31,38 @@ class AuthMixin:
             logger.info('Wrong auth type')
             return HttpResponseBadRequest()
 
+        # Verify once. Only decode unverified when that fails, to still
+        # rate limit by the claimed user
         try:
-            unverified_payload = jwt.decode(auth[1], verify=False)
+            payload = jwt.decode(auth[1])
+            verify_error = None
         except Exception as e:
-            logger.info(f'{type(e)}: {str(e)}')
-            return HttpResponseBadRequest()
+            verify_error = e
+            try:
+                payload = jwt.decode(auth[1], verify=False)
+            except Exception as e:
+                logger.info(f'{type(e)}: {str(e)}')
+                return HttpResponseBadRequest()
 
         try:
-            unverified_uid = str(unverified_payload['user'])
+            uid = str(payload['user'])
         except KeyError:
             logger.info('Missing user id from payload')
             return HttpResponseBadRequest()
 
-        if is_ratelimited(
-            request,
-            group='',
-            key=lambda group, request, uid=unverified_uid: uid,
-            rate='88/m',
-            increment=True,
-        ):
+        if is_ratelimited('user', uid):
             logger.error(
                 f'{get_client_ip(request)} exceeded rate limit threshold for '
-                f'user {unverified_uid}',
+                f'user {uid}',
             )
             return HttpResponseTooManyRequests()
 
-        try:
-            payload = jwt.decode(auth[1])
-        except Exception as e:
-            logger.info(f'{type(e)}: {str(e)}')
+        if verify_error is not None:
+            logger.info(f'{type(verify_error)}: {str(verify_error)}')
             return HttpResponseUnauthorized()
 
         try:
-            user = User.objects.get(id=payload['user'])
+            user = User.objects.get_cached(payload['user'])
         except User.DoesNotExist:
             logger.info('User does not exist; probably deleted account')
             return HttpResponseForbidden()
@@ -0,0 +1,175 @@
+"""Sliding window rate limits, counted in the shared cache
+
+A limit of n requests per window is checked against the requests of the
+current window, plus those of the last window weighted by how much of it
+still overlaps the sliding window. So there's no burst of 2n around the
+edge of a window, as with fixed windows.
+
+Counting every request in the shared cache costs round trips, so each
+process also counts locally and only syncs its count every
+LOCAL_MAX_PENDING requests or LOCAL_MAX_AGE_SECONDS. Until then, a client
+that was clearly under (or over) its limit when last synced is decided
+locally. That lets a limit be exceeded by up to LOCAL_MAX_PENDING
+requests per process.
+"""
+import re
+import threading
+from collections import namedtuple
+from time import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+RATE_PERIODS = {
+    's': 1,
+    'm': 60,
+    'h': 60 * 60,
+    'd': 24 * 60 * 60,
+}
+
+# Rates by group. The private API is limited by user, and the public one
+# by client IP and operation. Operations without a group of their own
+# share the one of their type.
+RATELIMITS = {
+    'user': '88/m',
+    'query': '60/m',
+    'query:resume': '88/m',
+    'query:linkedCritique': '88/m',
+    'mutation': '30/m',
+    'mutation:saveLinkedCritique': '88/m',
+}
+
+# Decide locally when the last synced count is under this fraction of
+# the limit
+LOCAL_UNDER_LIMIT = 0.5
+LOCAL_MAX_PENDING = 10
+LOCAL_MAX_AGE_SECONDS = 1
+
+# Local counts of all groups and keys, before they're dropped
+MAX_LOCAL_COUNTS = 10000
+
+
+class Rate(namedtuple('Rate', ('limit', 'seconds'))):
+
+    @classmethod
+    def parse(cls, rate):
+        """
+        :param rate: e.g. 60/m, or 5/10s
+        :type rate: str
+        """
+        match = re.fullmatch(r'(\d+)/(\d*)([smhd])', rate)
+        if match is None:
+            raise ValueError(f'Invalid rate {rate}')
+
+        limit, multiplier, period = match.groups()
+        return cls(int(limit), int(multiplier or 1) * RATE_PERIODS[period])
+
+
+def get_operation_group(operation_name, is_mutation):
+    operation_type = 'mutation' if is_mutation else 'query'
+    group = f'{operation_type}:{operation_name}'
+    return group if group in RATELIMITS else operation_type
+
+
+class _LocalCount:
+
+    def __init__(self, window):
+        self.window = window
+        self.synced_at = 0.0
+        self.synced_estimate = 0.0
+        self.pending = 0
+
+
+class Ratelimiter:
+    """Counts requests by group and key, for one process.
+    """
+
+    def __init__(self, ratelimits=RATELIMITS):
+        self._rates = {
+            group: Rate.parse(rate) for group, rate in ratelimits.items()
+        }
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._local_counts = {}
+
+    @property
+    def cache(self):
+        return caches[settings.RATELIMIT_CACHE]
+
+    def is_ratelimited(self, group, key):
+        """Count a request, and whether it's over the limit of its group.
+
+        :param group: a group of RATELIMITS
+        :type group: str
+        :param key: who's limited, e.g. a user id
+        :type key: str
+
+        :rtype: bool
+        """
+        rate = self._rates[group]
+        now = time()
+        window, elapsed = divmod(now, rate.seconds)
+        window = int(window)
+        local_key = (group, key)
+
+        with self._lock:
+            local_count = self._local_counts.get(local_key)
+            if local_count is None or local_count.window != window:
+                if len(self._local_counts) >= MAX_LOCAL_COUNTS:
+                    self._local_counts = {}
+                local_count = _LocalCount(window)
+                self._local_counts[local_key] = local_count
+
+            local_count.pending += 1
+            estimate = local_count.synced_estimate + local_count.pending
+            if (
+                local_count.pending < LOCAL_MAX_PENDING and
+                now - local_count.synced_at < LOCAL_MAX_AGE_SECONDS
+            ):
+                if estimate < rate.limit * LOCAL_UNDER_LIMIT:
+                    return False
+                if local_count.synced_estimate > rate.limit:
+                    return True
+
+            pending = local_count.pending
+            local_count.pending = 0
+
+        estimate = self._sync(group, key, rate, window, elapsed, pending)
+
+        with self._lock:
+            local_count.synced_at = now
+            local_count.synced_estimate = estimate
+
+        return estimate > rate.limit
+
+    def _sync(self, group, key, rate, window, elapsed, pending):
+        """Add pending requests to the shared count of the current window
+
+        :return: requests in the sliding window
+        :rtype: float
+        """
+        cache_key = f'rl:{group}:{key}:{window}'
+        # The count of the last window is needed until the end of this one
+        timeout = 2 * rate.seconds
+
+        try:
+            count = self.cache.incr(cache_key, pending)
+        except ValueError:
+            if self.cache.add(cache_key, pending, timeout):
+                count = pending
+            else:
+                count = self.cache.incr(cache_key, pending)
+
+        last_count = self.cache.get(f'rl:{group}:{key}:{window - 1}', 0)
+        return last_count * (1 - elapsed / rate.seconds) + count
+
+
+ratelimiter = Ratelimiter()
+
+
+def is_ratelimited(group, key):
+    return ratelimiter.is_ratelimited(group, key)
@@ -3,6 +3,7 @@ from rezq.models.linked_critique import LinkedCritique
 from rezq.models.linked_critique_comment import LinkedCritiqueComment
 from rezq.models.matched_critique import MatchedCritique
 from rezq.models.matched_critique_comment import MatchedCritiqueComment
+from rezq.models.outbox_email import OutboxEmail
 from rezq.models.page_report import PageReport
 from rezq.models.pool import Pool
 from rezq.models.pooled_critique import PooledCritique
@@ -17,6 +18,7 @@ __all__ = [
     LinkedCritiqueComment,
     MatchedCritique,
     MatchedCritiqueComment,
+    OutboxEmail,
     PageReport,
     Pool,
     PooledCritique,
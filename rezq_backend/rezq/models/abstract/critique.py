@@ -1,5 +1,7 @@
 from django.conf import settings
 from django.db import models
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 from rezq.models.abstract.timestamp_model import TimestampModel
 from rezq.models.resume import Resume
@@ -13,6 +15,9 @@ class Critique(TimestampModel):
     class Meta:
         abstract = True
 
+    # Only loaded for GraphQL queries that select them
+    DEFERRABLE_FIELDS = ('annotations',)
+
     # Do not delete this Critique if the critiquer Profile is deleted
     critiquer = models.ForeignKey(
         User,
@@ -38,7 +43,33 @@ class Critique(TimestampModel):
     submitted = models.BooleanField(default=False, db_index=True)
     submitted_on = models.DateTimeField(blank=True, null=True)
 
+    def _get_saved_submitted(self):
+        """Whether the resume counts this critique as submitted, or None
+        if it's not saved yet. Locks the row until the transaction ends,
+        so concurrent saves and deletes count it once.
+        """
+        if self._state.adding:
+            return None
+
+        return type(self).objects.select_for_update().filter(
+            pk=self.pk,
+        ).values_list('submitted', flat=True).first()
+
+    def _update_resume_counts(self, count, submitted_count):
+        name = self._meta.model_name
+        Resume.objects.filter(id=self.resume_id).update(**{
+            f'{name}_count': F(f'{name}_count') + count,
+            f'{name}_submitted_count': (
+                F(f'{name}_submitted_count') + submitted_count
+            ),
+        })
+
+    # The email is only sent, and the resume counts updated, if the
+    # critique is saved
+    @transaction.atomic
     def save(self, *args, **kwargs):
+        saved_submitted = self._get_saved_submitted()
+
         if self.submitted:
             self.submitted_on = timezone.now()
 
@@ -56,3 +87,18 @@ class Critique(TimestampModel):
                 )
 
         super().save(*args, **kwargs)
+
+        if saved_submitted is None:
+            self._update_resume_counts(1, int(self.submitted))
+        elif saved_submitted != self.submitted:
+            self._update_resume_counts(
+                0, int(self.submitted) - int(saved_submitted),
+            )
+
+    @transaction.atomic
+    def delete(self, *args, **kwargs):
+        saved_submitted = self._get_saved_submitted()
+        deleted = super().delete(*args, **kwargs)
+        if saved_submitted is not None:
+            self._update_resume_counts(-1, -int(saved_submitted))
+        return deleted
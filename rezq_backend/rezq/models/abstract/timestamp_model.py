@@ -4,7 +4,7 @@ from django.core.exceptions import ValidationError
 from django.db import models
 
 
-class TimestampModelManager(models.Manager):
+class TimestampModelQuerySet(models.QuerySet):
 
     def get(self, *args, **kwargs):
         try:
@@ -15,6 +15,12 @@ class TimestampModelManager(models.Manager):
             raise e
 
 
+class TimestampModelManager(
+    models.Manager.from_queryset(TimestampModelQuerySet),
+):
+    pass
+
+
 class TimestampModel(models.Model):
 
     class Meta:
@@ -1,6 +1,7 @@
 from django.db import models
 from rezq.models.abstract.timestamp_model import TimestampModel
 from rezq.models.user import User
+from rezq.utils.industry import get_industries_bitmask
 from rezq.validators import validate_industries
 
 
@@ -8,3 +9,10 @@ class CritiquerRequest(TimestampModel):
 
     critiquer = models.OneToOneField(User, on_delete=models.CASCADE)
     industries = models.TextField(validators=[validate_industries])
+
+    # Bitmask of industries, kept in sync on save
+    industries_bitmask = models.BigIntegerField(default=0, editable=False)
+
+    def save(self, *args, **kwargs):
+        self.industries_bitmask = get_industries_bitmask(self.industries)
+        super().save(*args, **kwargs)
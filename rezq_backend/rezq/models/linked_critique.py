@@ -3,12 +3,13 @@ import logging
 from rezq.lib import jwt
 from rezq.models.abstract.critique import Critique
 from rezq.models.abstract.timestamp_model import TimestampModelManager
+from rezq.models.abstract.timestamp_model import TimestampModelQuerySet
 
 
 logger = logging.getLogger(__name__)
 
 
-class LinkedCritiqueManager(TimestampModelManager):
+class LinkedCritiqueQuerySet(TimestampModelQuerySet):
 
     def get_by_token(self, token):
         try:
@@ -24,7 +25,7 @@ class LinkedCritiqueManager(TimestampModelManager):
 
 class LinkedCritique(Critique):
 
-    objects = LinkedCritiqueManager()
+    objects = TimestampModelManager.from_queryset(LinkedCritiqueQuerySet)()
 
     @property
     def token(self):
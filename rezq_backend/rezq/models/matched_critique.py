@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.db import transaction
 from django.utils import timezone
 from rezq.models.abstract.critique import Critique
 from rezq.utils.auth import create_email_unsubscribe_token
@@ -8,21 +9,27 @@ from rezq.utils.mailer import send_critiquer_matched_notif_mail
 
 class MatchedCritique(Critique):
 
+    # Read by __init__, so never deferred
+    ALWAYS_LOADED_FIELDS = ('critiquer',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Save the old critiquer value to be used in save()
-        self._critiquer = self.critiquer
+        # Save the old critiquer value to be used in save(). Only the id,
+        # so loading critiques doesn't fetch their critiquers one by one.
+        self._critiquer_id = self.critiquer_id
 
     matched_on = models.DateTimeField(blank=True, null=True)
 
+    # The email is only sent if the critique is saved
+    @transaction.atomic
     def save(self, *args, **kwargs):
-        if self._critiquer is None and self.critiquer is not None:
+        if self._critiquer_id is None and self.critiquer_id is not None:
             # If a critiquer is assigned by this save
             self.matched_on = timezone.now()
         elif (
-            self._critiquer is not None
-            and self.critiquer is None
+            self._critiquer_id is not None
+            and self.critiquer_id is None
             and not self.submitted
         ):
             # If a critiquer is removed by this save,
@@ -31,7 +38,7 @@ class MatchedCritique(Critique):
             self.annotations = '[]'
 
         if (
-            self._critiquer != self.critiquer and
+            self._critiquer_id != self.critiquer_id and
             self.critiquer.email is not None and
             self.critiquer.email_subscribed
         ):
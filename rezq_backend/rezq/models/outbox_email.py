@@ -0,0 +1,25 @@
+from django.db import models
+from django.utils import timezone
+from rezq.models.abstract.timestamp_model import TimestampModel
+
+
+class OutboxEmail(TimestampModel):
+    """An email waiting to be sent by the send_outbox command
+
+    Written in the same transaction as the change it's about, and deleted
+    once sent. Emails that failed too many times are kept, with the last
+    error, for someone to look at.
+    """
+
+    subject = models.CharField(max_length=256)
+    text_content = models.TextField()
+    html_content = models.TextField()
+    from_address = models.EmailField()
+    to_address = models.EmailField()
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+    send_after = models.DateTimeField(default=timezone.now, db_index=True)
+    last_error = models.TextField(blank=True, default='')
+
+    def __str__(self):
+        return f'{self.subject} to {self.to_address}'
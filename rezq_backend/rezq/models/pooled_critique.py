@@ -1,21 +1,67 @@
 from django.conf import settings
 from django.core.cache import cache
+from django.db.models import Case
+from django.db.models import IntegerField
+from django.db.models import Sum
+from django.db.models import When
 from rezq.models.abstract.critique import Critique
 
 
-class PooledCritique(Critique):
+UPVOTES_CACHE_SECONDS = 30
 
-    @property
-    def upvotes(self):
-        cache_key = f'pcv:{self.id}'
-        cached_votes = cache.get(cache_key)
-        if cached_votes is not None and not settings.DEBUG:
-            return cached_votes
 
-        votes = 0
-        for v in self.pooledcritiquevote_set.all():
-            votes += 1 if v.is_upvote else -1
+def get_upvotes_cache_key(critique_id):
+    return f'pcv:{critique_id}'
+
+
+def get_upvotes(critique_ids):
+    """Upvotes minus downvotes of many pooled critiques, in one query.
+
+    :param critique_ids: pooled critique ids
+    :type critique_ids: list( uuid.UUID )
+
+    :return: critique id to votes
+    :rtype: dict
+    """
+    cache_keys = {id: get_upvotes_cache_key(id) for id in critique_ids}
+    cached_votes = {} if settings.DEBUG else cache.get_many(
+        cache_keys.values(),
+    )
+
+    votes = {
+        id: cached_votes[cache_key]
+        for id, cache_key in cache_keys.items()
+        if cache_key in cached_votes
+    }
+    uncached_ids = [id for id in cache_keys if id not in votes]
 
-        cache.set(cache_key, votes, 30)
+    if uncached_ids:
+        # Critiques without votes are a single row with no vote, so 0
+        uncached_votes = dict(
+            PooledCritique.objects.filter(
+                id__in=uncached_ids,
+            ).annotate(
+                votes=Sum(Case(
+                    When(pooledcritiquevote__is_upvote=True, then=1),
+                    When(pooledcritiquevote__is_upvote=False, then=-1),
+                    default=0,
+                    output_field=IntegerField(),
+                )),
+            ).values_list('id', 'votes'),
+        )
 
-        return votes
+        cache.set_many({
+            cache_keys[id]: critique_votes
+            for id, critique_votes in uncached_votes.items()
+        }, UPVOTES_CACHE_SECONDS)
+
+        votes.update(uncached_votes)
+
+    return votes
+
+
+class PooledCritique(Critique):
+
+    @property
+    def upvotes(self):
+        return get_upvotes([self.id])[self.id]
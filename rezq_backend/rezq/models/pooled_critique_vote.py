@@ -1,5 +1,10 @@
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from rezq.models.abstract.timestamp_model import TimestampModel
+from rezq.models.pooled_critique import get_upvotes_cache_key
 from rezq.models.pooled_critique import PooledCritique
 from rezq.models.user import User
 
@@ -21,3 +26,15 @@ class PooledCritiqueVote(TimestampModel):
 
     class Meta:
         unique_together = ('voter', 'critique')
+
+
+# Also for votes deleted along with their voter, critique or resume
+@receiver(post_save, sender=PooledCritiqueVote)
+@receiver(post_delete, sender=PooledCritiqueVote)
+def invalidate_cached_upvotes(sender, instance, **kwargs):
+    cache.delete(get_upvotes_cache_key(instance.critique_id))
+
+
+@receiver(post_delete, sender=PooledCritique)
+def invalidate_deleted_critique_upvotes(sender, instance, **kwargs):
+    cache.delete(get_upvotes_cache_key(instance.id))
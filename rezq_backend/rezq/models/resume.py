@@ -6,15 +6,24 @@ from rezq.lib import jwt
 from rezq.lib.s3 import S3
 from rezq.models.abstract.timestamp_model import TimestampModel
 from rezq.models.abstract.timestamp_model import TimestampModelManager
+from rezq.models.abstract.timestamp_model import TimestampModelQuerySet
 from rezq.models.pool import Pool
 from rezq.models.user import User
+from rezq.utils.industry import get_industries_bitmask
 from rezq.validators import validate_industries
 
 
 logger = logging.getLogger(__name__)
 
+# Only updated by Critique.save and Critique.delete
+CRITIQUE_COUNT_FIELDS = (
+    'matchedcritique_count', 'matchedcritique_submitted_count',
+    'linkedcritique_count', 'linkedcritique_submitted_count',
+    'pooledcritique_count', 'pooledcritique_submitted_count',
+)
 
-class ResumeManager(TimestampModelManager):
+
+class ResumeQuerySet(TimestampModelQuerySet):
 
     def get_by_token(self, token):
         try:
@@ -30,7 +39,12 @@ class ResumeManager(TimestampModelManager):
 
 class Resume(TimestampModel):
 
-    objects = ResumeManager()
+    class Meta:
+        indexes = [
+            models.Index(fields=['pool', '-created_on', 'id']),
+        ]
+
+    objects = TimestampModelManager.from_queryset(ResumeQuerySet)()
 
     uploader = models.ForeignKey(
         User,
@@ -52,6 +66,9 @@ class Resume(TimestampModel):
         validators=[validate_industries],
     )
 
+    # Bitmask of industries, kept in sync on save
+    industries_bitmask = models.BigIntegerField(default=0, editable=False)
+
     notes_for_critiquer = models.CharField(
         max_length=1024,
         default='',
@@ -61,6 +78,27 @@ class Resume(TimestampModel):
     # Link sharing
     link_enabled = models.BooleanField(default=False)
 
+    # Critique counts, kept in sync by Critique.save and Critique.delete,
+    # so lists of resumes don't need the critiques
+    matchedcritique_count = models.PositiveIntegerField(
+        default=0, editable=False,
+    )
+    matchedcritique_submitted_count = models.PositiveIntegerField(
+        default=0, editable=False,
+    )
+    linkedcritique_count = models.PositiveIntegerField(
+        default=0, editable=False,
+    )
+    linkedcritique_submitted_count = models.PositiveIntegerField(
+        default=0, editable=False,
+    )
+    pooledcritique_count = models.PositiveIntegerField(
+        default=0, editable=False,
+    )
+    pooledcritique_submitted_count = models.PositiveIntegerField(
+        default=0, editable=False,
+    )
+
     pool = models.ForeignKey(
         Pool,
         on_delete=models.SET_NULL,
@@ -107,6 +145,26 @@ class Resume(TimestampModel):
         S3.delete(settings.S3_RESUME_BUCKET, f'{self.id}.jpg')
         super().delete()
 
+    def _save(self, *args, **kwargs):
+        self.industries_bitmask = get_industries_bitmask(self.industries)
+
+        # The counts loaded with the resume may be stale by now
+        if not self._state.adding:
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                deferred_fields = self.get_deferred_fields()
+                update_fields = [
+                    field.attname for field in self._meta.concrete_fields
+                    if not field.primary_key
+                    and field.attname not in deferred_fields
+                ]
+            kwargs['update_fields'] = [
+                name for name in update_fields
+                if name not in CRITIQUE_COUNT_FIELDS
+            ]
+
+        super().save(*args, **kwargs)
+
     if settings.DEBUG:
         def save(self, *args, **kwargs):
             from rezq.models.dev import MockS3File
@@ -116,7 +174,9 @@ class Resume(TimestampModel):
                 MockS3File.objects.create(id=f'{self.id}.pdf')
                 MockS3File.objects.create(id=f'{self.id}.jpg')
 
-            super().save(*args, **kwargs)
+            self._save(*args, **kwargs)
+    else:
+        save = _save
 
     def __str__(self):
         return self.name
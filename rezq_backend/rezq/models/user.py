@@ -3,11 +3,21 @@ import uuid
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth.models import BaseUserManager
+from django.core.cache import cache
 from django.core.validators import RegexValidator
 from django.db import models
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from rezq.lib.s3 import S3
+from rezq.utils.industry import get_industries_bitmask
 from rezq.utils.institution import get_institution_from_email
 from rezq.validators import validate_industries
+from server.constants import USER_CACHE_SECONDS
+
+
+def get_user_cache_key(id):
+    return f'user:{id}'
 
 
 class UserManager(BaseUserManager):
@@ -52,6 +62,28 @@ class UserManager(BaseUserManager):
 
         return self._create_user(username, email, password, **extra_fields)
 
+    def get_cached(self, id):
+        """get(id=id), cached briefly since every authenticated request
+        needs the user. Saving or deleting the user invalidates it,
+        including queryset and admin deletes. Queryset update()s don't
+        send signals, so they are only seen once the cache expires.
+
+        The password hash isn't loaded, so it isn't cached either. It's
+        loaded if the returned user needs it.
+
+        :raises User.DoesNotExist: if the user doesn't exist
+        """
+        cache_key = get_user_cache_key(id)
+        user = cache.get(cache_key)
+        if user is not None:
+            return user
+
+        user = self.defer('password').get(id=id)
+
+        cache.set(cache_key, user, USER_CACHE_SECONDS)
+
+        return user
+
 
 class User(AbstractUser):
 
@@ -146,6 +178,9 @@ class User(AbstractUser):
         validators=[validate_industries],
     )
 
+    # Bitmask of industries, kept in sync on save
+    industries_bitmask = models.BigIntegerField(default=0, editable=False)
+
     email_subscribed = models.BooleanField(default=True)
 
     is_verified = models.BooleanField(default=False)
@@ -243,6 +278,8 @@ class User(AbstractUser):
         if not self.google_id:
             self.google_id = None
 
+        self.industries_bitmask = get_industries_bitmask(self.industries)
+
         super().save(*args, **kwargs)
 
     if settings.DEBUG:
@@ -264,3 +301,9 @@ class User(AbstractUser):
                 self.USERNAME_FIELD,
                 self.normalize_username(self.get_username()),
             )
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    cache.delete(get_user_cache_key(instance.id))
@@ -0,0 +1,35 @@
+from django.db.models import Count
+from django.db.models import OuterRef
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+
+
+CRITIQUE_MODEL_NAMES = ('MatchedCritique', 'LinkedCritique', 'PooledCritique')
+
+
+def _count_subquery(critique_model, **filters):
+    return Coalesce(Subquery(
+        critique_model.objects.filter(
+            resume=OuterRef('pk'), **filters,
+        ).values('resume').annotate(count=Count('id')).values('count'),
+    ), 0)
+
+
+def count_critiques(apps):
+    """Recount the critiques of every resume, one update per critique
+    model. For the migration that added the counts, and data loaded
+    without Critique.save, like fixtures.
+
+    :param apps: django.apps.apps, or the apps of a migration
+    :type apps: django.apps.registry.Apps
+    """
+    resume_model = apps.get_model('rezq', 'Resume')
+    for model_name in CRITIQUE_MODEL_NAMES:
+        critique_model = apps.get_model('rezq', model_name)
+        name = critique_model._meta.model_name
+        resume_model.objects.update(**{
+            f'{name}_count': _count_subquery(critique_model),
+            f'{name}_submitted_count': _count_subquery(
+                critique_model, submitted=True,
+            ),
+        })
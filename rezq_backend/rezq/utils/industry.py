@@ -0,0 +1,41 @@
+from server.constants import INDUSTRY_BITS
+
+
+INDUSTRY_BITMASKS = {
+    industry: 1 << i for i, industry in enumerate(INDUSTRY_BITS)
+}
+
+
+def get_industries_bitmask(industries):
+    """Bitmask of a comma delimited string of industries.
+
+    Unknown industries are ignored; validate_industries rejects them.
+
+    :param industries: comma delimited list of server.constants.INDUSTRIES
+    :type industries: str
+
+    :return: bitmask with bit i set for each INDUSTRY_BITS[i]
+    :rtype: int
+    """
+    bitmask = 0
+    for industry in industries.split(','):
+        bitmask |= INDUSTRY_BITMASKS.get(industry, 0)
+    return bitmask
+
+
+def set_industries_bitmasks(apps):
+    """Recompute the industries bitmask of every critiquer request,
+    resume and user, one update per distinct industries string. For data
+    loaded without save, like fixtures.
+
+    :param apps: django.apps.apps
+    :type apps: django.apps.registry.Apps
+    """
+    for model_name in ('CritiquerRequest', 'Resume', 'User'):
+        model = apps.get_model('rezq', model_name)
+        for industries in model.objects.values_list(
+            'industries', flat=True,
+        ).distinct():
+            model.objects.filter(industries=industries).update(
+                industries_bitmask=get_industries_bitmask(industries),
+            )
@@ -1,7 +1,11 @@
 import logging
-from multiprocessing import Process
+from datetime import timedelta
 
 from django.core.mail import EmailMultiAlternatives
+from django.core.mail import get_connection
+from django.db import transaction
+from django.utils import timezone
+from rezq.models.outbox_email import OutboxEmail
 from server.constants import EMAIL_VERIFICATION_TOKEN_EXPIRE_MINUTES
 from server.constants import FROM_EMAIL_ADDRESS
 from server.constants import PASSWORD_RESET_TOKEN_EXPIRE_MINUTES
@@ -9,35 +13,116 @@ from server.constants import PASSWORD_RESET_TOKEN_EXPIRE_MINUTES
 logger = logging.getLogger(__name__)
 
 
-class EmailProcess(Process):
-    def __init__(
-        self,
-        subject,
-        text_content,
-        html_content,
-        from_address,
-        to_address,
-    ):
-        self.subject = subject
-        self.text_content = text_content
-        self.html_content = html_content
-        self.from_address = from_address
-        self.to_address = to_address
-
-        Process.__init__(self)
-
-    def run(self):
-        try:
-            email = EmailMultiAlternatives(
-                self.subject,
-                self.text_content,
-                self.from_address,
-                [self.to_address],
-            )
-            email.attach_alternative(self.html_content, 'text/html')
-            email.send()
-        except Exception as e:
-            logger.error(f'{type(e)}: {str(e)}')
+# Failed emails are retried after 1, 2, 4 and 8 minutes, then given up on
+MAX_SEND_ATTEMPTS = 5
+RETRY_BACKOFF_SECONDS = 60
+
+OUTBOX_BATCH_SIZE = 100
+
+
+def _enqueue_mail(subject, text_content, html_content, to_address):
+    """Queue an email for the send_outbox command, in the transaction of
+    whatever it's about.
+    """
+    OutboxEmail.objects.create(
+        subject=subject,
+        text_content=text_content,
+        html_content=html_content,
+        from_address=FROM_EMAIL_ADDRESS,
+        to_address=to_address,
+    )
+
+
+def _get_message(outbox_email):
+    message = EmailMultiAlternatives(
+        outbox_email.subject,
+        outbox_email.text_content,
+        outbox_email.from_address,
+        [outbox_email.to_address],
+    )
+    message.attach_alternative(outbox_email.html_content, 'text/html')
+    return message
+
+
+def send_outbox_batch(connection, batch_size=OUTBOX_BATCH_SIZE):
+    """Send the emails that are due, oldest first.
+
+    Sent emails are deleted. Failed ones are retried later, with
+    exponential backoff. Emails being sent by another worker are skipped.
+
+    :param connection: an open email backend, kept open between emails
+    :type connection: django.core.mail.backends.base.BaseEmailBackend
+
+    :return: how many emails were due, up to batch_size
+    :rtype: int
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        outbox_emails = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True).filter(
+                send_after__lte=now,
+                attempts__lt=MAX_SEND_ATTEMPTS,
+            ).order_by('send_after')[:batch_size],
+        )
+
+        sent_ids = []
+        for outbox_email in outbox_emails:
+            try:
+                # Reopens the connection if an error closed it
+                connection.open()
+                connection.send_messages([_get_message(outbox_email)])
+            except Exception as e:
+                logger.error(f'{type(e)}: {str(e)}')
+                connection.close()
+
+                outbox_email.attempts += 1
+                outbox_email.send_after = now + timedelta(
+                    seconds=RETRY_BACKOFF_SECONDS * 2 ** (
+                        outbox_email.attempts - 1
+                    ),
+                )
+                outbox_email.last_error = f'{type(e)}: {str(e)}'
+                outbox_email.save()
+            else:
+                sent_ids.append(outbox_email.id)
+
+        OutboxEmail.objects.filter(id__in=sent_ids).delete()
+
+    return len(outbox_emails)
+
+
+def send_outbox(connection, batch_size=OUTBOX_BATCH_SIZE):
+    """send_outbox_batch until no more emails are due
+
+    :return: how many emails were due
+    :rtype: int
+    """
+    total = 0
+    while True:
+        count = send_outbox_batch(connection, batch_size)
+        total += count
+        if count < batch_size:
+            return total
+
+
+def send_outbox_event(event, context):
+    """Zappa scheduled event sending the queued emails, e.g. in
+    zappa_settings.json:
+
+    "events": [{
+        "function": "rezq.utils.mailer.send_outbox_event",
+        "expression": "rate(1 minute)"
+    }]
+
+    :return: how many emails were due
+    :rtype: int
+    """
+    with get_connection() as connection:
+        count = send_outbox(connection)
+    if count:
+        logger.info('Sent or retried %d emails', count)
+    return count
 
 
 def send_password_reset_mail(email, reset_link):
@@ -58,13 +143,7 @@ def send_password_reset_mail(email, reset_link):
         'Reset Password',
     )
 
-    EmailProcess(
-        subject,
-        text_content,
-        html_content,
-        FROM_EMAIL_ADDRESS,
-        email,
-    ).start()
+    _enqueue_mail(subject, text_content, html_content, email)
 
 
 def send_email_verification_mail(email, verfication_link):
@@ -85,13 +164,7 @@ def send_email_verification_mail(email, verfication_link):
         'Verify Email',
     )
 
-    EmailProcess(
-        subject,
-        text_content,
-        html_content,
-        FROM_EMAIL_ADDRESS,
-        email,
-    ).start()
+    _enqueue_mail(subject, text_content, html_content, email)
 
 
 def send_critique_completed_notif_mail(email, resume_name, unsubscribe_link):
@@ -111,16 +184,10 @@ def send_critique_completed_notif_mail(email, resume_name, unsubscribe_link):
         unsubscribe_link,
     )
 
-    EmailProcess(
-        subject,
-        text_content,
-        html_content,
-        FROM_EMAIL_ADDRESS,
-        email,
-    ).start()
+    _enqueue_mail(subject, text_content, html_content, email)
 
 
-def send_critiquer_matched_notif_mail(email, unsubscribe_link):
+def _get_critiquer_matched_notif_mail(unsubscribe_link):
     subject = 'You\'ve been matched!'
     text_content = (
         'Good news, you have a new resume to critique. '
@@ -137,13 +204,37 @@ def send_critiquer_matched_notif_mail(email, unsubscribe_link):
         unsubscribe_link,
     )
 
-    EmailProcess(
-        subject,
-        text_content,
-        html_content,
-        FROM_EMAIL_ADDRESS,
-        email,
-    ).start()
+    return subject, text_content, html_content
+
+
+def send_critiquer_matched_notif_mail(email, unsubscribe_link):
+    subject, text_content, html_content = _get_critiquer_matched_notif_mail(
+        unsubscribe_link,
+    )
+
+    _enqueue_mail(subject, text_content, html_content, email)
+
+
+def send_critiquer_matched_notif_mails(recipients):
+    """Queues every critiquer matched notification in one query
+
+    :param recipients: email and unsubscribe link of each critiquer
+    :type recipients: list( tuple( str, str ) )
+    """
+    outbox_emails = []
+    for email, unsubscribe_link in recipients:
+        subject, text_content, html_content = (
+            _get_critiquer_matched_notif_mail(unsubscribe_link)
+        )
+        outbox_emails.append(OutboxEmail(
+            subject=subject,
+            text_content=text_content,
+            html_content=html_content,
+            from_address=FROM_EMAIL_ADDRESS,
+            to_address=email,
+        ))
+
+    OutboxEmail.objects.bulk_create(outbox_emails)
 
 
 def get_email_template_html(
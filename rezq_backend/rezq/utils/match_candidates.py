@@ -0,0 +1,70 @@
+class MatchCandidate:
+    """Everything the matchers need to know about one side of a pairing.
+
+    For a matched critique, user_id is the resume uploader.
+    For a critiquer request, user_id is the critiquer.
+    """
+
+    __slots__ = (
+        'id', 'user_id', 'industries', 'created_ts', 'is_waterloo',
+    )
+
+    def __init__(self, id, user_id, industries, created_ts, is_waterloo):
+        self.id = id
+        self.user_id = user_id
+        self.industries = industries
+        self.created_ts = created_ts
+        self.is_waterloo = is_waterloo
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}: {self.id}>'
+
+
+def load_match_candidates(matched_critiques, critiquer_requests):
+    """Fetch matching candidates in one query per queryset.
+
+    :param matched_critiques: unmatched critiques
+    :type matched_critiques: QuerySet of rezq.models.MatchedCritique
+    :param critiquer_requests: critiquer requests
+    :type critiquer_requests: QuerySet of rezq.models.CritiquerRequest
+
+    :return: matched critique candidates and critiquer request candidates
+    :rtype: tuple( list( MatchCandidate ), list( MatchCandidate ) )
+    """
+    matched_critique_candidates = [
+        MatchCandidate(
+            id,
+            uploader_id,
+            industries,
+            created_on.timestamp(),
+            waterloo_id is not None,
+        )
+        for id, created_on, industries, uploader_id, waterloo_id
+        in matched_critiques.values_list(
+            'id',
+            'created_on',
+            'resume__industries',
+            'resume__uploader_id',
+            'resume__uploader__waterloo_id',
+        )
+    ]
+
+    critiquer_request_candidates = [
+        MatchCandidate(
+            id,
+            critiquer_id,
+            industries,
+            created_on.timestamp(),
+            waterloo_id is not None,
+        )
+        for id, created_on, industries, critiquer_id, waterloo_id
+        in critiquer_requests.values_list(
+            'id',
+            'created_on',
+            'industries',
+            'critiquer_id',
+            'critiquer__waterloo_id',
+        )
+    ]
+
+    return matched_critique_candidates, critiquer_request_candidates
@@ -0,0 +1,141 @@
+"""Automatic persisted queries
+
+https://www.apollographql.com/docs/apollo-server/performance/apq/
+
+The client sends only the sha256 hash of its query. If the query isn't
+registered yet, it gets a PersistedQueryNotFound error, and resends the
+hash along with the query to register it. Anyone can register queries,
+so they're limited in size, and forgotten after a day unless they're
+registered again.
+"""
+import hashlib
+from collections import namedtuple
+
+import simplejson as json
+from django.core.cache import cache
+from graphql import GraphQLError
+from graphql import parse
+from graphql.language import ast
+
+
+PERSISTED_QUERY_NOT_FOUND = 'PersistedQueryNotFound'
+
+MAX_PERSISTED_QUERY_SIZE = 16384  # bytes
+PERSISTED_QUERY_CACHE_SECONDS = 86400
+
+PersistedQuery = namedtuple(
+    'PersistedQuery', ['query', 'operation_name', 'is_mutation'],
+)
+
+
+class PersistedQueryNotFound(Exception):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(PERSISTED_QUERY_NOT_FOUND, *args, **kwargs)
+
+
+def _get_persisted_query_cache_key(sha256_hash):
+    return f'pq:{sha256_hash}'
+
+
+def get_persisted_query_hash(extensions):
+    """
+    :param extensions: extensions of a GraphQL request
+    :type extensions: dict or str or None
+
+    :return: sha256 hash of the persisted query, if any
+    :rtype: str or None
+    """
+    if isinstance(extensions, str):
+        try:
+            extensions = json.loads(extensions)
+        except ValueError:
+            return None
+
+    try:
+        return extensions['persistedQuery']['sha256Hash']
+    except (KeyError, TypeError):
+        return None
+
+
+def get_persisted_query(sha256_hash):
+    """
+    :return: the registered query, or None
+    :rtype: PersistedQuery
+    """
+    return cache.get(_get_persisted_query_cache_key(sha256_hash))
+
+
+def register_persisted_query(sha256_hash, query):
+    """Registers a query, and works out its operation once so requests
+    using the hash don't have to.
+
+    :raises ValueError: if the hash isn't the query's, or on invalid or
+        too large query, or one without exactly one operation, since
+        requests using the hash are classified by it
+
+    :rtype: PersistedQuery
+    """
+    encoded_query = query.encode('utf-8')
+    if len(encoded_query) > MAX_PERSISTED_QUERY_SIZE:
+        raise ValueError('query is too large to persist')
+
+    if hashlib.sha256(encoded_query).hexdigest() != sha256_hash:
+        raise ValueError('provided sha does not match query')
+
+    try:
+        definitions = parse(query).definitions
+    except GraphQLError as e:
+        raise ValueError(str(e))
+
+    operations = [
+        definition for definition in definitions
+        if isinstance(definition, ast.OperationDefinition)
+    ]
+
+    if not operations:
+        raise ValueError('query has no operation')
+    if len(operations) > 1:
+        raise ValueError('query has more than one operation')
+    operation, = operations
+
+    persisted_query = PersistedQuery(
+        query=query,
+        operation_name=operation.name.value if operation.name else None,
+        is_mutation=operation.operation == 'mutation',
+    )
+
+    cache.set(
+        _get_persisted_query_cache_key(sha256_hash),
+        persisted_query,
+        PERSISTED_QUERY_CACHE_SECONDS,
+    )
+
+    return persisted_query
+
+
+def resolve_persisted_query(extensions, query):
+    """
+    :param extensions: extensions of a GraphQL request
+    :type extensions: dict or str or None
+    :param query: query of a GraphQL request
+    :type query: str or None
+
+    :raises PersistedQueryNotFound: if only an unknown hash was sent
+    :raises ValueError: if the hash isn't the query's
+
+    :return: the persisted query, or None if it isn't a persisted query
+    :rtype: PersistedQuery
+    """
+    sha256_hash = get_persisted_query_hash(extensions)
+    if sha256_hash is None:
+        return None
+
+    if query:
+        return register_persisted_query(sha256_hash, query)
+
+    persisted_query = get_persisted_query(sha256_hash)
+    if persisted_query is None:
+        raise PersistedQueryNotFound()
+
+    return persisted_query
@@ -0,0 +1,82 @@
+"""Count DB queries, and find N+1 queries
+
+Queries are grouped by shape: their SQL with parameters left out, and
+IN lists of any length alike. The same shape run many times in one
+operation is usually a query in a loop, or a resolver per object.
+"""
+import re
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+
+from django.db import connection
+
+
+# Shapes run more than this many times are reported
+N_PLUS_ONE_THRESHOLD = 5
+
+# Set on GraphQL responses in DEBUG, for tests/system query budgets
+QUERY_COUNT_HEADER = 'X-DB-Query-Count'
+REPEATED_QUERIES_HEADER = 'X-DB-Repeated-Queries'
+
+_IN_LIST_REGEX = re.compile(r'\(%s(?:, %s)*\)')
+
+
+def get_sql_shape(sql):
+    """
+    :param sql: SQL as sent to the cursor, with %s for parameters
+    :type sql: str
+
+    :rtype: str
+    """
+    return _IN_LIST_REGEX.sub('(%s, ...)', sql)
+
+
+class QueryCounter:
+    """A DB execute wrapper that counts queries, their time and shapes
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.ms = 0.0
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.ms += (perf_counter() - start) * 1000
+            self.shapes[get_sql_shape(sql)] += 1
+
+    def get_repeated_queries(self, threshold=None):
+        """
+        :param threshold: defaults to N_PLUS_ONE_THRESHOLD
+        :type threshold: int
+
+        :return: shape to count, of shapes run more than threshold times
+        :rtype: dict
+        """
+        if threshold is None:
+            threshold = N_PLUS_ONE_THRESHOLD
+
+        return {
+            shape: count
+            for shape, count in self.shapes.items()
+            if count > threshold
+        }
+
+
+@contextmanager
+def count_queries():
+    """Count the queries run in the block
+
+    Usage:
+        with count_queries() as queries:
+            ...
+        queries.get_repeated_queries()
+    """
+    queries = QueryCounter()
+    with connection.execute_wrapper(queries):
+        yield queries
@@ -2,6 +2,8 @@ import re
 
 import simplejson as json
 from rezq.models import User
+from rezq.utils.persisted_query import get_persisted_query
+from rezq.utils.persisted_query import get_persisted_query_hash
 
 
 OPERATION_NAME_REGEX = re.compile(r'[a-zA-Z]+')
@@ -14,27 +16,68 @@ def get_client_ip(request):
     return request.META.get('REMOTE_ADDR')
 
 
-def get_gql_operation(request):
-    operation_name = None
-    is_mutation = False
+class ParsedGqlRequest:
+    """The JSON body of a GraphQL request, decoded once.
+
+    data is None if the body isn't a JSON object.
+    """
+
+    __slots__ = ('data', 'operation_name', 'is_mutation', 'variables')
+
+    def __init__(self, request):
+        self.data = None
+        self.operation_name = None
+        self.is_mutation = False
+        self.variables = None
+
+        if not request.body:
+            return
+
+        try:
+            data = json.loads(request.body.decode('utf-8'))
+        except ValueError:
+            return
 
-    if request.body:
-        body_json = json.loads(request.body.decode('utf-8'))
-        operation_name = body_json.get('operationName')
+        if not isinstance(data, dict):
+            return
 
-        if operation_name is None:
-            query = body_json['query'].lstrip()
+        self.data = data
+        self.variables = data.get('variables')
+        self.operation_name = data.get('operationName')
+
+        sha256_hash = get_persisted_query_hash(data.get('extensions'))
+        if sha256_hash is not None and not data.get('query'):
+            # Worked out when it was registered
+            persisted_query = get_persisted_query(sha256_hash)
+            if persisted_query is not None:
+                self.operation_name = persisted_query.operation_name
+                self.is_mutation = persisted_query.is_mutation
+        elif self.operation_name is None and data.get('query'):
+            query = data['query'].lstrip()
 
             if query[:8] == 'mutation':
-                is_mutation = True
+                self.is_mutation = True
                 query = query[8:]
 
             re_search = re.search(OPERATION_NAME_REGEX, query)
 
             if re_search:
-                operation_name = re_search.group()
+                self.operation_name = re_search.group()
+
+
+def get_parsed_gql_request(request):
+    """
+    :return: the parsed request, parsed on first access
+    :rtype: ParsedGqlRequest
+    """
+    if not hasattr(request, '_parsed_gql_request'):
+        request._parsed_gql_request = ParsedGqlRequest(request)
+    return request._parsed_gql_request
 
-    return operation_name, is_mutation
+
+def get_gql_operation(request):
+    parsed_request = get_parsed_gql_request(request)
+    return parsed_request.operation_name, parsed_request.is_mutation
 
 
 def get_client_info_str(request):
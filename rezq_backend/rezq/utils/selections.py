@@ -0,0 +1,91 @@
+from graphene.utils.str_converters import to_camel_case
+from graphql.language import ast
+
+
+def iter_fields(selection_set, fragments):
+    """Fields of a selection set, and of the fragments in it.
+
+    :type selection_set: graphql.language.ast.SelectionSet or None
+    :param fragments: fragment definitions by name, e.g. info.fragments
+    :type fragments: dict
+
+    :rtype: generator( graphql.language.ast.Field )
+    """
+    if selection_set is None:
+        return
+
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            yield selection
+        elif isinstance(selection, ast.FragmentSpread):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                yield from iter_fields(fragment.selection_set, fragments)
+        elif isinstance(selection, ast.InlineFragment):
+            yield from iter_fields(selection.selection_set, fragments)
+
+
+def get_selected_field_asts(info, *path):
+    """The fields selected under the resolving field, with fragments
+    followed.
+
+    :param info: resolve info of the current field
+    :type info: graphql.execution.base.ResolveInfo
+    :param path: names of nested fields to descend into
+    :type path: str
+
+    :rtype: list( graphql.language.ast.Field )
+    """
+    fields = list(info.field_asts)
+
+    for name in path:
+        fields = [
+            child
+            for field in fields
+            for child in iter_fields(field.selection_set, info.fragments)
+            if child.name.value == name
+        ]
+
+    return [
+        child
+        for field in fields
+        for child in iter_fields(field.selection_set, info.fragments)
+    ]
+
+
+def get_selected_fields(info, *path):
+    """Names of the fields selected under the resolving field.
+
+    Fragments are followed. E.g. for
+    `{ pooledResumes { resumes { id uploader { id } } } }`,
+    `get_selected_fields(info, 'resumes')` is `{'id', 'uploader'}`.
+
+    :param info: resolve info of the current field
+    :type info: graphql.execution.base.ResolveInfo
+    :param path: names of nested fields to descend into
+    :type path: str
+
+    :return: selected field names, as written in the query
+    :rtype: set( str )
+    """
+    return {
+        field.name.value for field in get_selected_field_asts(info, *path)
+    }
+
+
+def get_unselected_fields(info, model_field_names, *path):
+    """The model fields of model_field_names not selected under the
+    resolving field, e.g. to defer them.
+
+    :param model_field_names: e.g. ('annotations',)
+    :type model_field_names: iterable( str )
+    :param path: as for get_selected_fields
+    :type path: str
+
+    :rtype: tuple( str )
+    """
+    selected = get_selected_fields(info, *path)
+    return tuple(
+        name for name in model_field_names
+        if to_camel_case(name) not in selected
+    )
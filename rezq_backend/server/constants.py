@@ -14,15 +14,24 @@ USERNAME_REGEX = re.compile(r'^[0-9a-zA-Z]+$')
 
 AUTH_TOKEN_EXPIRE_MINUTES = 720
 
+USER_CACHE_SECONDS = 5
+
 PASSWORD_RESET_TOKEN_EXPIRE_MINUTES = 30
 
 EMAIL_VERIFICATION_TOKEN_EXPIRE_MINUTES = 90
 
 MAX_RESUMES = 5
 
+POOLED_RESUMES_COUNT_CACHE_SECONDS = 60
+
+# Largest `first` argument a field honours
+MAX_PAGE_SIZE = 100
+
 FROM_EMAIL_ADDRESS = 'noreply@rezq.io'
 
-INDUSTRIES = {
+# Bit i of an industries bitmask is INDUSTRY_BITS[i].
+# Append new industries to the end, so existing bitmasks stay valid.
+INDUSTRY_BITS = (
     'ACC',
     'ADM',
     'ANA',
@@ -58,6 +67,8 @@ INDUSTRIES = {
     'TEAC',
     'TECH',
     'WRIT',
-}
+)
+
+INDUSTRIES = set(INDUSTRY_BITS)
 
 PUBLIC = 'bUbl1c623'
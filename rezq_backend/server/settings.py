@@ -140,6 +140,58 @@ else:
         },
     }
 
+# Cache
+# https://docs.djangoproject.com/en/2.0/topics/cache/
+#
+# Processes come and go, so what's cached, and rate limit counts, are
+# shared in Redis. The default cache keeps a local copy of what it reads
+# from there for a few seconds, for namespaces that can be that stale.
+
+REDIS_URL = os.getenv('REDIS_URL') if DEBUG else os.environ['REDIS_URL']
+
+if REDIS_URL:
+    SHARED_CACHE = {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': REDIS_URL,
+        'OPTIONS': {
+            'SOCKET_CONNECT_TIMEOUT': 1,
+            'SOCKET_TIMEOUT': 1,
+        },
+    }
+else:
+    SHARED_CACHE = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'shared',
+    }
+
+CACHES = {
+    'default': {
+        'BACKEND': 'rezq.lib.tiered_cache.TieredCache',
+        'OPTIONS': {
+            'LOCAL_CACHE': 'local',
+            'SHARED_CACHE': 'shared',
+            'LOCAL_TIMEOUTS': {
+                # Persisted queries never change
+                'pq': 60 * 60,
+                's3url': 60,
+                'prc': 10,
+                'pcv': 5,
+                'user': 5,
+            },
+        },
+    },
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'local',
+        'OPTIONS': {
+            'MAX_ENTRIES': 1000,
+        },
+    },
+    'shared': SHARED_CACHE,
+}
+
+RATELIMIT_CACHE = 'shared'
+
 # Password validation
 # https://docs.djangoproject.com/en/2.0/ref/settings/#auth-password-validators
 
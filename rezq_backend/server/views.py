@@ -1,9 +1,11 @@
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.http import HttpResponse
 from django.http import HttpResponseBadRequest
 from django.http import HttpResponseNotFound
 from django.views import View
 from django.views.decorators.csrf import ensure_csrf_cookie
+from rezq.lib.s3 import S3
 from rezq.models.dev import MockS3File
 
 
@@ -67,6 +69,10 @@ class MockS3View(View):
         mock_s3_file.full_clean()
         mock_s3_file.save()
 
+        # Mock S3 keys are unique across buckets
+        for bucket in (settings.S3_RESUME_BUCKET, settings.S3_AVATAR_BUCKET):
+            S3.invalidate_download_url(bucket, mock_s3_file.id)
+
         return HttpResponse(status=201)
 
 
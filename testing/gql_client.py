@@ -7,6 +7,8 @@ class GqlClient:
         self._public_endpoint = f'{endpoint}/v1/public/'
         self._private_endpoint = f'{endpoint}/v1/private/'
 
+        self.last_response = None
+
         self._client = requests.session()
         self._client.head(f'{endpoint}/~csrf')
         self._client.headers['X-CSRFToken'] = self._client.cookies['csrftoken']
@@ -21,6 +23,7 @@ class GqlClient:
         )
 
         resp.raise_for_status()
+        self.last_response = resp
 
         return resp.json()['data']
 
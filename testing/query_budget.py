@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+
+from rezq.utils.query_counter import count_queries
+from rezq.utils.query_counter import QUERY_COUNT_HEADER
+from rezq.utils.query_counter import REPEATED_QUERIES_HEADER
+
+
+def _format_repeated_queries(repeated_queries):
+    return '\n'.join(
+        f'{count} x {shape}' for shape, count in repeated_queries.items()
+    )
+
+
+@contextmanager
+def query_budget(max_queries, threshold=None):
+    """Fail if the block runs more than max_queries queries, or N+1
+    queries, i.e. the same shape more than threshold times, which
+    defaults to N_PLUS_ONE_THRESHOLD.
+
+    For unit tests, which run queries in process.
+    """
+    with count_queries() as queries:
+        yield queries
+
+    repeated_queries = queries.get_repeated_queries(threshold)
+    assert not repeated_queries, (
+        'N+1 queries:\n' + _format_repeated_queries(repeated_queries)
+    )
+    assert queries.count <= max_queries, (
+        f'{queries.count} queries, over the budget of {max_queries}'
+    )
+
+
+def assert_query_budget(response, max_queries):
+    """Fail if the GraphQL request of response ran more than max_queries
+    queries, or N+1 queries.
+
+    For system tests, against the DEBUG server in a container.
+
+    :param response: response to a GraphQL request
+    :type response: requests.Response
+    """
+    assert int(response.headers[REPEATED_QUERIES_HEADER]) == 0, (
+        'N+1 queries'
+    )
+
+    count = int(response.headers[QUERY_COUNT_HEADER])
+    assert count <= max_queries, (
+        f'{count} queries, over the budget of {max_queries}'
+    )
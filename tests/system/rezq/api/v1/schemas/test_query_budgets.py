@@ -0,0 +1,60 @@
+from testing.container import backend_container
+from testing.gql_client import GqlClient
+from testing.query_budget import assert_query_budget
+
+
+# A resume of dzheng@rezq.io in fixtures/dev.json
+RESUME_ID = '0f662362-c108-43d7-ae2b-f2504af1660b'
+
+
+def test_pooled_resumes_query_budget():
+    with backend_container() as uri:
+        client = GqlClient(uri, login=False)
+        client.public("""
+            {
+                pooledResumes(first: 10) {
+                    resumes {
+                        id
+                        name
+                        industries
+                        downloadUrl
+                        pooledcritiqueSet { id summary upvotes }
+                    }
+                    totalCount
+                }
+            }
+        """)
+        assert_query_budget(client.last_response, 5)
+
+
+def test_resume_query_budget():
+    with backend_container() as uri:
+        client = GqlClient(uri)
+        client.private(f"""
+            {{
+                resume(id: "{RESUME_ID}") {{
+                    id
+                    name
+                    downloadUrl
+                    matchedcritiqueSet {{ id }}
+                    pooledcritiqueSet {{ id upvotes }}
+                }}
+            }}
+        """)
+        assert_query_budget(client.last_response, 5)
+
+
+def test_critiques_query_budget():
+    with backend_container() as uri:
+        client = GqlClient(uri)
+        client.private("""
+            {
+                critiques {
+                    id
+                    summary
+                    submitted
+                    resume { id name uploader { id } }
+                }
+            }
+        """)
+        assert_query_budget(client.last_response, 3)
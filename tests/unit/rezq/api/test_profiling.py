@@ -0,0 +1,158 @@
+import json
+import logging
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import RequestFactory
+from django_otp import DEVICE_ID_SESSION_KEY
+from django_otp.middleware import OTPMiddleware
+from django_otp.plugins.otp_static.models import StaticDevice
+from rezq.api.profiling import get_shape
+from rezq.api.profiling import Histogram
+from rezq.api.profiling import metrics
+from rezq.api.profiling import ProfilingMiddleware
+from rezq.api.v1.schema import public_schema
+from rezq.api.views import MetricsView
+from rezq.api.views import PublicGraphQLView
+from rezq.models import Pool
+from rezq.models import PooledCritique
+from rezq.models import Resume
+from rezq.models import User
+from server.constants import PUBLIC
+
+
+QUERY = '''
+query PooledResumes($first: Int) {
+    pooledResumes(first: $first) {
+        resumes { id pooledcritiqueSet { id upvotes } }
+    }
+}
+'''
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics():
+    cache.clear()
+    metrics.clear()
+
+
+def _post(query, **variables):
+    request = RequestFactory().post(
+        '/',
+        json.dumps({'query': query, 'variables': variables}),
+        content_type='application/json',
+    )
+    request.user = AnonymousUser()
+    return PublicGraphQLView.as_view(
+        schema=public_schema, middleware=[ProfilingMiddleware],
+    )(request)
+
+
+def test_histogram():
+    histogram = Histogram()
+    assert histogram.to_dict()['p50'] is None
+
+    for ms in range(1, 101):
+        histogram.add(ms)
+
+    assert histogram.count == 100
+    assert histogram.max == 100
+    assert 50 <= histogram.get_percentile(50) <= 50 * 1.19
+    assert 95 <= histogram.get_percentile(95) <= 95 * 1.19
+    assert histogram.get_percentile(100) == 100
+
+
+def test_get_shape():
+    assert get_shape({
+        'first': 10, 'industries': ['SOFT'], 'after': None, 'empty': [],
+    }) == {
+        'first': 'int', 'industries': ['str'], 'after': 'NoneType',
+        'empty': [],
+    }
+
+
+@pytest.mark.django_db
+def test_operation_and_fields_profiled():
+    Pool.objects.create(id=PUBLIC)
+    user = User.objects.create_user(email='user@rezq.io')
+    resume = Resume.objects.create(
+        uploader=user, name='resume', industries='SOFT', pool_id=PUBLIC,
+    )
+    PooledCritique.objects.create(resume=resume, critiquer=user)
+
+    response = _post(QUERY, first=10)
+    assert 'errors' not in json.loads(response.content.decode())
+
+    profiled = metrics.to_dict()
+    operation = profiled['operations']['PooledResumes']
+    assert operation['ms']['count'] == 1
+    assert operation['mean_db_queries'] > 0
+    assert operation['mean_s3_calls'] == 0
+
+    assert {
+        'PublicQuery.pooledResumes',
+        'PublicResumeTypeWithCount.resumes',
+        'PublicResumeType.pooledcritiqueSet',
+        'PublicPooledCritiqueType.upvotes',
+    } <= profiled['fields'].keys()
+    assert profiled['fields']['PublicQuery.pooledResumes']['count'] == 1
+
+
+@pytest.mark.django_db
+@mock.patch('rezq.api.profiling.SLOW_OPERATION_MS', -1)
+def test_slow_operation_logged(caplog):
+    with caplog.at_level(logging.WARNING, logger='rezq.api.profiling'):
+        _post(QUERY, first=10)
+
+    message = caplog.records[-1].getMessage()
+    assert message.startswith('Slow GraphQL operation: ')
+    logged = json.loads(message.split(': ', 1)[1])
+    assert logged['operation'] == 'PooledResumes'
+    assert logged['variables'] == {'first': 'int'}
+    assert logged['db_queries'] > 0
+
+
+@pytest.mark.django_db
+def test_metrics_view_verified_staff_only():
+    _post('{ serverTime }')
+    _post('{ serverTime }')
+    staff = User.objects.create_superuser(
+        email='staff@rezq.io', password='password',
+    )
+    device = StaticDevice.objects.create(user=staff, name='backup')
+
+    def get_metrics(user, session):
+        request = RequestFactory().get('/metrics/')
+        request.user = user
+        request.session = session
+        OTPMiddleware().process_request(request)
+        return MetricsView.as_view()(request)
+
+    assert get_metrics(AnonymousUser(), {}).status_code == 403
+    # Skipped two-factor auth
+    assert get_metrics(staff, {}).status_code == 403
+
+    response = get_metrics(
+        staff, {DEVICE_ID_SESSION_KEY: device.persistent_id},
+    )
+    assert response.status_code == 200
+    profiled = json.loads(response.content.decode())
+    assert '<anonymous>' in profiled['operations']
+    assert profiled['document_cache']['hits'] >= 1
+
+
+@pytest.mark.django_db
+@mock.patch('rezq.utils.query_counter.N_PLUS_ONE_THRESHOLD', 0)
+def test_query_count_headers_and_n_plus_one_logged(settings, caplog):
+    settings.DEBUG = True
+
+    with caplog.at_level(logging.WARNING, logger='rezq.api.profiling'):
+        response = _post(QUERY, first=10)
+
+    assert int(response['X-DB-Query-Count']) > 0
+    assert int(response['X-DB-Repeated-Queries']) > 0
+    assert 'N+1 queries in GraphQL operation PooledResumes' in (
+        caplog.records[-1].getMessage()
+    )
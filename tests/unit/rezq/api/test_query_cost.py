@@ -0,0 +1,146 @@
+import json
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.test import RequestFactory
+from graphql import parse
+from rezq.api.query_cost import get_cost_variable_names
+from rezq.api.query_cost import get_query_cost
+from rezq.api.query_cost import QUERY_COST_EXCEEDED
+from rezq.api.v1.schema import public_schema
+from rezq.api.views import CachedDocumentBackend
+from rezq.api.views import PublicGraphQLView
+
+
+NESTED_QUERY = '''
+query PooledResumes($first: Int) {
+    pooledResumes(first: $first) {
+        resumes { id pooledcritiqueSet { id } }
+        totalCount
+    }
+}
+'''
+
+
+def _cost(query, operation_name=None, **variables):
+    return get_query_cost(
+        public_schema, parse(query), operation_name, variables,
+    )
+
+
+def test_get_query_cost():
+    assert _cost('{ serverTime }') == 0
+    assert _cost('{ pooledResumes(first: 5) { resumes { id } } }') == 6
+    # Without `first`, every resume is returned
+    assert _cost('{ pooledResumes { resumes { id } } }') == 21
+    # Pages have at most MAX_PAGE_SIZE resumes
+    assert _cost('{ pooledResumes(first: 1000) { resumes { id } } }') == 101
+
+
+def test_get_query_cost_nested():
+    # 1 + 5 resumes * (1 + 20 critiques)
+    assert _cost(NESTED_QUERY, first=5) == 106
+    assert _cost(NESTED_QUERY, 'PooledResumes', first=50) == 1051
+    assert _cost(NESTED_QUERY, 'Nope', first=50) == 0
+
+
+def test_get_query_cost_fragments():
+    assert _cost('''
+        query { pooledResumes(first: 5) { ...Page } }
+        fragment Page on PublicResumeTypeWithCount {
+            resumes { ... on PublicResumeType { id } }
+        }
+    ''') == 6
+
+
+def test_get_cost_variable_names():
+    assert get_cost_variable_names(parse(NESTED_QUERY)) == {'first'}
+    assert get_cost_variable_names(parse('{ serverTime }')) == set()
+
+
+@pytest.fixture
+def backend():
+    backend = CachedDocumentBackend()
+    with mock.patch('rezq.api.views.document_backend', backend):
+        yield backend
+
+
+def _post(query, **variables):
+    cache.clear()
+    request = RequestFactory().post(
+        '/',
+        json.dumps({'query': query, 'variables': variables}),
+        content_type='application/json',
+    )
+    return PublicGraphQLView.as_view(schema=public_schema)(request)
+
+
+@pytest.mark.django_db
+def test_query_cost_exceeded(backend):
+    response = _post('''
+        {
+            pooledResumes(first: 100) {
+                resumes {
+                    pooledcritiqueSet { pooledcritiquecommentSet { id } }
+                }
+            }
+        }
+    ''')
+
+    assert response.status_code == 400
+    assert json.loads(response.content.decode())['errors'][0]['message'] == (
+        QUERY_COST_EXCEEDED
+    )
+
+
+@pytest.mark.django_db
+def test_query_cost_unpaginated_nested(backend):
+    response = _post('''
+        {
+            pooledResumes {
+                resumes {
+                    pooledcritiqueSet {
+                        critiquer { id }
+                        pooledcritiquecommentSet { id }
+                    }
+                }
+            }
+        }
+    ''')
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+@mock.patch('rezq.api.views.get_query_cost', return_value=0)
+def test_query_cost_memoized(mock_get_query_cost, backend):
+    for first in (5, 5, 10):
+        assert _post(NESTED_QUERY, first=first).status_code == 200
+
+    assert [
+        call[0][3]['first'] for call in mock_get_query_cost.call_args_list
+    ] == [5, 10]
+
+
+@pytest.mark.django_db
+@mock.patch('rezq.api.views.get_query_cost', return_value=0)
+def test_query_cost_memoized_by_page_size(mock_get_query_cost, backend):
+    for first in (1000, 2000, None, None):
+        assert _post(NESTED_QUERY, first=first).status_code == 200
+
+    assert [
+        call[0][3]['first'] for call in mock_get_query_cost.call_args_list
+    ] == [1000, None]
+
+
+@pytest.mark.django_db
+@mock.patch('rezq.api.views.get_query_cost', return_value=0)
+@mock.patch('rezq.api.views.COST_CACHE_SIZE', 2)
+def test_query_costs_lru(mock_get_query_cost, backend):
+    for first in (1, 2, 1, 3, 1, 2):
+        assert _post(NESTED_QUERY, first=first).status_code == 200
+
+    assert [
+        call[0][3]['first'] for call in mock_get_query_cost.call_args_list
+    ] == [1, 2, 3, 2]
@@ -0,0 +1,82 @@
+from unittest import mock
+
+import pytest
+from graphql import parse
+from graphql import validate
+from rezq.api.query_depth import QUERY_DEPTH_EXCEEDED
+from rezq.api.query_depth import QueryDepthRule
+from rezq.api.v1.schema import public_schema
+
+
+MAX_DEPTH_QUERY = '''
+{
+    pooledResumes {
+        resumes {
+            pooledcritiqueSet {
+                pooledcritiquecommentSet { id }
+            }
+        }
+    }
+}
+'''
+
+TOO_DEEP_QUERY = '''
+{
+    pooledResumes {
+        resumes {
+            pooledcritiqueSet {
+                pooledcritiquecommentSet { user { id } }
+            }
+        }
+    }
+}
+'''
+
+TOO_DEEP_FRAGMENTS_QUERY = '''
+{
+    pooledResumes { ...Page }
+}
+
+fragment Page on PublicResumeTypeWithCount {
+    resumes { ...Resume }
+}
+
+fragment Resume on PublicResumeType {
+    pooledcritiqueSet {
+        ... on PublicPooledCritiqueType {
+            pooledcritiquecommentSet { user { id } }
+        }
+    }
+}
+'''
+
+
+def _validate(query):
+    return [
+        error.message
+        for error in validate(public_schema, parse(query), [QueryDepthRule])
+    ]
+
+
+@pytest.mark.parametrize('query, errors', [
+    ('{ serverTime }', []),
+    (MAX_DEPTH_QUERY, []),
+    (TOO_DEEP_QUERY, [QUERY_DEPTH_EXCEEDED]),
+    (TOO_DEEP_FRAGMENTS_QUERY, [QUERY_DEPTH_EXCEEDED]),
+])
+def test_query_depth_rule(query, errors):
+    assert _validate(query) == errors
+
+
+def test_query_depth_rule_fragment_cycle():
+    assert _validate('''
+        { pooledResumes { ...A } }
+        fragment A on PublicResumeTypeWithCount { ...B }
+        fragment B on PublicResumeTypeWithCount { ...A }
+    ''') == []
+
+
+@mock.patch.object(QueryDepthRule, '_exceeds_max_depth', return_value=False)
+def test_query_depth_checked_once_per_operation(mock_exceeds_max_depth):
+    assert _validate('query A { serverTime } query B { serverTime }') == []
+    assert mock_exceeds_max_depth.call_count == 2
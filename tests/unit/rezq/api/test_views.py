@@ -0,0 +1,132 @@
+import hashlib
+import json
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.test import RequestFactory
+from rezq.api.v1.schema import private_schema
+from rezq.api.v1.schema import public_schema
+from rezq.api.views import CachedDocumentBackend
+from rezq.api.views import PublicGraphQLView
+
+
+@pytest.fixture
+def backend():
+    backend = CachedDocumentBackend(max_size=2)
+    with mock.patch('rezq.api.views.document_backend', backend):
+        yield backend
+
+
+def _post_body(body):
+    request = RequestFactory().post(
+        '/', json.dumps(body), content_type='application/json',
+    )
+    return PublicGraphQLView.as_view(schema=public_schema)(request)
+
+
+def _post(query):
+    cache.clear()
+    return json.loads(_post_body({'query': query}).content.decode())
+
+
+@mock.patch('rezq.api.views.validate', return_value=[])
+def test_document_parsed_and_validated_once(mock_validate, backend):
+    assert 'serverTime' in _post('{ serverTime }')['data']
+    assert 'serverTime' in _post('{ serverTime }')['data']
+
+    assert (backend.hits, backend.misses) == (1, 1)
+    mock_validate.assert_called_once()
+
+
+def test_invalid_document_cached(backend):
+    for _ in range(2):
+        assert _post('{ nope }')['errors'][0]['message'] == (
+            'Cannot query field "nope" on type "PublicQuery".'
+        )
+
+    assert (backend.hits, backend.misses) == (1, 1)
+
+
+def test_syntax_error_not_cached(backend):
+    for _ in range(2):
+        assert 'Syntax Error' in _post('{')['errors'][0]['message']
+
+    assert (backend.hits, backend.misses) == (0, 2)
+
+
+def test_documents_cached_per_schema(backend):
+    public_document = backend.document_from_string(
+        public_schema, '{ serverTime }',
+    )
+    private_document = backend.document_from_string(
+        private_schema, '{ serverTime }',
+    )
+
+    assert public_document is not private_document
+    assert backend.document_from_string(
+        public_schema, '{ serverTime }',
+    ) is public_document
+
+
+def test_documents_lru(backend):
+    queries = ['{ serverTime }', '{ a: serverTime }', '{ b: serverTime }']
+    for query in queries:
+        backend.document_from_string(public_schema, query)
+    backend.document_from_string(public_schema, queries[0])
+
+    assert (backend.hits, backend.misses) == (0, 4)
+
+
+def test_persisted_query(backend):
+    cache.clear()
+    query = '{ serverTime }'
+    extensions = {
+        'persistedQuery': {
+            'version': 1,
+            'sha256Hash': hashlib.sha256(query.encode()).hexdigest(),
+        },
+    }
+
+    response = _post_body({'extensions': extensions})
+    assert response.status_code == 200
+    assert json.loads(response.content.decode()) == {
+        'errors': [{'message': 'PersistedQueryNotFound'}],
+    }
+
+    response = _post_body({'extensions': extensions, 'query': query})
+    assert 'serverTime' in json.loads(response.content.decode())['data']
+
+    response = _post_body({'extensions': extensions})
+    assert 'serverTime' in json.loads(response.content.decode())['data']
+
+
+def test_persisted_query_hash_mismatch(backend):
+    cache.clear()
+    response = _post_body({
+        'extensions': {'persistedQuery': {'version': 1, 'sha256Hash': 'a'}},
+        'query': '{ serverTime }',
+    })
+
+    assert response.status_code == 400
+
+
+@mock.patch('graphene_django.views.json.loads')
+@mock.patch('rezq.utils.request.json.loads', wraps=json.loads)
+def test_body_decoded_once(mock_loads, mock_graphene_loads, backend):
+    cache.clear()
+    response = _post_body({'query': '{ serverTime }'})
+
+    assert response.status_code == 200
+    mock_loads.assert_called_once()
+    assert not mock_graphene_loads.called
+
+
+def test_invalid_json_body(backend):
+    cache.clear()
+    request = RequestFactory().post(
+        '/', '{', content_type='application/json',
+    )
+    response = PublicGraphQLView.as_view(schema=public_schema)(request)
+
+    assert response.status_code == 400
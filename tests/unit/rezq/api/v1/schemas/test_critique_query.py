@@ -0,0 +1,76 @@
+import pytest
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rezq.api.v1.schema import private_schema
+from rezq.models import MatchedCritique
+from rezq.models import Resume
+from rezq.models import User
+
+
+ANNOTATIONS = '[{"comment": "' + 'x' * 1000 + '"}]'
+
+
+def _execute(user, query):
+    request = RequestFactory().post('/')
+    request.user = user
+
+    with CaptureQueriesContext(connection) as queries:
+        result = private_schema.execute(query, context=request)
+
+    assert not result.errors
+    return result.data, [query['sql'] for query in queries]
+
+
+@pytest.fixture
+def critiquer():
+    critiquer = User.objects.create_user(email='critiquer@rezq.io')
+    resume = Resume.objects.create(
+        uploader=User.objects.create_user(email='uploader@rezq.io'),
+        name='resume',
+        industries='SOFT',
+    )
+    MatchedCritique.objects.create(
+        resume=resume,
+        critiquer=critiquer,
+        summary='summary',
+        annotations=ANNOTATIONS,
+    )
+    return critiquer
+
+
+@pytest.mark.django_db
+def test_critiques_defer_annotations(critiquer):
+    data, queries = _execute(critiquer, '{ critiques { id summary } }')
+
+    assert data['critiques'][0]['summary'] == 'summary'
+    assert len(queries) == 1
+    assert 'annotations' not in queries[0]
+
+
+@pytest.mark.django_db
+def test_critiques_selected_annotations(critiquer):
+    data, queries = _execute(critiquer, '''
+        { critiques { ...Annotations } }
+        fragment Annotations on CritiqueType { annotations }
+    ''')
+
+    assert data['critiques'][0]['annotations'] == ANNOTATIONS
+    assert len(queries) == 1
+
+
+@pytest.mark.django_db
+def test_critique_set_defer_annotations(critiquer):
+    uploader = User.objects.get(email='uploader@rezq.io')
+    data, queries = _execute(
+        uploader, '{ resumes { matchedcritiqueSet { summary } } }',
+    )
+
+    assert data['resumes'][0]['matchedcritiqueSet'] == [
+        {'summary': 'summary'},
+    ]
+    critique_queries = [
+        query for query in queries if 'FROM "rezq_matchedcritique"' in query
+    ]
+    assert len(critique_queries) == 1
+    assert 'annotations' not in critique_queries[0]
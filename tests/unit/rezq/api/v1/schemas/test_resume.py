@@ -0,0 +1,302 @@
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import RequestFactory
+from rezq.api.v1.schema import private_schema
+from rezq.api.v1.schema import public_schema
+from rezq.lib.s3 import S3
+from rezq.models import Pool
+from rezq.models import PooledCritique
+from rezq.models import PooledCritiqueComment
+from rezq.models import Resume
+from rezq.models import User
+from server.constants import PUBLIC
+
+
+POOLED_RESUMES_QUERY = '''
+query PooledResumes($first: Int, $after: String) {
+    pooledResumes(first: $first, after: $after) {
+        resumes { id }
+        endCursor
+        hasNextPage
+    }
+}
+'''
+
+
+def _execute(query, **variables):
+    request = RequestFactory().post('/')
+    request.user = AnonymousUser()
+
+    result = public_schema.execute(
+        query, context=request, variables=variables,
+    )
+
+    assert not result.errors
+    return result.data
+
+
+def _create_pooled_resumes(n):
+    Pool.objects.create(id=PUBLIC)
+    uploader = User.objects.create_user(email='uploader@rezq.io')
+    return [
+        Resume.objects.create(
+            uploader=uploader, name=f'resume{i}', industries='SOFT',
+            pool_id=PUBLIC,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.django_db
+def test_pooled_resumes_cursor_pagination():
+    _create_pooled_resumes(5)
+    expected_ids = [
+        str(id) for id in Resume.objects.order_by(
+            '-created_on', 'id',
+        ).values_list('id', flat=True)
+    ]
+
+    ids = []
+    after = None
+    has_next_page = True
+    while has_next_page:
+        page = _execute(
+            POOLED_RESUMES_QUERY, first=2, after=after,
+        )['pooledResumes']
+        ids += [resume['id'] for resume in page['resumes']]
+        after = page['endCursor']
+        has_next_page = page['hasNextPage']
+
+    assert ids == expected_ids
+
+
+@pytest.mark.django_db
+@mock.patch('rezq.api.query_cost.MAX_PAGE_SIZE', 2)
+def test_pooled_resumes_max_page_size():
+    _create_pooled_resumes(3)
+
+    page = _execute(POOLED_RESUMES_QUERY, first=3)['pooledResumes']
+    assert len(page['resumes']) == 2
+    assert page['hasNextPage']
+
+    # Without `first`, every resume is returned
+    page = _execute(POOLED_RESUMES_QUERY)['pooledResumes']
+    assert len(page['resumes']) == 3
+    assert not page['hasNextPage']
+
+
+@pytest.mark.django_db
+def test_pooled_resumes_invalid_cursor():
+    _create_pooled_resumes(1)
+
+    assert _execute(
+        POOLED_RESUMES_QUERY, first=2, after='nope',
+    )['pooledResumes'] == {
+        'resumes': [], 'endCursor': None, 'hasNextPage': False,
+    }
+
+
+@pytest.mark.django_db
+def test_pooled_resumes_total_count_only_when_selected(
+    django_assert_num_queries,
+):
+    _create_pooled_resumes(3)
+    cache.clear()
+
+    with django_assert_num_queries(1):
+        _execute(POOLED_RESUMES_QUERY, first=2)
+
+    query = '{ pooledResumes(first: 2) { totalCount } }'
+
+    with django_assert_num_queries(2):
+        assert _execute(query)['pooledResumes']['totalCount'] == 3
+
+    # Cached between pages
+    with django_assert_num_queries(1):
+        assert _execute(query)['pooledResumes']['totalCount'] == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('arguments', [
+    'industries: "NOPE"', 'after: "nope"', 'privatePool: "rezq.io"',
+])
+def test_pooled_resumes_empty_total_count(arguments):
+    _create_pooled_resumes(1)
+
+    assert _execute(
+        f'{{ pooledResumes({arguments}) {{ resumes {{ id }} totalCount }} }}',
+    )['pooledResumes'] == {'resumes': [], 'totalCount': 0}
+
+
+@pytest.mark.django_db
+def test_pooled_resumes_total_count_cached_by_filters(
+    django_assert_num_queries,
+):
+    for resume in _create_pooled_resumes(2):
+        resume.industries = 'SOFT,BANK'
+        resume.save()
+    cache.clear()
+
+    query = '{ pooledResumes(industries: "%s") { totalCount } }'
+
+    assert _execute(query % 'SOFT,BANK')['pooledResumes']['totalCount'] == 2
+
+    with django_assert_num_queries(1):
+        assert _execute(
+            query % 'BANK,SOFT',
+        )['pooledResumes']['totalCount'] == 2
+
+
+@pytest.mark.django_db
+def test_pooled_resumes_download_urls_batched():
+    resumes = _create_pooled_resumes(3)
+    uploader_id = resumes[0].uploader_id
+    cache.clear()
+
+    query = '''
+    {
+        pooledResumes(first: 10) {
+            resumes { ...urls uploader { avatarDownloadUrl } }
+        }
+    }
+    fragment urls on PublicResumeType { downloadUrl thumbnailDownloadUrl }
+    '''
+
+    with mock.patch.object(
+        S3, '_get_download_urls', side_effect=lambda bucket_keys: {
+            bucket_key: f'url/{bucket_key[1]}' for bucket_key in bucket_keys
+        },
+    ) as mock_get_download_urls:
+        data = _execute(query)
+
+    mock_get_download_urls.assert_called_once()
+    assert len(mock_get_download_urls.call_args[0][0]) == 3 * 2 + 1
+
+    assert sorted(
+        data['pooledResumes']['resumes'], key=lambda r: r['downloadUrl'],
+    ) == sorted((
+        {
+            'downloadUrl': f'url/{resume.id}.pdf',
+            'thumbnailDownloadUrl': f'url/{resume.id}.jpg',
+            'uploader': {'avatarDownloadUrl': f'url/{uploader_id}.png'},
+        }
+        for resume in resumes
+    ), key=lambda r: r['downloadUrl'])
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('n', [1, 5])
+def test_pooled_resumes_nested_relations_query_count(
+    django_assert_num_queries, n,
+):
+    for resume in _create_pooled_resumes(n):
+        for i in range(2):
+            critiquer = User.objects.create_user(
+                email=f'critiquer{resume.name}{i}@rezq.io',
+            )
+            critique = PooledCritique.objects.create(
+                resume=resume, critiquer=critiquer, submitted=True,
+            )
+            PooledCritiqueComment.objects.create(
+                critique=critique, user=resume.uploader, comment='thanks',
+            )
+
+    query = '''
+    {
+        pooledResumes(first: 10) {
+            resumes {
+                uploader { id }
+                pooledcritiqueSet {
+                    critiquer { id }
+                    upvotes
+                    userUpvoted
+                    pooledcritiquecommentSet { user { id } }
+                }
+            }
+        }
+    }
+    '''
+
+    # Resumes with uploaders, critiques with critiquers, upvotes, and
+    # comments with users
+    with django_assert_num_queries(4):
+        data = _execute(query)
+
+    resumes = data['pooledResumes']['resumes']
+    assert len(resumes) == n
+    for resume in resumes:
+        assert len(resume['pooledcritiqueSet']) == 2
+        for critique in resume['pooledcritiqueSet']:
+            assert critique['critiquer']['id']
+            assert critique['upvotes'] == 0
+            assert critique['userUpvoted'] is None
+            assert critique['pooledcritiquecommentSet'] == [
+                {'user': resume['uploader']},
+            ]
+
+
+@pytest.mark.django_db
+def test_pooled_resumes_critique_counts(django_assert_num_queries):
+    resume, = _create_pooled_resumes(1)
+    PooledCritique.objects.create(resume=resume, submitted=True)
+    PooledCritique.objects.create(resume=resume)
+
+    query = '''
+    {
+        pooledResumes(first: 10) {
+            resumes { pooledcritiqueCount pooledcritiqueSubmittedCount }
+        }
+    }
+    '''
+
+    # No critiques are loaded
+    with django_assert_num_queries(1):
+        data = _execute(query)
+
+    assert data['pooledResumes']['resumes'] == [{
+        'pooledcritiqueCount': 2,
+        'pooledcritiqueSubmittedCount': 1,
+    }]
+
+
+@pytest.mark.django_db
+def test_resume_read_while_uploading_not_deleted():
+    cache.clear()
+    user = User.objects.create_user(email='uploader@rezq.io')
+    user.is_active = True
+    request = RequestFactory().post('/')
+    request.user = user
+
+    def execute(query):
+        result = private_schema.execute(query, context=request)
+        assert not result.errors
+        return result.data
+
+    uploaded = set()
+    with mock.patch.object(
+        S3, '_get_download_urls', side_effect=lambda bucket_keys: {
+            bucket_key: 'url' if bucket_key[1] in uploaded else None
+            for bucket_key in bucket_keys
+        },
+    ):
+        resume = execute('''
+            mutation {
+                uploadResume(name: "resume", industries: "SOFT") {
+                    resume { id downloadUrl }
+                }
+            }
+        ''')['uploadResume']['resume']
+        assert resume['downloadUrl'] is None
+
+        # The browser finishes uploading to S3
+        uploaded.add(f'{resume["id"]}.pdf')
+
+        query = f'{{ resume(id: "{resume["id"]}") {{ id downloadUrl }} }}'
+        assert execute(query)['resume'] == {
+            'id': resume['id'], 'downloadUrl': 'url',
+        }
+
+    assert Resume.objects.filter(id=resume['id']).exists()
@@ -0,0 +1,253 @@
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rezq.api.v1.optimizer import COMPUTED_FIELD_DEPENDENCIES
+from rezq.api.v1.schema import private_schema
+from rezq.api.v1.schema import public_schema
+from rezq.models import LinkedCritique
+from rezq.models import MatchedCritique
+from rezq.models import Pool
+from rezq.models import PooledCritique
+from rezq.models import PooledCritiqueComment
+from rezq.models import Resume
+from rezq.models import User
+from server.constants import PUBLIC
+from testing.query_budget import query_budget
+
+
+N_RESUMES = 3
+
+# Download urls are left out, since they're fetched from S3
+RESUME_FIELDS = '''
+    id name description industries createdOn
+    uploader { id firstName }
+    pool { id }
+'''
+
+POOLED_CRITIQUE_FIELDS = '''
+    id summary submitted upvotes userUpvoted
+    critiquer { id firstName }
+    pooledcritiquecommentSet { id comment user { id } }
+'''
+
+# Root field, requesting user, query, and most queries it may run, with
+# N_RESUMES resumes each with a critique of every kind. The budgets don't
+# depend on N_RESUMES. Resolvers checking that a resume was uploaded
+# query the mock S3 files.
+PRIVATE_QUERIES = [
+    ('critiques', 'critiquer', f'''{{
+        critiques {{ id summary submitted resume {{ {RESUME_FIELDS} }} }}
+    }}''', 1),
+    ('critique', 'critiquer', '''{
+        critique(id: "$critiqueId") {
+            id summary annotations resume { id name uploader { id } }
+        }
+    }''', 1),
+    ('currentlyCritiquing', 'critiquer', '''{
+        currentlyCritiquing { id summary }
+    }''', 1),
+    ('isCritiquerRequestQueued', 'critiquer', '''{
+        isCritiquerRequestQueued
+    }''', 1),
+    ('pooledCritique', 'uploader', f'''{{
+        pooledCritique(id: "$pooledCritiqueId") {{ {POOLED_CRITIQUE_FIELDS} }}
+    }}''', 5),
+    ('profile', 'uploader', '''{
+        profile {
+            id email hasPassword institutions
+            matchedcritiqueSet { id }
+            pooledcritiqueSet { id }
+            linkedcritiqueSet { id }
+        }
+    }''', 3),
+    ('resumes', 'uploader', f'''{{
+        resumes {{
+            {RESUME_FIELDS}
+            token matchedcritiqueCount
+            matchedcritiqueSet {{ id summary }}
+            linkedcritiqueSet {{ id token }}
+            pooledcritiqueSet {{ {POOLED_CRITIQUE_FIELDS} }}
+        }}
+    }}''', 7),
+    ('resume', 'uploader', f'''{{
+        resume(id: "$resumeId") {{
+            {RESUME_FIELDS}
+            userIsPremium pooledCritiquesUserUpvoted
+            matchedcritiqueSet {{ id summary }}
+            pooledcritiqueSet {{ id upvotes }}
+        }}
+    }}''', 6),
+]
+
+PUBLIC_QUERIES = [
+    ('serverTime', '{ serverTime }', 0),
+    ('linkedCritique', '''{
+        linkedCritique(token: "$linkedCritiqueToken") {
+            id summary resume { id name }
+        }
+    }''', 1),
+    ('resume', f'''{{
+        resume(token: "$resumeToken") {{ {RESUME_FIELDS} token }}
+    }}''', 2),
+    ('pooledResumes', f'''{{
+        pooledResumes(first: 10) {{
+            resumes {{
+                {RESUME_FIELDS}
+                pooledcritiqueCount
+                pooledcritiqueSet {{ {POOLED_CRITIQUE_FIELDS} }}
+            }}
+            totalCount
+            endCursor
+        }}
+    }}''', 5),
+    ('pooledResume', f'''{{
+        pooledResume(id: "$resumeId") {{
+            {RESUME_FIELDS}
+            pooledcritiqueSet {{ {POOLED_CRITIQUE_FIELDS} }}
+        }}
+    }}''', 5),
+    ('profile', '''{
+        profile(username: "uploader") {
+            id firstName pooledcritiqueSet { id summary }
+        }
+    }''', 2),
+]
+
+
+def _execute(schema, user, query):
+    request = RequestFactory().post('/')
+    request.user = user
+
+    result = schema.execute(query, context=request)
+
+    assert not result.errors, result.errors
+    return result.data
+
+
+@pytest.fixture
+def data():
+    Pool.objects.create(id=PUBLIC)
+    uploader = User.objects.create_user(
+        email='uploader@rezq.io', username='uploader',
+    )
+    critiquer = User.objects.create_user(email='critiquer@rezq.io')
+
+    for i in range(N_RESUMES):
+        resume = Resume.objects.create(
+            uploader=uploader, name=f'resume{i}', industries='SOFT',
+            pool_id=PUBLIC, link_enabled=True,
+        )
+        # The last one is being critiqued
+        matched_critique = MatchedCritique.objects.create(
+            resume=resume, critiquer=critiquer, summary='matched',
+            submitted=i < N_RESUMES - 1,
+        )
+        linked_critique = LinkedCritique.objects.create(
+            resume=resume, critiquer=critiquer, summary='linked',
+        )
+        pooled_critique = PooledCritique.objects.create(
+            resume=resume, critiquer=critiquer, summary='pooled',
+            submitted=True,
+        )
+        PooledCritiqueComment.objects.create(
+            critique=pooled_critique, user=uploader, comment='thanks',
+        )
+
+    return {
+        'uploader': User.objects.get(id=uploader.id),
+        'critiquer': User.objects.get(id=critiquer.id),
+        'resumeId': str(resume.id),
+        'resumeToken': resume.token,
+        'critiqueId': str(matched_critique.id),
+        'pooledCritiqueId': str(pooled_critique.id),
+        'linkedCritiqueToken': linked_critique.token,
+    }
+
+
+def _substitute(query, data):
+    for name, value in data.items():
+        if isinstance(value, str):
+            query = query.replace(f'${name}', value)
+    return query
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'field,user,query,max_queries', PRIVATE_QUERIES,
+    ids=[query[0] for query in PRIVATE_QUERIES],
+)
+def test_private_query_budget(data, field, user, query, max_queries):
+    with query_budget(max_queries):
+        result = _execute(
+            private_schema, data[user], _substitute(query, data),
+        )
+
+    assert result[field] is not None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'field,query,max_queries', PUBLIC_QUERIES,
+    ids=[query[0] for query in PUBLIC_QUERIES],
+)
+def test_public_query_budget(data, field, query, max_queries):
+    with query_budget(max_queries):
+        result = _execute(
+            public_schema, AnonymousUser(), _substitute(query, data),
+        )
+
+    assert result[field] is not None
+
+
+def _get_sql(user, query):
+    with CaptureQueriesContext(connection) as queries:
+        _execute(private_schema, user, query)
+    return [query['sql'] for query in queries]
+
+
+@pytest.mark.django_db
+def test_only_selected_fields_loaded(data):
+    sql, = _get_sql(
+        data['critiquer'], '{ critiques { summary resume { name } } }',
+    )
+
+    assert 'INNER JOIN "rezq_resume"' in sql
+    assert '"rezq_resume"."name"' in sql
+    assert '"rezq_resume"."description"' not in sql
+    assert '"rezq_matchedcritique"."annotations"' not in sql
+    assert '"rezq_matchedcritique"."submitted_on"' not in sql
+
+
+@pytest.mark.django_db
+def test_computed_field_dependencies_loaded(data):
+    sql, = _get_sql(data['uploader'], '{ resumes { token } }')
+
+    assert '"rezq_resume"."link_enabled"' in sql
+    assert '"rezq_resume"."description"' not in sql
+
+
+@pytest.mark.django_db
+def test_unknown_computed_field_loads_all_fields(data):
+    with mock.patch.dict(COMPUTED_FIELD_DEPENDENCIES[Resume]):
+        del COMPUTED_FIELD_DEPENDENCIES[Resume]['downloadUrl']
+        sql = _get_sql(
+            data['uploader'],
+            '{ resumes { downloadUrl matchedcritiqueSet { id } } }',
+        )
+
+    resume_sql, critique_sql = sql[:2]
+    assert '"rezq_resume"."description"' in resume_sql
+    assert '"rezq_matchedcritique"."summary"' not in critique_sql
+
+
+@pytest.mark.django_db
+def test_invalid_id(data):
+    data = _execute(
+        private_schema, data['critiquer'], '{ critique(id: "1") { id } }',
+    )
+
+    assert data['critique'] is None
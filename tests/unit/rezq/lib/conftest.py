@@ -0,0 +1,34 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+from rezq.utils.match_candidates import MatchCandidate
+
+
+@pytest.fixture
+def now():
+    """Freeze the time the matchers age candidates against
+    """
+    now = timezone.now()
+    with mock.patch('rezq.lib.ga_matcher.timezone.now', return_value=now):
+        yield now
+
+
+@pytest.fixture
+def make_candidate(now):
+    """Factory for a MatchCandidate created age_s seconds ago
+
+    user is the resume uploader of a matched critique, or the critiquer of
+    a critiquer request.
+    """
+    def make_candidate(user, industries, age_s):
+        return MatchCandidate(
+            id=object(),
+            user_id=user.id,
+            industries=industries,
+            created_ts=(now - timedelta(seconds=age_s)).timestamp(),
+            is_waterloo=user.waterloo_id is not None,
+        )
+
+    return make_candidate
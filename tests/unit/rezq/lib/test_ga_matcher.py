@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+import numpy as np
+from rezq.lib.ga_matcher import get_fitness_matrix
+from rezq.lib.ga_matcher import get_matchings
+from rezq.lib.ga_matcher import get_population_fitness
+
+
+ALICE = SimpleNamespace(id=1, waterloo_id='alice')
+BOB = SimpleNamespace(id=2, waterloo_id='bob')
+CAROL = SimpleNamespace(id=3, waterloo_id=None)
+
+
+def test_get_fitness_matrix(make_candidate):
+    matched_critiques = [
+        make_candidate(ALICE, 'SOFT,DATA', 100),
+        make_candidate(CAROL, 'FIN', 200),
+        None,
+    ]
+    critiquer_requests = [
+        make_candidate(ALICE, 'SOFT,DATA', 50),
+        make_candidate(BOB, 'SOFT', 10),
+        make_candidate(CAROL, 'FIN', 20),
+    ]
+
+    fitness_matrix = get_fitness_matrix(matched_critiques, critiquer_requests)
+
+    assert fitness_matrix.shape == (3, 3)
+
+    # Don't critique your own resume
+    assert fitness_matrix[0, 0] == 0.0
+    assert fitness_matrix[1, 2] == 0.0
+
+    # Similarity ratio x age sum x both waterloo
+    assert np.isclose(
+        fitness_matrix[0, 1], (2 / 3) * 110 * 1.2 * 1.2, rtol=1e-3,
+    )
+    assert np.isclose(fitness_matrix[0, 2], 0.0)
+
+    # Only the critiquer is a waterloo student
+    assert np.isclose(fitness_matrix[1, 0], 0.0)
+
+    # no-op's have no fitness
+    assert not fitness_matrix[2].any()
+
+
+def test_get_population_fitness():
+    fitness_matrix = np.array([
+        [1.0, 2.0, 3.0],
+        [4.0, 5.0, 6.0],
+        [7.0, 8.0, 9.0],
+    ])
+
+    assert get_population_fitness(
+        fitness_matrix, [(0, 1, 2), (2, 1, 0), (1, 2, 0)],
+    ) == [15.0, 15.0, 15.0]
+    assert get_population_fitness(
+        fitness_matrix, [(0, 2, 1), (2, 0, 1)],
+    ) == [1.0 + 6.0 + 8.0, 3.0 + 4.0 + 8.0]
+
+
+def test_get_matchings_skips_incompatible(make_candidate):
+    matched_critiques = [
+        make_candidate(ALICE, 'SOFT', 100),
+        make_candidate(BOB, 'SOFT', 100),
+    ]
+    critiquer_requests = [make_candidate(ALICE, 'SOFT', 100)]
+
+    assert get_matchings(matched_critiques, critiquer_requests) == [
+        (matched_critiques[1], critiquer_requests[0]),
+    ]
+
+
+def test_get_matchings_one_to_one_self(make_candidate):
+    assert get_matchings(
+        [make_candidate(ALICE, 'SOFT', 100)],
+        [make_candidate(ALICE, 'SOFT', 100)],
+    ) == []
+
+
+def test_get_fitness_matrix_industries_order_matters(make_candidate):
+    fitness_matrix = get_fitness_matrix(
+        [make_candidate(CAROL, 'SOFT,FIN', 100)],
+        [
+            make_candidate(BOB, 'SOFT,FIN', 100),
+            make_candidate(BOB, 'FIN,SOFT', 100),
+        ],
+    )
+
+    # SequenceMatcher ratio of the industry lists x age sum
+    assert np.isclose(fitness_matrix[0, 0], 1.0 * 200, rtol=1e-3)
+    assert np.isclose(fitness_matrix[0, 1], 0.5 * 200, rtol=1e-3)
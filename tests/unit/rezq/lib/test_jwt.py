@@ -0,0 +1,92 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+from rezq.lib import jwt
+
+
+@pytest.fixture(autouse=True)
+def clear_decode_cache():
+    jwt.clear_decode_cache()
+
+
+def _token(minutes=60, **payload):
+    return jwt.encode({
+        'exp': timezone.now() + timedelta(minutes=minutes), **payload,
+    })
+
+
+@mock.patch('rezq.lib.jwt.jwt.decode', wraps=jwt.jwt.decode)
+def test_decode_cached(mock_decode):
+    token = _token(user='a')
+
+    assert jwt.decode(token)['user'] == 'a'
+    assert jwt.decode(token)['user'] == 'a'
+
+    assert mock_decode.call_count == 1
+
+
+@mock.patch('rezq.lib.jwt.jwt.decode', wraps=jwt.jwt.decode)
+def test_decode_cached_payload_is_a_copy(mock_decode):
+    token = _token(user='a')
+
+    jwt.decode(token)['user'] = 'b'
+
+    assert jwt.decode(token)['user'] == 'a'
+
+
+@mock.patch('rezq.lib.jwt.jwt.decode', wraps=jwt.jwt.decode)
+def test_decode_unverified_not_cached(mock_decode):
+    token = _token(user='a')
+
+    jwt.decode(token, verify=False)
+    jwt.decode(token)
+
+    assert mock_decode.call_count == 2
+
+
+def test_decode_failures_not_cached():
+    token = _token(user='a')[:-1]
+
+    for _ in range(2):
+        with pytest.raises(jwt.exceptions.InvalidSignatureError):
+            jwt.decode(token)
+
+
+@mock.patch('rezq.lib.jwt.jwt.decode', wraps=jwt.jwt.decode)
+def test_decode_cached_respects_exp(mock_decode):
+    token = _token(user='a')
+    jwt.decode(token)
+
+    # Expired tokens aren't served from the cache
+    with mock.patch(
+        'rezq.lib.jwt.time.time',
+        return_value=(timezone.now() + timedelta(minutes=61)).timestamp(),
+    ):
+        jwt.decode(token)
+
+    assert mock_decode.call_count == 2
+
+
+def test_decode_cached_per_secret_key(settings):
+    token = _token(user='a')
+    jwt.decode(token)
+
+    settings.SECRET_KEY = 'rotated'
+
+    with pytest.raises(jwt.exceptions.InvalidSignatureError):
+        jwt.decode(token)
+
+
+@mock.patch('rezq.lib.jwt.DECODE_CACHE_SIZE', 2)
+@mock.patch('rezq.lib.jwt.jwt.decode', wraps=jwt.jwt.decode)
+def test_decode_cache_bounded(mock_decode):
+    tokens = [_token(user=str(i)) for i in range(3)]
+
+    for token in tokens:
+        jwt.decode(token)
+    # Least recently used was evicted
+    jwt.decode(tokens[0])
+
+    assert mock_decode.call_count == 4
@@ -0,0 +1,116 @@
+import random
+from itertools import permutations
+from types import SimpleNamespace
+
+import pytest
+from rezq.lib.ga_matcher import get_fitness_matrix
+from rezq.lib.lsa_matcher import get_matchings
+from server.constants import INDUSTRIES
+
+
+ALICE = SimpleNamespace(id=1, waterloo_id=None)
+BOB = SimpleNamespace(id=2, waterloo_id=None)
+CAROL = SimpleNamespace(id=3, waterloo_id=None)
+DAVE = SimpleNamespace(id=4, waterloo_id=None)
+
+
+def _get_total_fitness(matched_critiques, critiquer_requests, matchings):
+    fitness_matrix = get_fitness_matrix(matched_critiques, critiquer_requests)
+    return sum(
+        fitness_matrix[
+            matched_critiques.index(matched_critique),
+            critiquer_requests.index(critiquer_request),
+        ]
+        for matched_critique, critiquer_request in matchings
+    )
+
+
+def _get_brute_force_fitness(matched_critiques, critiquer_requests):
+    """Greatest total fitness over every assignment of critiquer requests
+    """
+    fitness_matrix = get_fitness_matrix(matched_critiques, critiquer_requests)
+    m, n = fitness_matrix.shape
+    if m > n:
+        fitness_matrix = fitness_matrix.T
+        m, n = n, m
+
+    return max(
+        sum(fitness_matrix[i, j] for i, j in enumerate(assignment))
+        for assignment in permutations(range(n), m)
+    )
+
+
+@pytest.mark.parametrize('m,n', [(3, 3), (4, 2), (2, 5), (5, 5)])
+@pytest.mark.parametrize('seed', range(5))
+def test_get_matchings_is_optimal(make_candidate, m, n, seed):
+    rng = random.Random(seed)
+    users = [
+        SimpleNamespace(id=i, waterloo_id=rng.choice([None, f'user{i}']))
+        for i in range(4)
+    ]
+
+    def random_candidate():
+        return make_candidate(
+            rng.choice(users),
+            ','.join(rng.sample(sorted(INDUSTRIES), rng.randint(1, 3))),
+            rng.uniform(0, 1000),
+        )
+
+    matched_critiques = [random_candidate() for _ in range(m)]
+    critiquer_requests = [random_candidate() for _ in range(n)]
+
+    matchings = get_matchings(matched_critiques, critiquer_requests)
+
+    assert _get_total_fitness(
+        matched_critiques, critiquer_requests, matchings,
+    ) == pytest.approx(
+        _get_brute_force_fitness(matched_critiques, critiquer_requests),
+    )
+
+
+def test_get_matchings_beats_greedy(make_candidate):
+    matched_critiques = [
+        make_candidate(ALICE, 'SOFT', 100),
+        make_candidate(BOB, 'SOFT,DATA', 100),
+    ]
+    critiquer_requests = [
+        make_candidate(CAROL, 'SOFT,DATA', 100),
+        make_candidate(DAVE, 'DATA', 100),
+    ]
+
+    # Greedily giving CAROL to BOB would leave ALICE with no match
+    assert get_matchings(matched_critiques, critiquer_requests) == [
+        (matched_critiques[0], critiquer_requests[0]),
+        (matched_critiques[1], critiquer_requests[1]),
+    ]
+
+
+def test_get_matchings_drops_zero_fitness(make_candidate):
+    matched_critiques = [
+        make_candidate(ALICE, 'SOFT', 100),
+        make_candidate(BOB, 'FIN', 100),
+        make_candidate(CAROL, 'SOFT', 100),
+    ]
+    critiquer_requests = [
+        make_candidate(ALICE, 'SOFT', 100),
+        make_candidate(DAVE, 'SOFT', 100),
+        make_candidate(DAVE, 'DATA', 100),
+    ]
+
+    # The solver assigns all 3 pairs, but BOB's resume has no compatible
+    # critiquer, so its 0.0 pair is dropped
+    assert get_matchings(matched_critiques, critiquer_requests) == [
+        (matched_critiques[0], critiquer_requests[1]),
+        (matched_critiques[2], critiquer_requests[0]),
+    ]
+
+
+def test_get_matchings_all_zero_fitness(make_candidate):
+    assert get_matchings(
+        [make_candidate(ALICE, 'SOFT', 100)],
+        [make_candidate(ALICE, 'SOFT', 100), make_candidate(BOB, 'FIN', 100)],
+    ) == []
+
+
+def test_get_matchings_empty():
+    assert get_matchings([], []) == []
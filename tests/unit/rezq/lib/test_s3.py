@@ -0,0 +1,124 @@
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError
+from django.core.cache import cache
+from rezq.lib.s3 import _MockS3
+from rezq.lib.s3 import _S3
+from rezq.models.dev import MockS3File
+
+
+BUCKET = 'bucket'
+
+
+@pytest.fixture
+def s3():
+    cache.clear()
+    with mock.patch(
+        'django.core.files.storage.default_storage.exists',
+        return_value=True,
+    ):
+        yield _MockS3()
+
+
+@pytest.mark.django_db
+def test_get_download_url_cached(s3, django_assert_num_queries):
+    MockS3File.objects.create(id='a.pdf', file='mock-s3/a.pdf')
+
+    with django_assert_num_queries(1):
+        url = s3.get_download_url(BUCKET, 'a.pdf')
+        assert s3.get_download_url(BUCKET, 'a.pdf') == url
+
+    assert url.endswith('?key=a.pdf')
+    assert (s3.cache_hits, s3.cache_misses) == (1, 1)
+
+
+@pytest.mark.django_db
+def test_get_download_url_missing_not_cached(s3):
+    assert s3.get_download_url(BUCKET, 'a.pdf') is None
+
+    # Uploaded straight to S3
+    MockS3File.objects.create(id='a.pdf', file='mock-s3/a.pdf')
+
+    assert s3.get_download_url(BUCKET, 'a.pdf') is not None
+    assert (s3.cache_hits, s3.cache_misses) == (0, 2)
+
+
+@pytest.mark.django_db
+def test_get_upload_dict_invalidates(s3):
+    assert s3.get_download_url(BUCKET, 'a.pdf') is None
+
+    s3.get_upload_dict(BUCKET, 'a.pdf')
+    MockS3File.objects.create(id='a.pdf', file='mock-s3/a.pdf')
+
+    assert s3.get_download_url(BUCKET, 'a.pdf') is not None
+    assert (s3.cache_hits, s3.cache_misses) == (0, 2)
+
+
+@pytest.mark.django_db
+def test_delete_invalidates(s3):
+    MockS3File.objects.create(id='a.pdf', file='mock-s3/a.pdf')
+    assert s3.get_download_url(BUCKET, 'a.pdf') is not None
+
+    MockS3File.objects.filter(id='a.pdf').delete()
+    s3.delete(BUCKET, 'a.pdf')
+
+    assert s3.get_download_url(BUCKET, 'a.pdf') is None
+    assert (s3.cache_hits, s3.cache_misses) == (0, 2)
+
+
+@pytest.mark.django_db
+def test_cache_keyed_by_bucket(s3):
+    MockS3File.objects.create(id='a.pdf', file='mock-s3/a.pdf')
+    s3.get_download_url(BUCKET, 'a.pdf')
+    s3.get_download_url('other', 'a.pdf')
+
+    assert (s3.cache_hits, s3.cache_misses) == (0, 2)
+
+
+@pytest.mark.django_db
+def test_get_download_urls(s3, django_assert_num_queries):
+    MockS3File.objects.create(id='a.pdf', file='mock-s3/a.pdf')
+    MockS3File.objects.create(id='b.pdf', file='mock-s3/b.pdf')
+    s3.get_download_url(BUCKET, 'a.pdf')
+
+    # Mock S3 gets the uncached files in one query
+    with django_assert_num_queries(1):
+        urls = s3.get_download_urls([
+            (BUCKET, 'a.pdf'), (BUCKET, 'b.pdf'), (BUCKET, 'c.pdf'),
+        ])
+
+    assert urls[(BUCKET, 'a.pdf')].endswith('?key=a.pdf')
+    assert urls[(BUCKET, 'b.pdf')].endswith('?key=b.pdf')
+    assert urls[(BUCKET, 'c.pdf')] is None
+    assert (s3.cache_hits, s3.cache_misses) == (1, 3)
+
+    # Only the missing file is fetched again
+    with django_assert_num_queries(1):
+        assert s3.get_download_urls([
+            (BUCKET, 'a.pdf'), (BUCKET, 'b.pdf'), (BUCKET, 'c.pdf'),
+        ]) == urls
+
+
+def test_s3_get_download_urls_in_parallel():
+    cache.clear()
+    s3 = _S3()
+    s3.client = mock.Mock()
+    s3.client.generate_presigned_url.side_effect = (
+        lambda *args, Params, **kwargs: f"url/{Params['Key']}"
+    )
+
+    def head_object(Bucket, Key):
+        if Key == 'missing.pdf':
+            raise ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+
+    s3.client.head_object.side_effect = head_object
+
+    keys = [f'{i}.pdf' for i in range(20)] + ['missing.pdf']
+    urls = s3.get_download_urls([(BUCKET, key) for key in keys])
+
+    assert urls == {
+        (BUCKET, key): None if key == 'missing.pdf' else f'url/{key}'
+        for key in keys
+    }
+    assert s3.client.head_object.call_count == len(keys)
@@ -0,0 +1,149 @@
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache import caches
+from django.test import override_settings
+from rezq.lib.tiered_cache import cache_stats
+from rezq.lib.tiered_cache import get_namespace
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    cache_stats.clear()
+
+
+def test_get_namespace():
+    assert get_namespace('user:1') == 'user'
+    assert get_namespace('s3url:bucket:key') == 's3url'
+    assert get_namespace('key') == ''
+
+
+def test_get_copies_locally():
+    caches['shared'].set('user:1', 'user')
+
+    assert cache.get('user:1') == 'user'
+    assert caches['local'].get('user:1') == 'user'
+
+    caches['shared'].delete('user:1')
+    assert cache.get('user:1') == 'user'
+    assert cache.get('user:2') is None
+
+    assert cache_stats.to_dict() == {
+        'user': {
+            'local_hits': 1,
+            'shared_hits': 1,
+            'misses': 1,
+            'hit_rate': 2 / 3,
+        },
+    }
+
+
+def test_no_local_copies_without_local_timeout():
+    cache.set('rl:1', 1)
+    cache.get('rl:1')
+
+    assert caches['shared'].get('rl:1') == 1
+    assert caches['local'].get('rl:1') is None
+    assert cache_stats.to_dict()['rl']['shared_hits'] == 1
+
+
+def test_get_many():
+    cache.set('user:1', 1)
+    caches['shared'].set('user:2', 2)
+
+    assert cache.get_many(['user:1', 'user:2', 'user:3']) == {
+        'user:1': 1,
+        'user:2': 2,
+    }
+    assert caches['local'].get_many(['user:1', 'user:2']) == {
+        'user:1': 1,
+        'user:2': 2,
+    }
+    assert cache_stats.to_dict()['user']['misses'] == 1
+
+
+def test_writes_go_to_both():
+    cache.set('user:1', 1)
+    assert caches['local'].get('user:1') == 1
+    assert caches['shared'].get('user:1') == 1
+
+    assert cache.incr('user:1') == 2
+    assert caches['local'].get('user:1') is None
+    assert cache.get('user:1') == 2
+
+    cache.delete('user:1')
+    assert caches['local'].get('user:1') is None
+    assert caches['shared'].get('user:1') is None
+
+    assert cache.add('user:1', 3)
+    assert not cache.add('user:1', 4)
+    assert cache.get('user:1') == 3
+
+
+def test_expired_write_removes_local_copy():
+    cache.set('user:1', 1)
+    cache.set('user:1', 2, 0)
+
+    assert caches['local'].get('user:1') is None
+    assert cache.get('user:1') is None
+
+
+@pytest.fixture
+def redis_shared_cache():
+    """Use a fake Redis as the shared cache
+    """
+    pytest.importorskip('django_redis')
+    fakeredis = pytest.importorskip('fakeredis')
+
+    shared_cache = {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': 'redis://localhost:6379/0',
+    }
+    server = fakeredis.FakeServer()
+    with mock.patch(
+        'django_redis.client.DefaultClient.connect',
+        return_value=fakeredis.FakeStrictRedis(server=server),
+    ), override_settings(CACHES={
+        **settings.CACHES, 'shared': shared_cache,
+    }):
+        yield caches['shared']
+
+
+def test_redis_stand_in(redis_shared_cache):
+    cache.set('user:1', {'id': 1})
+    cache.set('rl:1', 1)
+    assert cache.incr('rl:1') == 2
+
+    caches['local'].clear()
+    assert cache.get_many(['user:1', 'rl:1']) == {
+        'user:1': {'id': 1},
+        'rl:1': 2,
+    }
+
+
+def test_local_copy_expires_with_shared(redis_shared_cache):
+    redis_shared_cache.set('s3url:1', 'url', 2)
+    redis_shared_cache.set('s3url:2', 'url', None)
+    redis_shared_cache.set('s3url:3', 'url', 0)
+
+    with mock.patch.object(
+        caches['local'], 'set_many', wraps=caches['local'].set_many,
+    ) as mock_set_many:
+        assert cache.get_many(['s3url:1', 's3url:2', 's3url:3']) == {
+            's3url:1': 'url',
+            's3url:2': 'url',
+        }
+
+    local_timeouts = {
+        key: timeout
+        for (data, timeout, version), _ in mock_set_many.call_args_list
+        for key in data
+    }
+    # Capped at what the shared copy has left
+    assert 1 < local_timeouts['s3url:1'] <= 2
+    assert local_timeouts['s3url:2'] == (
+        settings.CACHES['default']['OPTIONS']['LOCAL_TIMEOUTS']['s3url']
+    )
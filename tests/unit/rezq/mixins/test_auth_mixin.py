@@ -2,6 +2,7 @@ from datetime import timedelta
 from unittest import mock
 
 import pytest
+from django.core.cache import cache
 from django.http import HttpResponseBadRequest
 from django.http import HttpResponseForbidden
 from django.utils import timezone
@@ -28,6 +29,11 @@ MISSING_USER_TOKEN = jwt.encode({
 })
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
 @pytest.mark.parametrize(
     'expected_log,token,resp_type', [
         ('Missing auth header', None, HttpResponseBadRequest),
@@ -66,7 +72,8 @@ MISSING_USER_TOKEN = jwt.encode({
     ],
 )
 @mock.patch(
-    'rezq.mixins.auth_mixin.User.objects.get', side_effect=User.DoesNotExist(),
+    'rezq.mixins.auth_mixin.User.objects.get_cached',
+    side_effect=User.DoesNotExist(),
 )
 @mock.patch('rezq.mixins.auth_mixin.logger')
 def test_dispatch_unauthorized(
@@ -86,7 +93,7 @@ def test_dispatch_unauthorized(
 
 
 @mock.patch(
-    'rezq.mixins.auth_mixin.User.objects.get', return_value=USER,
+    'rezq.mixins.auth_mixin.User.objects.get_cached', return_value=USER,
 )
 @mock.patch('rezq.mixins.auth_mixin.logger')
 def test_dispatch_authorized(mock_logger, mock_user_get):
@@ -109,3 +116,33 @@ def test_dispatch_authorized(mock_logger, mock_user_get):
     assert not mock_logger.info.called
     assert response == RESPONSE
     assert mock_request.user == USER
+
+
+@pytest.mark.django_db
+@mock.patch('rezq.mixins.auth_mixin.jwt.decode', wraps=jwt.decode)
+def test_dispatch_authorized_decodes_once(
+    mock_decode, django_assert_num_queries,
+):
+    user = User.objects.create_user(email='user@rezq.io', is_active=True)
+    token = jwt.encode({
+        'user': str(user.id), 'exp': timezone.now() + timedelta(minutes=60),
+    })
+
+    class BaseView():
+        dispatch = mock.MagicMock(return_value=RESPONSE)
+
+    class MockAuthView(AuthMixin, BaseView):
+        pass
+
+    mock_auth_view = MockAuthView()
+    mock_request = mock.MagicMock()
+
+    mock_request.META = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    with django_assert_num_queries(1):
+        mock_auth_view.dispatch(mock_request, *ARGS, **KWARGS)
+        mock_auth_view.dispatch(mock_request, *ARGS, **KWARGS)
+
+    # Once per request, and the user is cached
+    assert mock_decode.call_count == 2
+    assert mock_request.user == user
@@ -0,0 +1,108 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import caches
+from rezq.mixins.ratelimit import get_operation_group
+from rezq.mixins.ratelimit import LOCAL_MAX_PENDING
+from rezq.mixins.ratelimit import Rate
+from rezq.mixins.ratelimit import Ratelimiter
+
+
+# The start of a window
+NOW = 60 * 1000000
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    caches['shared'].clear()
+
+
+@pytest.fixture
+def mock_time():
+    with mock.patch(
+        'rezq.mixins.ratelimit.time', return_value=NOW,
+    ) as mock_time:
+        yield mock_time
+
+
+def test_rate_parse():
+    assert Rate.parse('60/m') == Rate(60, 60)
+    assert Rate.parse('5/10s') == Rate(5, 10)
+    assert Rate.parse('1/d') == Rate(1, 24 * 60 * 60)
+
+    with pytest.raises(ValueError):
+        Rate.parse('60/minute')
+
+
+def test_get_operation_group():
+    assert get_operation_group('resume', False) == 'query:resume'
+    assert get_operation_group('pooledResumes', False) == 'query'
+    assert get_operation_group('resume', True) == 'mutation'
+    assert get_operation_group(None, False) == 'query'
+
+
+def test_is_ratelimited(mock_time):
+    ratelimiter = Ratelimiter({'group': '100/m'})
+
+    assert not any(
+        ratelimiter.is_ratelimited('group', 'key') for _ in range(100)
+    )
+    assert ratelimiter.is_ratelimited('group', 'key')
+    assert not ratelimiter.is_ratelimited('group', 'other')
+
+
+def test_is_ratelimited_sliding_window(mock_time):
+    ratelimiter = Ratelimiter({'group': '100/m'})
+    for _ in range(100):
+        ratelimiter.is_ratelimited('group', 'key')
+
+    # Half of the last window still counts
+    mock_time.return_value = NOW + 90
+    assert not any(
+        ratelimiter.is_ratelimited('group', 'key') for _ in range(50)
+    )
+    assert ratelimiter.is_ratelimited('group', 'key')
+
+
+def test_is_ratelimited_syncs_in_batches(mock_time):
+    ratelimiter = Ratelimiter({'group': '1000/m'})
+
+    with mock.patch.object(
+        ratelimiter, '_sync', wraps=ratelimiter._sync,
+    ) as mock_sync:
+        for _ in range(5 * LOCAL_MAX_PENDING):
+            ratelimiter.is_ratelimited('group', 'key')
+
+    # The first request, then every LOCAL_MAX_PENDING. The last ones are
+    # still pending.
+    assert mock_sync.call_count == 5
+    assert caches['shared'].get(f'rl:group:key:{NOW // 60}') == (
+        4 * LOCAL_MAX_PENDING + 1
+    )
+
+
+def test_is_ratelimited_syncs_near_limit(mock_time):
+    ratelimiter = Ratelimiter({'group': '10/m'})
+
+    with mock.patch.object(
+        ratelimiter, '_sync', wraps=ratelimiter._sync,
+    ) as mock_sync:
+        limited = [
+            ratelimiter.is_ratelimited('group', 'key') for _ in range(11)
+        ]
+
+    assert limited == [False] * 10 + [True]
+    # Under half the limit, only the first request syncs
+    assert mock_sync.call_count == 11 - 3
+
+
+def test_is_ratelimited_across_processes(mock_time):
+    ratelimiters = [Ratelimiter({'group': '100/m'}) for _ in range(4)]
+
+    allowed = sum(
+        not ratelimiter.is_ratelimited('group', 'key')
+        for _ in range(100)
+        for ratelimiter in ratelimiters
+    )
+
+    assert 100 <= allowed <= 100 + len(ratelimiters) * LOCAL_MAX_PENDING
@@ -0,0 +1,113 @@
+import pytest
+from django.apps import apps
+from rezq.models import LinkedCritique
+from rezq.models import MatchedCritique
+from rezq.models import PooledCritique
+from rezq.models import Resume
+from rezq.models import User
+from rezq.models.resume import CRITIQUE_COUNT_FIELDS
+from rezq.utils.critique_counts import count_critiques
+
+
+def _get_counts(resume):
+    return Resume.objects.values(*CRITIQUE_COUNT_FIELDS).get(id=resume.id)
+
+
+@pytest.fixture
+def resume():
+    return Resume.objects.create(
+        uploader=User.objects.create_user(email='uploader@rezq.io'),
+        name='resume',
+        industries='SOFT',
+    )
+
+
+@pytest.mark.django_db
+def test_counts_kept_in_sync(resume):
+    pooled_critique = PooledCritique.objects.create(resume=resume)
+    PooledCritique.objects.create(resume=resume, submitted=True)
+    LinkedCritique.objects.create(resume=resume)
+    MatchedCritique.objects.create(resume=resume)
+    assert _get_counts(resume) == {
+        'matchedcritique_count': 1,
+        'matchedcritique_submitted_count': 0,
+        'linkedcritique_count': 1,
+        'linkedcritique_submitted_count': 0,
+        'pooledcritique_count': 2,
+        'pooledcritique_submitted_count': 1,
+    }
+
+    pooled_critique.summary = 'summary'
+    pooled_critique.save()
+    assert _get_counts(resume)['pooledcritique_submitted_count'] == 1
+
+    pooled_critique = PooledCritique.objects.get(id=pooled_critique.id)
+    pooled_critique.submitted = True
+    pooled_critique.save()
+    pooled_critique.save()
+    assert _get_counts(resume)['pooledcritique_submitted_count'] == 2
+
+    # Not knowing if it was submitted
+    PooledCritique.objects.defer('submitted').get(
+        id=pooled_critique.id,
+    ).delete()
+    MatchedCritique.objects.get().delete()
+    assert _get_counts(resume) == {
+        'matchedcritique_count': 0,
+        'matchedcritique_submitted_count': 0,
+        'linkedcritique_count': 1,
+        'linkedcritique_submitted_count': 0,
+        'pooledcritique_count': 1,
+        'pooledcritique_submitted_count': 1,
+    }
+
+
+@pytest.mark.django_db
+def test_counts_kept_on_stale_resume_save(resume):
+    stale_resume = Resume.objects.get(id=resume.id)
+    critique = PooledCritique.objects.create(resume=resume, submitted=True)
+
+    stale_resume.name = 'renamed'
+    stale_resume.save()
+
+    assert Resume.objects.get(id=resume.id).name == 'renamed'
+    assert _get_counts(resume)['pooledcritique_count'] == 1
+    assert _get_counts(resume)['pooledcritique_submitted_count'] == 1
+
+    # The counts don't go below zero
+    critique.delete()
+    assert _get_counts(resume)['pooledcritique_count'] == 0
+
+
+@pytest.mark.django_db
+def test_counts_kept_on_concurrent_saves(resume):
+    critique = PooledCritique.objects.create(resume=resume)
+    # Both loaded before either is submitted
+    critiques = [PooledCritique.objects.get(id=critique.id) for _ in 'ab']
+
+    for critique in critiques:
+        critique.submitted = True
+        critique.save()
+    assert _get_counts(resume)['pooledcritique_submitted_count'] == 1
+
+    for critique in critiques:
+        critique.delete()
+    assert _get_counts(resume)['pooledcritique_count'] == 0
+    assert _get_counts(resume)['pooledcritique_submitted_count'] == 0
+
+
+@pytest.mark.django_db
+def test_count_critiques(resume):
+    other_resume = Resume.objects.create(name='other', industries='SOFT')
+    PooledCritique.objects.create(resume=resume, submitted=True)
+    PooledCritique.objects.create(resume=resume)
+    MatchedCritique.objects.create(resume=other_resume)
+    expected_counts = [_get_counts(resume), _get_counts(other_resume)]
+
+    Resume.objects.update(**{field: 0 for field in CRITIQUE_COUNT_FIELDS})
+    count_critiques(apps)
+
+    assert [
+        _get_counts(resume), _get_counts(other_resume),
+    ] == expected_counts
+    assert expected_counts[0]['pooledcritique_count'] == 2
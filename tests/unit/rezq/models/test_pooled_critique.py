@@ -0,0 +1,56 @@
+import pytest
+from django.core.cache import cache
+from rezq.models import PooledCritique
+from rezq.models import PooledCritiqueVote
+from rezq.models import Resume
+from rezq.models import User
+from rezq.models.pooled_critique import get_upvotes
+
+
+@pytest.mark.django_db
+def test_get_upvotes(django_assert_num_queries):
+    uploader = User.objects.create_user(email='uploader@rezq.io')
+    resume = Resume.objects.create(
+        uploader=uploader, name='resume', industries='SOFT',
+    )
+    voters = [
+        User.objects.create_user(email=f'voter{i}@rezq.io') for i in range(3)
+    ]
+
+    critiques = [
+        PooledCritique.objects.create(resume=resume) for _ in range(3)
+    ]
+    for voter, is_upvote in zip(voters, [True, True, False]):
+        PooledCritiqueVote.objects.create(
+            voter=voter, critique=critiques[0], is_upvote=is_upvote,
+        )
+    PooledCritiqueVote.objects.create(
+        voter=voters[0], critique=critiques[1], is_upvote=False,
+    )
+
+    with django_assert_num_queries(1):
+        assert get_upvotes([c.id for c in critiques]) == {
+            critiques[0].id: 1,
+            critiques[1].id: -1,
+            critiques[2].id: 0,
+        }
+
+    assert critiques[0].upvotes == 1
+
+
+@pytest.mark.django_db
+def test_upvotes_invalidated_by_cascade():
+    cache.clear()
+    resume = Resume.objects.create(name='resume', industries='SOFT')
+    critique = PooledCritique.objects.create(resume=resume)
+    voter = User.objects.create_user(email='voter@rezq.io')
+    PooledCritiqueVote.objects.create(voter=voter, critique=critique)
+    assert get_upvotes([critique.id]) == {critique.id: 1}
+
+    # Deleting the voter deletes their vote
+    voter.delete()
+    assert get_upvotes([critique.id]) == {critique.id: 0}
+
+    critique_id = critique.id
+    resume.delete()
+    assert get_upvotes([critique_id]) == {}
@@ -0,0 +1,72 @@
+import time
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from rezq.models import User
+from rezq.models.user import get_user_cache_key
+from server.constants import USER_CACHE_SECONDS
+
+
+@pytest.mark.django_db
+def test_get_cached(django_assert_num_queries):
+    cache.clear()
+    user = User.objects.create_user(email='user@rezq.io')
+
+    with django_assert_num_queries(1):
+        assert User.objects.get_cached(user.id) == user
+        assert User.objects.get_cached(user.id) == user
+
+    user.first_name = 'Rez'
+    user.save()
+
+    assert User.objects.get_cached(user.id).first_name == 'Rez'
+
+    user.delete()
+
+    with pytest.raises(User.DoesNotExist):
+        User.objects.get_cached(user.id)
+
+
+@pytest.mark.django_db
+def test_get_cached_invalidated_by_queryset_delete():
+    cache.clear()
+    user = User.objects.create_user(email='user@rezq.io')
+    User.objects.get_cached(user.id)
+
+    # Like the admin's "Delete selected users" action
+    User.objects.filter(id=user.id).delete()
+
+    with pytest.raises(User.DoesNotExist):
+        User.objects.get_cached(user.id)
+
+
+@pytest.mark.django_db
+def test_get_cached_expires_after_queryset_update():
+    cache.clear()
+    user = User.objects.create_user(email='user@rezq.io')
+    User.objects.get_cached(user.id)
+
+    # update() doesn't send post_save, so the cached user is stale...
+    User.objects.filter(id=user.id).update(is_active=True)
+    assert not User.objects.get_cached(user.id).is_active
+
+    # ...but only until it expires
+    expired = time.time() + USER_CACHE_SECONDS + 1
+    with mock.patch('time.time', return_value=expired):
+        assert User.objects.get_cached(user.id).is_active
+
+
+@pytest.mark.django_db
+def test_get_cached_without_password():
+    cache.clear()
+    user = User.objects.create_user(email='user@rezq.io', password='secret')
+
+    cached_user = User.objects.get_cached(user.id)
+    assert 'password' not in cache.get(get_user_cache_key(user.id)).__dict__
+
+    # Loaded when needed
+    assert cached_user.check_password('secret')
+    cached_user.first_name = 'Rez'
+    cached_user.save()
+    assert User.objects.get(id=user.id).check_password('secret')
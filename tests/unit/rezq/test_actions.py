@@ -0,0 +1,85 @@
+from unittest import mock
+
+import pytest
+from rezq.actions import _send_critiquer_matched_notif_mails
+from rezq.actions import GA
+from rezq.actions import LSA
+from rezq.actions import match
+from rezq.models import CritiquerRequest
+from rezq.models import MatchedCritique
+from rezq.models import Resume
+from rezq.models import User
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize('matcher', [GA, LSA])
+@mock.patch('rezq.actions.send_critiquer_matched_notif_mails')
+def test_match(mock_send_mails, matcher):
+    uploader = User.objects.create_user(email='uploader@rezq.io')
+    resume = Resume.objects.create(
+        uploader=uploader, name='resume', industries='SOFT',
+    )
+    matched_critique = MatchedCritique.objects.create(resume=resume)
+
+    # Can't critique your own resume
+    CritiquerRequest.objects.create(critiquer=uploader, industries='SOFT')
+
+    critiquer = User.objects.create_user(email='critiquer@rezq.io')
+    CritiquerRequest.objects.create(critiquer=critiquer, industries='SOFT')
+
+    match(matcher=matcher)
+
+    matched_critique.refresh_from_db()
+    assert matched_critique.critiquer == critiquer
+    assert matched_critique.matched_on is not None
+    assert list(
+        CritiquerRequest.objects.values_list('critiquer', flat=True),
+    ) == [uploader.id]
+    mock_send_mails.assert_called_once_with([
+        ('critiquer@rezq.io', mock.ANY),
+    ])
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize('n', [1, 10, 50])
+@mock.patch('rezq.actions.send_critiquer_matched_notif_mails')
+def test_match_query_count(
+    mock_send_mails, django_assert_num_queries, n,
+):
+    for i in range(n):
+        uploader = User.objects.create_user(email=f'uploader{i}@rezq.io')
+        resume = Resume.objects.create(
+            uploader=uploader, name=f'resume{i}', industries='SOFT',
+        )
+        MatchedCritique.objects.create(resume=resume)
+
+        critiquer = User.objects.create_user(email=f'critiquer{i}@rezq.io')
+        CritiquerRequest.objects.create(critiquer=critiquer, industries='SOFT')
+
+    # Load candidates (2), update critiques (1), collect and delete
+    # requests (2), and fetch critiquer emails to queue (1)
+    with django_assert_num_queries(6):
+        match(matcher=LSA)
+
+    assert not MatchedCritique.objects.filter(critiquer=None).exists()
+    assert not CritiquerRequest.objects.exists()
+    assert len(mock_send_mails.call_args[0][0]) == n
+
+
+@pytest.mark.django_db
+@mock.patch('rezq.actions.send_critiquer_matched_notif_mails')
+def test_send_critiquer_matched_notif_mails(mock_send_mails):
+    critiquer = User.objects.create_user(email='critiquer@rezq.io')
+    unsubscribed = User.objects.create_user(
+        email='unsubscribed@rezq.io', email_subscribed=False,
+    )
+
+    # One email per matched critique
+    _send_critiquer_matched_notif_mails(
+        [critiquer.id, unsubscribed.id, critiquer.id],
+    )
+
+    mock_send_mails.assert_called_once_with([
+        ('critiquer@rezq.io', mock.ANY),
+        ('critiquer@rezq.io', mock.ANY),
+    ])
@@ -0,0 +1,62 @@
+import pytest
+from django.core.management import call_command
+from rezq.models import CritiquerRequest
+from rezq.models import Resume
+from rezq.models import User
+from rezq.utils.industry import get_industries_bitmask
+from rezq.utils.industry import INDUSTRY_BITMASKS
+
+
+def test_get_industries_bitmask():
+    assert get_industries_bitmask('SOFT') == INDUSTRY_BITMASKS['SOFT']
+    assert get_industries_bitmask('SOFT,FIN') == (
+        INDUSTRY_BITMASKS['SOFT'] | INDUSTRY_BITMASKS['FIN']
+    )
+    assert get_industries_bitmask('FIN') != get_industries_bitmask('FINT')
+    assert get_industries_bitmask('') == 0
+    assert get_industries_bitmask('NOPE') == 0
+
+
+@pytest.mark.django_db
+def test_industries_bitmask_synced_on_save():
+    user = User.objects.create_user(
+        email='user@rezq.io', industries='SOFT,DATA',
+    )
+    resume = Resume.objects.create(
+        uploader=user, name='resume', industries='FINT',
+    )
+    critiquer_request = CritiquerRequest.objects.create(
+        critiquer=user, industries='FIN',
+    )
+
+    assert user.industries_bitmask == get_industries_bitmask('SOFT,DATA')
+    assert resume.industries_bitmask == get_industries_bitmask('FINT')
+    assert critiquer_request.industries_bitmask == (
+        get_industries_bitmask('FIN')
+    )
+
+    resume.industries = 'FIN,FINT'
+    resume.save()
+    resume.refresh_from_db()
+
+    assert resume.industries_bitmask == get_industries_bitmask('FIN,FINT')
+
+
+@pytest.mark.django_db
+def test_set_industries_bitmasks():
+    user = User.objects.create_user(email='user@rezq.io', industries='SOFT')
+    resume = Resume.objects.create(
+        uploader=user, name='resume', industries='FINT,SOFT',
+    )
+    # Like loaddata
+    Resume.objects.update(industries_bitmask=0)
+    User.objects.update(industries_bitmask=0)
+
+    call_command('set_industries_bitmasks')
+
+    assert User.objects.get(id=user.id).industries_bitmask == (
+        get_industries_bitmask('SOFT')
+    )
+    assert Resume.objects.get(id=resume.id).industries_bitmask == (
+        get_industries_bitmask('FINT,SOFT')
+    )
@@ -0,0 +1,117 @@
+from datetime import timedelta
+from smtplib import SMTPServerDisconnected
+from unittest import mock
+
+import pytest
+from django.core import mail
+from django.core.mail import get_connection
+from django.core.management import call_command
+from django.utils import timezone
+from rezq.models import MatchedCritique
+from rezq.models import OutboxEmail
+from rezq.models import Resume
+from rezq.models import User
+from rezq.utils.mailer import MAX_SEND_ATTEMPTS
+from rezq.utils.mailer import RETRY_BACKOFF_SECONDS
+from rezq.utils.mailer import send_critiquer_matched_notif_mails
+from rezq.utils.mailer import send_outbox
+from rezq.utils.mailer import send_outbox_event
+from rezq.utils.mailer import send_password_reset_mail
+
+
+@pytest.mark.django_db
+def test_send_mail_enqueues():
+    send_password_reset_mail('user@rezq.io', 'https://rezq.io/reset')
+    send_critiquer_matched_notif_mails([
+        ('a@rezq.io', 'https://rezq.io/unsubscribe'),
+        ('b@rezq.io', 'https://rezq.io/unsubscribe'),
+    ])
+
+    assert sorted(
+        OutboxEmail.objects.values_list('to_address', flat=True),
+    ) == ['a@rezq.io', 'b@rezq.io', 'user@rezq.io']
+    assert not mail.outbox
+
+
+@pytest.mark.django_db
+def test_send_mail_rolled_back_with_save():
+    critiquer = User.objects.create_user(email='critiquer@rezq.io')
+    resume = Resume.objects.create(
+        uploader=User.objects.create_user(email='uploader@rezq.io'),
+        name='resume',
+    )
+    matched_critique = MatchedCritique.objects.create(resume=resume)
+    matched_critique.critiquer = critiquer
+
+    with mock.patch(
+        'django.db.models.Model.save', side_effect=RuntimeError,
+    ), pytest.raises(RuntimeError):
+        matched_critique.save()
+
+    assert not OutboxEmail.objects.exists()
+
+
+@pytest.mark.django_db
+def test_send_outbox():
+    send_critiquer_matched_notif_mails([
+        (f'user{i}@rezq.io', 'https://rezq.io/unsubscribe') for i in range(5)
+    ])
+
+    with get_connection() as connection, mock.patch.object(
+        connection, 'send_messages', wraps=connection.send_messages,
+    ) as mock_send_messages:
+        assert send_outbox(connection, batch_size=2) == 5
+
+    assert mock_send_messages.call_count == 5
+    assert sorted(message.to[0] for message in mail.outbox) == [
+        f'user{i}@rezq.io' for i in range(5)
+    ]
+    assert mail.outbox[0].alternatives[0][1] == 'text/html'
+    assert not OutboxEmail.objects.exists()
+
+
+@pytest.mark.django_db
+def test_send_outbox_retries_with_backoff():
+    send_password_reset_mail('user@rezq.io', 'https://rezq.io/reset')
+
+    connection = get_connection()
+    with mock.patch.object(
+        connection, 'send_messages', side_effect=SMTPServerDisconnected,
+    ):
+        for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+            before = timezone.now()
+            assert send_outbox(connection) == 1
+
+            outbox_email = OutboxEmail.objects.get()
+            assert outbox_email.attempts == attempt
+            assert outbox_email.send_after >= before + timedelta(
+                seconds=RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1),
+            )
+            assert 'SMTPServerDisconnected' in outbox_email.last_error
+
+            # Not due yet
+            assert send_outbox(connection) == 0
+            OutboxEmail.objects.update(send_after=timezone.now())
+
+    # Given up on
+    assert send_outbox(connection) == 0
+    assert not mail.outbox
+
+
+@pytest.mark.django_db
+def test_send_outbox_command():
+    send_password_reset_mail('user@rezq.io', 'https://rezq.io/reset')
+
+    call_command('send_outbox')
+
+    assert [message.to for message in mail.outbox] == [['user@rezq.io']]
+    assert not OutboxEmail.objects.exists()
+
+
+@pytest.mark.django_db
+def test_send_outbox_event():
+    send_password_reset_mail('user@rezq.io', 'https://rezq.io/reset')
+
+    assert send_outbox_event({}, None) == 1
+
+    assert [message.to for message in mail.outbox] == [['user@rezq.io']]
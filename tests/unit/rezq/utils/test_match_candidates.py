@@ -0,0 +1,56 @@
+import pytest
+from rezq.models import CritiquerRequest
+from rezq.models import MatchedCritique
+from rezq.models import Resume
+from rezq.models import User
+from rezq.utils.match_candidates import load_match_candidates
+
+
+def _create_candidates(n):
+    for i in range(n):
+        uploader = User.objects.create_user(
+            email=f'uploader{i}@rezq.io',
+            waterloo_id=f'uploader{i}' if i % 2 else None,
+        )
+        resume = Resume.objects.create(
+            uploader=uploader, name=f'resume{i}', industries='SOFT,DATA',
+        )
+        MatchedCritique.objects.create(resume=resume)
+
+        critiquer = User.objects.create_user(email=f'critiquer{i}@rezq.io')
+        CritiquerRequest.objects.create(critiquer=critiquer, industries='FIN')
+
+
+@pytest.mark.django_db
+def test_load_match_candidates():
+    _create_candidates(2)
+
+    matched_critiques, critiquer_requests = load_match_candidates(
+        MatchedCritique.objects.order_by('created_on'),
+        CritiquerRequest.objects.order_by('created_on'),
+    )
+
+    assert [mc.user_id for mc in matched_critiques] == [
+        User.objects.get(email=f'uploader{i}@rezq.io').id for i in range(2)
+    ]
+    assert [mc.is_waterloo for mc in matched_critiques] == [False, True]
+    assert {mc.industries for mc in matched_critiques} == {'SOFT,DATA'}
+
+    assert [cr.user_id for cr in critiquer_requests] == [
+        User.objects.get(email=f'critiquer{i}@rezq.io').id for i in range(2)
+    ]
+    assert {cr.industries for cr in critiquer_requests} == {'FIN'}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('n', [1, 10, 50])
+def test_load_match_candidates_query_count(django_assert_num_queries, n):
+    _create_candidates(n)
+
+    with django_assert_num_queries(2):
+        matched_critiques, critiquer_requests = load_match_candidates(
+            MatchedCritique.objects.filter(critiquer=None, submitted=False),
+            CritiquerRequest.objects.all(),
+        )
+
+    assert len(matched_critiques) == len(critiquer_requests) == n
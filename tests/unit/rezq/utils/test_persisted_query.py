@@ -0,0 +1,96 @@
+import hashlib
+import json
+
+import pytest
+from django.core.cache import cache
+from django.test import RequestFactory
+from rezq.utils.persisted_query import get_persisted_query_hash
+from rezq.utils.persisted_query import MAX_PERSISTED_QUERY_SIZE
+from rezq.utils.persisted_query import PersistedQuery
+from rezq.utils.persisted_query import PersistedQueryNotFound
+from rezq.utils.persisted_query import register_persisted_query
+from rezq.utils.persisted_query import resolve_persisted_query
+from rezq.utils.request import get_gql_operation
+
+
+MUTATION = (
+    'mutation VotePooledCritique { votePooledCritique(id: "a") { result } }'
+)
+MUTATION_HASH = hashlib.sha256(MUTATION.encode()).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+def _extensions(sha256_hash):
+    return {'persistedQuery': {'version': 1, 'sha256Hash': sha256_hash}}
+
+
+def test_get_persisted_query_hash():
+    assert get_persisted_query_hash(_extensions('a')) == 'a'
+    assert get_persisted_query_hash(json.dumps(_extensions('a'))) == 'a'
+    assert get_persisted_query_hash({}) is None
+    assert get_persisted_query_hash(None) is None
+    assert get_persisted_query_hash('not json') is None
+
+
+def test_register_persisted_query():
+    assert register_persisted_query(MUTATION_HASH, MUTATION) == (
+        PersistedQuery(
+            query=MUTATION,
+            operation_name='VotePooledCritique',
+            is_mutation=True,
+        )
+    )
+
+    with pytest.raises(ValueError):
+        register_persisted_query('a', MUTATION)
+
+    with pytest.raises(ValueError):
+        register_persisted_query(hashlib.sha256(b'{').hexdigest(), '{')
+
+
+def test_register_persisted_query_too_large():
+    query = '{ serverTime }'.ljust(MAX_PERSISTED_QUERY_SIZE + 1)
+
+    with pytest.raises(ValueError):
+        register_persisted_query(
+            hashlib.sha256(query.encode()).hexdigest(), query,
+        )
+
+
+def test_register_persisted_query_many_operations():
+    query = 'query A { serverTime } mutation B { serverTime }'
+
+    with pytest.raises(ValueError):
+        register_persisted_query(
+            hashlib.sha256(query.encode()).hexdigest(), query,
+        )
+
+
+def test_resolve_persisted_query():
+    assert resolve_persisted_query(None, MUTATION) is None
+
+    with pytest.raises(PersistedQueryNotFound):
+        resolve_persisted_query(_extensions(MUTATION_HASH), None)
+
+    persisted_query = resolve_persisted_query(
+        _extensions(MUTATION_HASH), MUTATION,
+    )
+    assert resolve_persisted_query(
+        _extensions(MUTATION_HASH), None,
+    ) == persisted_query
+
+
+def test_get_gql_operation_persisted_query():
+    register_persisted_query(MUTATION_HASH, MUTATION)
+
+    # Client's operationName isn't trusted for persisted queries
+    request = RequestFactory().post('/', json.dumps({
+        'extensions': _extensions(MUTATION_HASH),
+        'operationName': 'serverTime',
+    }), content_type='application/json')
+
+    assert get_gql_operation(request) == ('VotePooledCritique', True)
@@ -0,0 +1,60 @@
+import pytest
+from rezq.models import MatchedCritique
+from rezq.models import Resume
+from rezq.models import User
+from rezq.utils.query_counter import count_queries
+from rezq.utils.query_counter import get_sql_shape
+from testing.query_budget import query_budget
+
+
+def test_get_sql_shape():
+    assert get_sql_shape('SELECT 1 FROM t WHERE id IN (%s, %s, %s)') == (
+        get_sql_shape('SELECT 1 FROM t WHERE id IN (%s)')
+    )
+    assert get_sql_shape('SELECT 1 FROM t WHERE id = %s') == (
+        'SELECT 1 FROM t WHERE id = %s'
+    )
+
+
+def _create_users(n):
+    return [
+        User.objects.create_user(email=f'user{i}@rezq.io') for i in range(n)
+    ]
+
+
+@pytest.mark.django_db
+def test_count_queries():
+    users = _create_users(10)
+
+    with count_queries() as queries:
+        for user in users:
+            User.objects.get(id=user.id)
+        list(User.objects.filter(id__in=[user.id for user in users]))
+
+    assert queries.count == 11
+    assert list(queries.get_repeated_queries().values()) == [10]
+    assert queries.get_repeated_queries(threshold=10) == {}
+
+
+@pytest.mark.django_db
+def test_query_budget():
+    users = _create_users(10)
+
+    with pytest.raises(AssertionError, match='N\\+1 queries'):
+        with query_budget(20):
+            for user in users:
+                User.objects.get(id=user.id)
+
+    with pytest.raises(AssertionError, match='over the budget of 0'):
+        with query_budget(0):
+            User.objects.count()
+
+
+@pytest.mark.django_db
+def test_matched_critiques_load_without_critiquers():
+    for user in _create_users(10):
+        resume = Resume.objects.create(uploader=user, name='resume')
+        MatchedCritique.objects.create(resume=resume, critiquer=user)
+
+    with query_budget(1):
+        assert len(list(MatchedCritique.objects.all())) == 10